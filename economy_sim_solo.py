@@ -1,11 +1,15 @@
 # econ_sim.py
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 import random
 import json
 import signal
 import sys
 import os
+import heapq
+import bisect
+import functools
+import re
 
 
 # -------------------------------------------------------------------
@@ -35,6 +39,12 @@ PRODUCT_CATEGORIES = {
     "Luxury": 1,
 }
 
+# Category names as listed in the category menus: alphabetically, most important first,
+# and most important first with ties by name (pricing menu)
+CATEGORIES_ALPHABETICAL = tuple(sorted(PRODUCT_CATEGORIES))
+CATEGORIES_BY_IMPORTANCE = tuple(sorted(PRODUCT_CATEGORIES, key=PRODUCT_CATEGORIES.__getitem__, reverse=True))
+CATEGORIES_BY_IMPORTANCE_AND_NAME = tuple(sorted(PRODUCT_CATEGORIES, key=lambda c: (-PRODUCT_CATEGORIES[c], c)))
+
 # Specialty Score Configuration
 # Rewards players for stocking a certain number of items from each category
 # Format: category -> [(threshold, multiplier), ...] sorted by threshold ascending
@@ -65,6 +75,34 @@ SPECIALTY_SCORE_THRESHOLDS = {
     "Luxury": [(5, 1.5), (10, 2.0), (15, 2.5), (18, 3.0)],
 }
 
+
+def _cumulative_specialty_bonuses(tiers: List[Tuple[int, float]]) -> Tuple[List[int], List[float]]:
+    """Split (threshold, multiplier) tiers into ascending thresholds and the running bonus total at each."""
+    thresholds = []
+    cumulative_bonuses = []
+    total_bonus = 0.0
+    for threshold, multiplier in sorted(tiers):
+        total_bonus += multiplier - 1.0
+        thresholds.append(threshold)
+        cumulative_bonuses.append(total_bonus)
+    return thresholds, cumulative_bonuses
+
+
+# Specialty thresholds per category with the total bonus earned once each is reached,
+# so a category's bonus is a single bisect instead of a scan over every tier
+SPECIALTY_SCORE_CUMULATIVE = {
+    category: _cumulative_specialty_bonuses(tiers)
+    for category, tiers in SPECIALTY_SCORE_THRESHOLDS.items()
+}
+
+# Fulfillment Multiplier Configuration
+# CAS multiplier by average fulfillment %: below 10% -> 0.1x, 10%+ -> 0.5x, 20%+ -> 0.9x,
+# 50%+ -> 1.0x, above 70% -> 1.1x, 90%+ -> 1.4x, 100%+ -> 2.0x
+# Thresholds are (pct, 0) for "at least pct" and (pct, 1) for "more than pct", so
+# bisecting with (fulfillment_pct, 0) only passes the 70% tier once fulfillment exceeds 70
+FULFILLMENT_MULTIPLIER_THRESHOLDS = [(10, 0), (20, 0), (50, 0), (70, 1), (90, 0), (100, 0)]
+FULFILLMENT_MULTIPLIERS = [0.1, 0.5, 0.9, 1.0, 1.1, 1.4, 2.0]
+
 # Category Adjacency Mappings
 # Defines which categories are "adjacent" (make sense to be sold together in the same store)
 # Example: Electronics and Gaming are adjacent, but Electronics and Fresh Produce are not
@@ -570,6 +608,9 @@ PRODUCT_CATALOG = [
     Item("Motor Oil", 20.0, 40.0, "Automotive", 1.5),
 ]
 
+# Catalog items by name, for resolving packages and saved items to their catalog entry
+PRODUCT_CATALOG_BY_NAME = {item.name: item for item in PRODUCT_CATALOG}
+
 
 @dataclass
 class Vendor:
@@ -588,6 +629,19 @@ class Vendor:
     required_reputation: Optional[float] = None  # Minimum reputation required to use this vendor
     required_level: Optional[int] = None  # Minimum player level required to use this vendor
     allowed_categories: Optional[List[str]] = None  # If set, only items from these categories are available
+    requirement_text: str = field(default="", init=False, repr=False, compare=False)  # Minimum purchase, volume pricing and rep/level tags shown after the name in vendor lists (built in __post_init__)
+
+    def __post_init__(self):
+        """Build the vendor list tags once; the requirements they describe never change after setup."""
+        min_text = f" (min: {self.min_purchase})" if self.min_purchase else ""
+        vol_text = " [volume pricing]" if self.volume_pricing_tiers else ""
+        req_parts = []
+        if self.required_reputation:
+            req_parts.append(f"rep: {self.required_reputation:.0f}")
+        if self.required_level:
+            req_parts.append(f"lvl: {self.required_level}")
+        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
+        self.requirement_text = f"{min_text}{vol_text}{rep_text}"
 
     def get_price(self, item_name: str, quantity: int = 1) -> Optional[float]:
         """
@@ -698,6 +752,42 @@ class Player:
     category_sales_history: Dict[int, Dict[str, float]] = field(default_factory=dict)  # day -> category -> total_sales_value (for main category detection)
     items_stocked_today: Set[str] = field(default_factory=set)  # Track items that were stocked for the first time today (resets each day)
     daily_item_size_sold: float = 0.0  # Track total item size sold today (for restocking limit: 250 base + 500 per restocker)
+    total_stock: int = field(default=0, init=False, repr=False, compare=False)  # Total units across inventory (updated alongside every inventory change)
+    state_version: int = field(default=0, init=False, repr=False, compare=False)  # Bumped when anything feeding the CAS changes (keys cached CAS breakdowns)
+    in_stock_items: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)  # Item names with quantity > 0 (updated alongside every inventory change)
+    expiration_heap: List[Tuple[int, str]] = field(default_factory=list, init=False, repr=False, compare=False)  # Min-heap of (expiration_day, upgrade_name) for temporary upgrades
+    production_line_items: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)  # Item names with an owned production line (mirrors purchased_upgrades)
+    upgrade_effect_totals: Dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)  # effect_type -> summed effect_value across purchased_upgrades
+    buy_order_summaries: Dict[str, Tuple[int, str]] = field(default_factory=dict, init=False, repr=False, compare=False)  # item_name -> (total_quantity, "Vendor (qty), ...") for non-empty buy orders
+    inventory_size_cache: Tuple[int, float] = field(default=(-1, 0.0), init=False, repr=False, compare=False)  # (state_version, size) from the last get_inventory_size_used call
+
+    def __post_init__(self):
+        """Derive the running stock total, in-stock item set and expiration heap from the starting state."""
+        self.total_stock = sum(self.inventory.values())
+        self.in_stock_items = {item_name for item_name, qty in self.inventory.items() if qty > 0}
+        self.expiration_heap = [
+            (self.vendor_partnership_expiration.get(u.name, 0), u.name)
+            for u in self.purchased_upgrades if u.duration_days > 0
+        ]
+        heapq.heapify(self.expiration_heap)
+        self.production_line_items = {
+            u.vendor_name for u in self.purchased_upgrades if u.effect_type == "production_line"
+        }
+        self.refresh_upgrade_effect_totals()
+        self.buy_order_summaries = {}
+        for item_name in self.buy_orders:
+            self.refresh_buy_order_summary(item_name)
+
+    def refresh_upgrade_effect_totals(self) -> None:
+        """Recompute upgrade_effect_totals from purchased_upgrades."""
+        totals: Dict[str, float] = {}
+        for u in self.purchased_upgrades:
+            totals[u.effect_type] = totals.get(u.effect_type, 0) + u.effect_value
+        self.upgrade_effect_totals = totals
+
+    def get_upgrade_effect_total(self, effect_type: str) -> float:
+        """Get the summed effect_value of all purchased upgrades of a given effect type."""
+        return self.upgrade_effect_totals.get(effect_type, 0)
 
     def set_buy_order(self, item_name: str, quantity: int, vendor_name: str) -> None:
         """
@@ -708,6 +798,22 @@ class Player:
             self.buy_orders[item_name] = [(quantity, vendor_name)]
         else:
             self.buy_orders.pop(item_name, None)
+        self.refresh_buy_order_summary(item_name)
+
+    def refresh_buy_order_summary(self, item_name: str) -> None:
+        """Recompute the cached total quantity and vendor listing for an item's buy order."""
+        orders = self.buy_orders.get(item_name)
+        if orders:
+            self.buy_order_summaries[item_name] = (
+                sum(q for q, v in orders),
+                ", ".join(f"{v} ({q})" for q, v in orders)
+            )
+        else:
+            self.buy_order_summaries.pop(item_name, None)
+
+    def get_buy_order_summary(self, item_name: str) -> Tuple[int, str]:
+        """Get an item's total buy order quantity and vendor listing ("(none)" without orders)."""
+        return self.buy_order_summaries.get(item_name, (0, "(none)"))
 
     def get_buy_order(self, item_name: str) -> List[tuple]:
         """
@@ -729,6 +835,7 @@ class Player:
             if v == vendor_name:
                 # Update quantity for existing vendor
                 self.buy_orders[item_name][i] = (quantity, vendor_name)
+                self.refresh_buy_order_summary(item_name)
                 return True
 
         # Check vendor limit (max 3)
@@ -738,6 +845,7 @@ class Player:
         # Add new vendor
         if quantity > 0:
             self.buy_orders[item_name].append((quantity, vendor_name))
+            self.refresh_buy_order_summary(item_name)
 
         return True
 
@@ -751,14 +859,42 @@ class Player:
         # Clean up empty lists
         if not self.buy_orders[item_name]:
             self.buy_orders.pop(item_name, None)
+        self.refresh_buy_order_summary(item_name)
+
+    def replace_vendor_in_buy_order(self, item_name: str, old_vendor: str, new_vendor: str, quantity: int) -> bool:
+        """
+        Swap one vendor in an item's buy order for another, keeping its slot.
+        If the new vendor is already listed, the two entries merge into one.
+        Returns True if replaced successfully, False if limit reached.
+        """
+        orders = self.buy_orders.get(item_name, [])
+        replaced = False
+        new_orders = []
+        for q, v in orders:
+            if v == old_vendor or v == new_vendor:
+                if not replaced:
+                    new_orders.append((quantity, new_vendor))
+                    replaced = True
+            else:
+                new_orders.append((q, v))
+
+        if not replaced:
+            if len(new_orders) >= 3:
+                return False
+            new_orders.append((quantity, new_vendor))
+
+        self.buy_orders[item_name] = new_orders
+        self.refresh_buy_order_summary(item_name)
+        return True
 
     def clear_buy_order(self, item_name: str) -> None:
         """Clear all vendors for an item's buy order."""
         self.buy_orders.pop(item_name, None)
+        self.buy_order_summaries.pop(item_name, None)
 
     def get_total_buy_order_quantity(self, item_name: str) -> int:
         """Get total quantity across all vendors for an item."""
-        return sum(q for q, v in self.get_buy_order(item_name))
+        return self.get_buy_order_summary(item_name)[0]
 
     def get_max_inventory(self) -> int:
         """Get max inventory capacity (total items that can be stored)."""
@@ -772,12 +908,20 @@ class Player:
         return int(warehouse_capacity + worker_bonus)
 
     def get_inventory_size_used(self, items_by_name: Dict[str, 'Item']) -> float:
-        """Calculate total inventory space used based on item sizes."""
+        """
+        Calculate total inventory space used based on item sizes.
+        Every inventory change bumps state_version, so the result is reused until the next one.
+        """
+        cached_version, cached_size = self.inventory_size_cache
+        if cached_version == self.state_version:
+            return cached_size
+
         total_size = 0.0
         for item_name, quantity in self.inventory.items():
-            if item_name in items_by_name:
-                item_size = items_by_name[item_name].size
-                total_size += item_size * quantity
+            item = items_by_name.get(item_name)
+            if item:
+                total_size += item.size * quantity
+        self.inventory_size_cache = (self.state_version, total_size)
         return total_size
 
     def get_daily_item_size_limit(self) -> float:
@@ -790,26 +934,29 @@ class Player:
 
     def get_xp_multiplier(self) -> float:
         """Get XP gain multiplier from upgrades."""
-        bonus_percent = sum(u.effect_value for u in self.purchased_upgrades if u.effect_type == "xp_gain")
+        bonus_percent = self.get_upgrade_effect_total("xp_gain")
         return 1.0 + (bonus_percent / 100.0)
 
     def get_vendor_discount(self, vendor_name: str, current_day: int = 0) -> float:
         """Get discount percentage for a specific vendor, checking expiration for temporary upgrades."""
-        discount = 0
+        return self.get_vendor_discounts(current_day).get(vendor_name, 0.0)
+
+    def get_vendor_discounts(self, current_day: int = 0) -> Dict[str, float]:
+        """Get the discount for every vendor with an active upgrade in one pass over purchased upgrades."""
+        totals: Dict[str, float] = {}
         for u in self.purchased_upgrades:
-            if u.effect_type == "vendor_discount" and u.vendor_name == vendor_name:
+            if u.effect_type == "vendor_discount":
                 # Check if upgrade has expired
                 if u.duration_days > 0:  # Temporary upgrade
                     expiration_day = self.vendor_partnership_expiration.get(u.name, 0)
                     if current_day > 0 and current_day >= expiration_day:
                         continue  # Expired, skip this upgrade
-                discount += u.effect_value
-        return discount / 100.0  # Convert percentage to decimal
+                totals[u.vendor_name] = totals.get(u.vendor_name, 0) + u.effect_value
+        return {vendor_name: discount / 100.0 for vendor_name, discount in totals.items()}  # Convert percentages to decimals
 
     def has_production_line(self, item_name: str) -> bool:
         """Check if player owns a production line for a specific item."""
-        return any(u.effect_type == "production_line" and u.vendor_name == item_name
-                  for u in self.purchased_upgrades)
+        return item_name in self.production_line_items
 
     def get_production_line_price(self, item_name: str, market_price: float) -> Optional[float]:
         """Get the production line price (50% of market price) if owned."""
@@ -845,10 +992,16 @@ class Player:
 
         self.cash -= upgrade.cost
         self.purchased_upgrades.append(upgrade)
+        self.state_version += 1
+        if upgrade.effect_type == "production_line":
+            self.production_line_items.add(upgrade.vendor_name)
+        self.upgrade_effect_totals[upgrade.effect_type] = self.upgrade_effect_totals.get(upgrade.effect_type, 0) + upgrade.effect_value
 
         # Set expiration date for temporary upgrades
         if upgrade.duration_days > 0 and current_day > 0:
             self.vendor_partnership_expiration[upgrade.name] = current_day + upgrade.duration_days
+        if upgrade.duration_days > 0:
+            heapq.heappush(self.expiration_heap, (self.vendor_partnership_expiration.get(upgrade.name, 0), upgrade.name))
 
         return True
 
@@ -924,6 +1077,7 @@ class Player:
                 return False
             self.cash -= HIRING_COST
             self.marketing_agents += 1
+            self.state_version += 1
             return True
         else:
             return False
@@ -959,7 +1113,7 @@ class Player:
         marketing_agent_wage = 1000.0
 
         # Apply wage reduction upgrades (applies to all wages)
-        wage_reduction = sum(u.effect_value for u in self.purchased_upgrades if u.effect_type == "wage_reduction")
+        wage_reduction = self.get_upgrade_effect_total("wage_reduction")
 
         actual_worker_wage = max(0, warehouse_worker_wage - wage_reduction)
         actual_cashier_wage = max(0, cashier_wage - wage_reduction)
@@ -1034,15 +1188,16 @@ class Player:
         self.category_pricing[category] = percent_below_market
 
         # Update all prices for items in this category
+        multiplier = 1 - percent_below_market / 100.0
         for item_name, item in items_by_name.items():
-            if item.category == category:
-                if item_name in market_prices:
-                    new_price = market_prices[item_name] * (1 - percent_below_market / 100.0)
-                    if new_price > 0:
-                        # Track price history for consistency bonus
-                        if item_name in self.prices:
-                            self.price_history[item_name] = self.prices[item_name]
-                        self.prices[item_name] = new_price
+            if item.category == category and item_name in market_prices:
+                new_price = market_prices[item_name] * multiplier
+                if new_price > 0:
+                    # Track price history for consistency bonus
+                    if item_name in self.prices:
+                        self.price_history[item_name] = self.prices[item_name]
+                    self.prices[item_name] = new_price
+        self.state_version += 1
 
     def update_prices_from_market(self, market_prices: Dict[str, float], items_by_name: Dict[str, 'Item']) -> None:
         """
@@ -1054,14 +1209,16 @@ class Player:
             items_by_name: Dictionary mapping item names to Item objects
         """
         for category, percent_below in self.category_pricing.items():
+            multiplier = 1 - percent_below / 100.0
             for item_name, item in items_by_name.items():
                 if item.category == category and item_name in market_prices:
-                    new_price = market_prices[item_name] * (1 - percent_below / 100.0)
+                    new_price = market_prices[item_name] * multiplier
                     if new_price > 0:
                         # Track price history for consistency bonus
                         if item_name in self.prices:
                             self.price_history[item_name] = self.prices[item_name]
                         self.prices[item_name] = new_price
+        self.state_version += 1
 
     def get_category_pricing_percent(self, category: str) -> Optional[float]:
         """Get the pricing percentage for a category, or None if not set."""
@@ -1099,6 +1256,10 @@ class Player:
             self.items_stocked_today.add(item.name)
 
         self.inventory[item.name] = current_inventory + quantity
+        self.total_stock += quantity
+        self.state_version += 1
+        if self.inventory[item.name] > 0:
+            self.in_stock_items.add(item.name)
 
     def sell_to_customer(self, item_name: str, quantity: int, unit_price: float, current_day: int = 1, item_category: Optional[str] = None, item_size: float = 1.0) -> tuple:
         """
@@ -1122,6 +1283,10 @@ class Player:
 
         if units_sold > 0:
             self.inventory[item_name] -= units_sold
+            self.total_stock -= units_sold
+            self.state_version += 1
+            if self.inventory[item_name] <= 0:
+                self.in_stock_items.discard(item_name)
             revenue = units_sold * unit_price
             self.cash += revenue
 
@@ -1172,7 +1337,7 @@ class Player:
             actual_item_name = base_item_name
 
             # Find the item in the catalog to get package info
-            item_obj = next((i for i in PRODUCT_CATALOG if i.name == base_item_name), None)
+            item_obj = PRODUCT_CATALOG_BY_NAME.get(base_item_name)
             if item_obj:
                 # Determine package type based on package name prefix
                 if item_name.startswith("Case") or item_name.startswith("Carton") or item_name.startswith("Crate"):
@@ -1245,7 +1410,7 @@ class Player:
         # Check if vendor has lead time
         if vendor.lead_time > 0 and game_state is not None:
             # Calculate effective lead time with any reductions from upgrades
-            lead_time_reduction = sum(u.effect_value for u in self.purchased_upgrades if u.effect_type == "lead_time_reduction")
+            lead_time_reduction = self.get_upgrade_effect_total("lead_time_reduction")
             effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
 
             # Add to pending deliveries instead of inventory (or immediate if lead time reduced to 0)
@@ -1269,6 +1434,10 @@ class Player:
                     self.items_stocked_today.add(actual_item_name)
 
                 self.inventory[actual_item_name] = new_total_qty
+                self.total_stock += total_items
+                self.state_version += 1
+                if new_total_qty > 0:
+                    self.in_stock_items.add(actual_item_name)
         else:
             # Immediate delivery - update inventory and weighted average cost
             current_inventory = self.inventory.get(actual_item_name, 0)
@@ -1285,6 +1454,10 @@ class Player:
                 self.items_stocked_today.add(actual_item_name)
 
             self.inventory[actual_item_name] = new_total_qty
+            self.total_stock += total_items
+            self.state_version += 1
+            if new_total_qty > 0:
+                self.in_stock_items.add(actual_item_name)
 
         # Track purchase for max-per-player limits (track by package name)
         if vendor.max_per_item_per_player is not None and game_state is not None:
@@ -1612,33 +1785,55 @@ class GameState:
     item_demand: Dict[str, float] = field(default_factory=dict)  # item_name -> demand multiplier (0.1 to 2.0)
     vendor_daily_purchases: Dict[str, Dict[str, Dict[str, int]]] = field(default_factory=dict)  # player_name -> vendor_name -> item_name -> quantity_today
     competitors: List[Competitor] = field(default_factory=list)  # AI competitor stores (simulated via CAS only)
+    cas_breakdown_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)  # (player_name, day, state_version) -> CAS breakdown (cleared at end of each day)
+    vendors_by_name: Dict[str, Vendor] = field(default_factory=dict, init=False, repr=False, compare=False)  # vendor_name -> Vendor (built from vendors, which never change after setup)
+    items_by_name_cache: Dict[str, Item] = field(default_factory=dict, init=False, repr=False, compare=False)  # Backing dict for the items_by_name property
+    items_by_category_cache: Dict[str, List[Item]] = field(default_factory=dict, init=False, repr=False, compare=False)  # Backing dict for the items_by_category property
+    items_by_category_size: int = field(default=0, init=False, repr=False, compare=False)  # Item count when items_by_category_cache was built
+
+    def __post_init__(self):
+        """Index vendors by name for constant-time lookups."""
+        self.vendors_by_name = {vendor.name: vendor for vendor in self.vendors}
 
     def get_item(self, item_name: str) -> Optional[Item]:
         """
         Look up an item by its name in self.items.
         Returns the Item or None if not found.
         """
-        for item in self.items:
-            if item.name == item_name:
-                return item
-        return None
+        return self.items_by_name.get(item_name)
 
     def get_vendor(self, vendor_name: str) -> Optional[Vendor]:
         """
         Look up a vendor by name.
         Returns the Vendor or None if not found.
         """
-        for vendor in self.vendors:
-            if vendor.name == vendor_name:
-                return vendor
-        return None
+        return self.vendors_by_name.get(vendor_name)
 
     @property
     def items_by_name(self) -> Dict[str, Item]:
         """
         Returns a dictionary mapping item names to Item objects.
+        Items are only ever appended (when new products unlock), so the cached
+        dict is rebuilt only when the item count changes. Treat it as read-only.
+        """
+        if len(self.items_by_name_cache) != len(self.items):
+            self.items_by_name_cache = {item.name: item for item in self.items}
+        return self.items_by_name_cache
+
+    @property
+    def items_by_category(self) -> Dict[str, List[Item]]:
+        """
+        Returns a dictionary mapping each category to its items, in self.items order.
+        Rebuilt only when the item count changes, like items_by_name. Treat it as read-only;
+        use .get(category, []) for categories without items.
         """
-        return {item.name: item for item in self.items}
+        if self.items_by_category_size != len(self.items):
+            items_by_category: Dict[str, List[Item]] = {}
+            for item in self.items:
+                items_by_category.setdefault(item.category, []).append(item)
+            self.items_by_category_cache = items_by_category
+            self.items_by_category_size = len(self.items)
+        return self.items_by_category_cache
 
 
 # -------------------------------------------------------------------
@@ -1759,7 +1954,8 @@ def calculate_competitor_cas(
     market_prices: Dict[str, float],
     items_by_name: Dict[str, Item],
     all_available_items: List[Item],
-    current_day: int
+    current_day: int,
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
 ) -> float:
     """
     Calculate CAS for a competitor using the same logic as player CAS.
@@ -1768,8 +1964,7 @@ def calculate_competitor_cas(
     """
     # Create a minimal Player-like object to reuse calculate_player_cas
     # We'll use the competitor's data to simulate a player's inventory/prices
-    dummy_player = Player(name=competitor.name, cash=0)
-    dummy_player.inventory = competitor.inventory.copy()
+    dummy_player = Player(name=competitor.name, cash=0, inventory=competitor.inventory.copy())
     dummy_player.prices = competitor.prices.copy()
     dummy_player.reputation = competitor.reputation
     dummy_player.average_fulfillment_pct = competitor.average_fulfillment_pct
@@ -1780,12 +1975,65 @@ def calculate_competitor_cas(
         market_prices,
         items_by_name,
         all_available_items,
-        current_day
+        current_day,
+        item_info
     )
 
     return cas
 
 
+def calculate_all_store_cas(
+    game_state: GameState,
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
+) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Calculate CAS for the player and every competitor store in one batch.
+    The (market_price, importance) map is built once and shared by all stores.
+
+    Returns (player_cas, [(competitor_name, competitor_cas), ...]) with competitors
+    in game_state.competitors order. player_cas is 0.0 when there is no player.
+    """
+    items_by_name = game_state.items_by_name
+    if item_info is None:
+        item_info = build_item_market_info(game_state.market_prices, items_by_name)
+
+    player_cas = 0.0
+    if game_state.player:
+        player_cas = calculate_player_cas(
+            game_state.player,
+            game_state.market_prices,
+            items_by_name,
+            game_state.items,
+            game_state.day,
+            item_info
+        )
+
+    return player_cas, calculate_competitor_cas_scores(game_state, item_info)
+
+
+def calculate_competitor_cas_scores(
+    game_state: GameState,
+    item_info: Dict[str, Tuple[float, int]]
+) -> List[Tuple[str, float]]:
+    """
+    Calculate CAS for every competitor store from an already built (market_price, importance) map.
+
+    Returns [(competitor_name, competitor_cas), ...] in game_state.competitors order.
+    """
+    items_by_name = game_state.items_by_name
+    return [
+        (competitor.name, calculate_competitor_cas(
+            competitor,
+            game_state.market_prices,
+            items_by_name,
+            game_state.items,
+            game_state.day,
+            item_info
+        ))
+        for competitor in game_state.competitors
+    ]
+
+
 def unlock_new_product(game_state: GameState) -> Optional[Item]:
     """
     Unlock a new product from the catalog.
@@ -2570,7 +2818,7 @@ def execute_category_recurring_buy_orders(player: Player, game_state: GameState)
                 continue
 
             # Get all items in this category
-            category_items = [item for item in game_state.items if item.category == order.category_name]
+            category_items = game_state.items_by_category.get(order.category_name, [])
 
             # Process each item in the category
             for item in category_items:
@@ -2636,6 +2884,7 @@ def execute_stock_minimum_restock(player: Player, game_state: GameState) -> Tupl
     # Get current inventory size and max capacity
     current_inventory_size = player.get_inventory_size_used(game_state.items_by_name)
     max_inventory = player.get_max_inventory()
+    lead_time_reduction = int(player.get_upgrade_effect_total("lead_time_reduction"))
 
     for item_name, (minimum_stock, vendor_name) in player.stock_minimum_restock.items():
         # Check current inventory
@@ -2647,8 +2896,7 @@ def execute_stock_minimum_restock(player: Player, game_state: GameState) -> Tupl
             continue
 
         # Calculate effective lead time with any reductions from upgrades
-        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
+        effective_lead_time = max(0, vendor.lead_time - lead_time_reduction)
 
         # Adjust minimum stock for vendors with lead time
         # If vendor has lead time, add yesterday's demand to account for expected demand during delivery period
@@ -2730,6 +2978,7 @@ def execute_category_minimum_restock(player: Player, game_state: GameState) -> T
     # Get current inventory size and max capacity
     current_inventory_size = player.get_inventory_size_used(game_state.items_by_name)
     max_inventory = player.get_max_inventory()
+    lead_time_reduction = int(player.get_upgrade_effect_total("lead_time_reduction"))
 
     for category_name, (minimum_stock, vendor_name) in player.category_minimum_restock.items():
         # Find the vendor
@@ -2738,11 +2987,10 @@ def execute_category_minimum_restock(player: Player, game_state: GameState) -> T
             continue
 
         # Calculate effective lead time with any reductions from upgrades
-        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
+        effective_lead_time = max(0, vendor.lead_time - lead_time_reduction)
 
         # Get all items in this category
-        category_items = [item for item in game_state.items if item.category == category_name]
+        category_items = game_state.items_by_category.get(category_name, [])
 
         for item in category_items:
             item_name = item.name
@@ -2812,6 +3060,10 @@ def execute_category_minimum_restock(player: Player, game_state: GameState) -> T
 # Daily simulation logic
 # -------------------------------------------------------------------
 
+# Regular (non-special) customer types, tracked in the daily customer type stats
+REGULAR_CUSTOMER_TYPES = frozenset({"low", "medium", "high"})
+
+
 def get_weighted_customer_type(day: int) -> str:
     """
     Returns a weighted random customer type based on the current day.
@@ -2878,7 +3130,22 @@ def can_special_customer_type_spawn(customer_type: str, items: List[Item]) -> bo
     return True
 
 
-def get_weighted_special_customer_type() -> str:
+# Relative selection weights for special customer types
+SPECIAL_CUSTOMER_TYPE_WEIGHTS = {
+    "hoarder": 0.30,
+    "shoplifter": 0.15,
+    "party_prep_mom": 0.30,
+    "gamer": 0.10,
+    "christmas_dad": 0.10,
+    "lottery_winner": 0.04,
+    "youtuber": 0.01
+}
+
+# Special customer types limited to one spawn per day
+SINGLE_SPAWN_SPECIAL_CUSTOMER_TYPES = frozenset({"lottery_winner", "youtuber"})
+
+
+def get_weighted_special_customer_type(exclude: Optional[Set[str]] = None) -> Optional[str]:
     """
     Returns a weighted random special customer type.
 
@@ -2894,26 +3161,21 @@ def get_weighted_special_customer_type() -> str:
     - Christmas Dad: 10
     - Lottery Winner: 4 (rare)
     - Youtuber: 1 (very rare)
-    """
-    weights = {
-        "hoarder": 0.30,
-        "shoplifter": 0.15,
-        "party_prep_mom": 0.30,
-        "gamer": 0.10,
-        "christmas_dad": 0.10,
-        "lottery_winner": 0.04,
-        "youtuber": 0.01
-    }
 
-    rand = random.random()
-    cumulative = 0.0
+    Types in ``exclude`` are removed before drawing and the remaining weights
+    are renormalized, so a single draw always yields a valid type.
+    Returns None if every type is excluded.
+    """
+    if exclude:
+        candidate_types = [t for t in SPECIAL_CUSTOMER_TYPE_WEIGHTS if t not in exclude]
+    else:
+        candidate_types = list(SPECIAL_CUSTOMER_TYPE_WEIGHTS)
 
-    for customer_type, weight in weights.items():
-        cumulative += weight
-        if rand < cumulative:
-            return customer_type
+    if not candidate_types:
+        return None
 
-    return "hoarder"  # Fallback
+    weights = [SPECIAL_CUSTOMER_TYPE_WEIGHTS[t] for t in candidate_types]
+    return random.choices(candidate_types, weights=weights, k=1)[0]
 
 
 def get_player_main_category(player: Player, current_day: int) -> Optional[str]:
@@ -2931,8 +3193,9 @@ def get_player_main_category(player: Player, current_day: int) -> Optional[str]:
     category_totals: Dict[str, float] = {}
 
     for day in range(start_day, current_day + 1):
-        if day in player.category_sales_history:
-            for category, sales in player.category_sales_history[day].items():
+        day_sales = player.category_sales_history.get(day)
+        if day_sales:
+            for category, sales in day_sales.items():
                 category_totals[category] = category_totals.get(category, 0.0) + sales
 
     if not category_totals:
@@ -2942,33 +3205,83 @@ def get_player_main_category(player: Player, current_day: int) -> Optional[str]:
     return max(category_totals.items(), key=lambda x: x[1])[0]
 
 
-def get_non_adjacent_categories(player: Player, items_by_name: Dict[str, Item], current_day: int) -> Set[str]:
+class CategoryState(NamedTuple):
+    """A player's category standing, resolved from a single main-category lookup."""
+    main_category: Optional[str]  # Category with the most sales over the last 14 days
+    non_adjacent_categories: Set[str]  # Stocked categories not adjacent to the main category
+    adjacency_multiplier: float  # CAS multiplier from non-adjacent categories
+
+
+def compute_category_state(
+    player: Player,
+    items_by_name: Dict[str, Item],
+    current_day: int,
+    check_temporary: bool = False,
+    stocked_categories: Optional[Iterable[str]] = None
+) -> CategoryState:
     """
-    Get all categories that are non-adjacent to the player's main category.
+    Resolve the player's main category once and derive the non-adjacent categories
+    and adjacency multiplier from it (see calculate_adjacency_multiplier for the penalties).
 
-    Returns a set of category names that are stocked but not adjacent to the main category.
+    stocked_categories can be passed in (e.g. the category_counts keys from
+    scan_cas_inventory) to skip another pass over the player's stock.
     """
     main_category = get_player_main_category(player, current_day)
 
     # If no main category (no sales yet), treat all stocked categories as adjacent
-    if main_category is None:
-        return set()
+    non_adjacent: Set[str] = set()
+    adjacent_categories: Set[str] = set()
+    if main_category is not None:
+        # Get all categories the player currently stocks
+        if stocked_categories is None:
+            stocked_categories = {
+                items_by_name[item_name].category
+                for item_name in player.in_stock_items if item_name in items_by_name
+            }
+
+        # Stocked categories other than the main one that aren't adjacent to it
+        adjacent_categories = CATEGORY_ADJACENCY.get(main_category, set())
+        non_adjacent = {
+            category for category in stocked_categories
+            if category != main_category and category not in adjacent_categories
+        }
+
+    multiplier = 1.0
+
+    # Calculate permanent penalty based on non-adjacent category count
+    non_adjacent_count = len(non_adjacent)
+
+    if non_adjacent_count >= 10:
+        multiplier *= 0.1
+    elif non_adjacent_count >= 7:
+        multiplier *= 0.4
+    elif non_adjacent_count >= 3:
+        multiplier *= 0.6
+    elif non_adjacent_count >= 1:
+        multiplier *= 0.9
+
+    # Check for temporary penalty (new non-adjacent items stocked today)
+    if check_temporary and player.items_stocked_today and main_category is not None:
+        # Check if any newly stocked item today is from a non-adjacent category
+        for item_name in player.items_stocked_today:
+            item = items_by_name.get(item_name)
+            if item:
+                item_category = item.category
+                if item_category != main_category and item_category not in adjacent_categories:
+                    # Found a new non-adjacent item, apply temporary 0.9x penalty
+                    multiplier *= 0.9
+                    break  # Only apply once, even if multiple new non-adjacent items
 
-    # Get all categories the player currently stocks
-    stocked_categories = set()
-    for item_name, quantity in player.inventory.items():
-        if quantity > 0 and item_name in items_by_name:
-            stocked_categories.add(items_by_name[item_name].category)
+    return CategoryState(main_category, non_adjacent, multiplier)
 
-    # Remove the main category itself
-    stocked_categories.discard(main_category)
 
-    # Get adjacent categories for the main category
-    adjacent_categories = CATEGORY_ADJACENCY.get(main_category, set())
+def get_non_adjacent_categories(player: Player, items_by_name: Dict[str, Item], current_day: int) -> Set[str]:
+    """
+    Get all categories that are non-adjacent to the player's main category.
 
-    # Return categories that are stocked but not adjacent
-    non_adjacent = stocked_categories - adjacent_categories
-    return non_adjacent
+    Returns a set of category names that are stocked but not adjacent to the main category.
+    """
+    return compute_category_state(player, items_by_name, current_day).non_adjacent_categories
 
 
 def calculate_adjacency_multiplier(
@@ -2997,37 +3310,13 @@ def calculate_adjacency_multiplier(
     Returns:
         The multiplier to apply to CAS (e.g., 0.9 for 10% penalty)
     """
-    multiplier = 1.0
-
-    # Calculate permanent penalty based on non-adjacent category count
-    non_adjacent = get_non_adjacent_categories(player, items_by_name, current_day)
-    non_adjacent_count = len(non_adjacent)
-
-    if non_adjacent_count >= 10:
-        multiplier *= 0.1
-    elif non_adjacent_count >= 7:
-        multiplier *= 0.4
-    elif non_adjacent_count >= 3:
-        multiplier *= 0.6
-    elif non_adjacent_count >= 1:
-        multiplier *= 0.9
-
-    # Check for temporary penalty (new non-adjacent items stocked today)
-    if check_temporary and player.items_stocked_today:
-        main_category = get_player_main_category(player, current_day)
-        if main_category is not None:
-            adjacent_categories = CATEGORY_ADJACENCY.get(main_category, set())
+    return compute_category_state(player, items_by_name, current_day, check_temporary).adjacency_multiplier
 
-            # Check if any newly stocked item today is from a non-adjacent category
-            for item_name in player.items_stocked_today:
-                if item_name in items_by_name:
-                    item_category = items_by_name[item_name].category
-                    if item_category != main_category and item_category not in adjacent_categories:
-                        # Found a new non-adjacent item, apply temporary 0.9x penalty
-                        multiplier *= 0.9
-                        break  # Only apply once, even if multiple new non-adjacent items
 
-    return multiplier
+def get_fulfillment_multiplier(fulfillment_pct: float) -> float:
+    """Look up the CAS fulfillment multiplier for an average fulfillment % (see FULFILLMENT_MULTIPLIER_THRESHOLDS)."""
+    tier = bisect.bisect_right(FULFILLMENT_MULTIPLIER_THRESHOLDS, (fulfillment_pct, 0))
+    return FULFILLMENT_MULTIPLIERS[tier]
 
 
 def calculate_player_cas(
@@ -3035,7 +3324,8 @@ def calculate_player_cas(
     market_prices: Dict[str, float],
     items_by_name: Dict[str, Item],
     all_available_items: List[Item],
-    current_day: int = 1
+    current_day: int = 1,
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
 ) -> float:
     """
     Calculate Customer Attraction Score (CAS) for a player based on their overall store.
@@ -3048,82 +3338,48 @@ def calculate_player_cas(
     - specialty_multiplier based on category item counts (additive bonuses)
     - fulfillment_multiplier based on average fulfillment %
     - adjacency_multiplier based on non-adjacent categories (0.1x to 1.0x)
-    - CAS = (discount_score + item_stability) * reputation_multiplier * specialty_multiplier * fulfillment_multiplier * adjacency_multiplier
+    - marketing_effect boosts both the discount and stability components, so it counts twice
+    - CAS = (discount_score + item_stability + 2 * marketing_effect) * reputation_multiplier * specialty_multiplier * fulfillment_multiplier * adjacency_multiplier
 
     Returns 0 if player has no stock or no acceptable prices.
+    Pass a prebuilt item_info (see build_item_market_info) to share it across calls in one tick.
     """
-    discount_score = 0.0
-    has_any_stock = False
-    max_acceptable_price_multiplier = 1.15
-    total_catalog_items = len(all_available_items)
-
-    # Calculate discount score for all stocked items
-    for item_name, quantity in player.inventory.items():
-        if quantity <= 0 or item_name not in player.prices:
-            continue
-
-        market_price = market_prices.get(item_name, 0)
-        if market_price <= 0:
-            continue
-
-        player_price = player.prices[item_name]
-        max_acceptable_price = market_price * max_acceptable_price_multiplier
+    if item_info is None:
+        item_info = build_item_market_info(market_prices, items_by_name)
 
-        # Only consider if price is acceptable
-        if player_price <= max_acceptable_price:
-            has_any_stock = True
+    # Discount score, item stability, specialty counts and marketing price in one inventory pass
+    scores = scan_cas_inventory(player, items_by_name, item_info)
 
-            # Calculate discount percentage
-            if player_price < market_price:
-                discount_pct = ((market_price - player_price) / market_price) * 100
-            else:
-                discount_pct = 0
-
-            # Get item importance
-            item = items_by_name.get(item_name)
-            importance = item.importance if item else 2
-
-            # Add weighted discount to score
-            discount_score += discount_pct * importance
-
-    # Return 0 if no stock
-    if not has_any_stock:
+    # Return 0 if no stock at an acceptable price
+    if not scores.has_acceptable_stock:
         return 0.0
 
+    # Discount score only counts items customers would accept
+    discount_score = scores.acceptable_discount_score
+
     # Calculate specialty score (category-based bonuses for item variety)
-    specialty_multiplier_effective, _, _ = calculate_specialty_score(player, items_by_name)
+    specialty_multiplier_effective, _ = specialty_score_from_counts(scores.category_counts)
 
     # Calculate fulfillment multiplier
     fulfillment_pct = player.average_fulfillment_pct
-    if fulfillment_pct >= 100:
-        fulfillment_multiplier = 2.0
-    elif fulfillment_pct >= 90:
-        fulfillment_multiplier = 1.4
-    elif fulfillment_pct > 70:
-        fulfillment_multiplier = 1.1
-    elif fulfillment_pct >= 50:
-        fulfillment_multiplier = 1.0
-    elif fulfillment_pct >= 20:
-        fulfillment_multiplier = 0.9
-    elif fulfillment_pct >= 10:
-        fulfillment_multiplier = 0.5
-    else:
-        fulfillment_multiplier = 0.1
+    fulfillment_multiplier = get_fulfillment_multiplier(fulfillment_pct)
 
     # Calculate reputation multiplier
     reputation_multiplier = 10 ** (player.reputation / 100)
 
-    # Calculate item stability
-    item_stability = calculate_item_stability(player, market_prices, items_by_name)
+    # Item stability from the inventory pass
+    item_stability = scores.item_stability
 
     # Calculate marketing effect (adds to both discount and stability)
-    marketing_effect = calculate_marketing_effect(player, market_prices)
+    marketing_effect = marketing_effect_for_price(player, scores.highest_market_price)
 
     # Calculate adjacency multiplier (penalty for non-adjacent categories)
-    adjacency_multiplier = calculate_adjacency_multiplier(player, items_by_name, current_day, check_temporary=True)
+    adjacency_multiplier = compute_category_state(
+        player, items_by_name, current_day, check_temporary=True, stocked_categories=scores.category_counts
+    ).adjacency_multiplier
 
     # Calculate final CAS (marketing effect boosts both components)
-    cas = (discount_score + marketing_effect + item_stability + marketing_effect) * reputation_multiplier * specialty_multiplier_effective * fulfillment_multiplier * adjacency_multiplier
+    cas = (discount_score + item_stability + 2 * marketing_effect) * reputation_multiplier * specialty_multiplier_effective * fulfillment_multiplier * adjacency_multiplier
 
     return cas
 
@@ -3135,24 +3391,19 @@ def get_category_specialty_threshold(player: Player, category: str, items_by_nam
     """
     # Count items in this category that the player has in stock
     category_count = 0
-    for item_name, qty in player.inventory.items():
-        if qty > 0:
-            item = items_by_name.get(item_name)
-            if item and item.category == category:
-                category_count += 1
+    for item_name in player.in_stock_items:
+        item = items_by_name.get(item_name)
+        if item and item.category == category:
+            category_count += 1
 
     # Get the thresholds for this category
-    thresholds = SPECIALTY_SCORE_THRESHOLDS.get(category, [])
+    thresholds, _ = SPECIALTY_SCORE_CUMULATIVE.get(category, ([], []))
     if not thresholds:
         return None
 
     # Find the highest threshold the player has reached
-    highest_threshold = None
-    for threshold, multiplier in thresholds:
-        if category_count >= threshold:
-            highest_threshold = threshold
-
-    return highest_threshold
+    reached = bisect.bisect_right(thresholds, category_count)
+    return thresholds[reached - 1] if reached else None
 
 
 def get_player_customer_capacity(player: Player) -> int:
@@ -3206,31 +3457,49 @@ def calculate_capacity_penalty(customers_allocated: int, capacity: int) -> float
     return penalty
 
 
-def update_player_fulfillment_averages(player: Player, fulfillment_data: Dict[str, List[float]]) -> None:
-    """Update a player's overall, allocated, and overflow fulfillment averages."""
-    allocated_data = fulfillment_data.get("allocated", [])
-    overflow_data = fulfillment_data.get("overflow", [])
-    combined_data = allocated_data + overflow_data
+class StoreVisit(NamedTuple):
+    """A store visit where a customer bought at least one item."""
+    store_name: str
+    visit_type: str  # "allocated" or "overflow"
+    fulfillment_pct: float  # % of basket on entry bought at this store
+
+
+# Running fulfillment totals for one visit type: [sum of fulfillment percentages, visit count]
+FulfillmentTotals = List[Union[float, int]]
+
+
+def update_player_fulfillment_averages(player: Player, fulfillment_data: Dict[str, FulfillmentTotals]) -> None:
+    """Update a player's overall, allocated, and overflow fulfillment averages.
+
+    ``fulfillment_data`` maps each visit type ("allocated", "overflow") to a running
+    ``[sum, count]`` pair: the summed fulfillment percentages of that day's visits
+    and the number of visits. It is not a list of individual samples.
+    """
+    allocated_sum, allocated_count = fulfillment_data.get("allocated", (0.0, 0))
+    overflow_sum, overflow_count = fulfillment_data.get("overflow", (0.0, 0))
+    combined_count = allocated_count + overflow_count
 
-    if combined_data:
-        player.average_fulfillment_pct = sum(combined_data) / len(combined_data)
+    if combined_count:
+        player.average_fulfillment_pct = (allocated_sum + overflow_sum) / combined_count
 
-    if allocated_data:
-        player.allocated_average_fulfillment_pct = sum(allocated_data) / len(allocated_data)
+    if allocated_count:
+        player.allocated_average_fulfillment_pct = allocated_sum / allocated_count
 
-    if overflow_data:
-        player.overflow_average_fulfillment_pct = sum(overflow_data) / len(overflow_data)
+    if overflow_count:
+        player.overflow_average_fulfillment_pct = overflow_sum / overflow_count
 
 
 def record_store_visit_metrics(
     store_visit_data: List[Dict[str, Any]],
-    daily_fulfillment_data: Dict[str, Dict[str, List[float]]],
+    daily_fulfillment_data: Dict[str, Dict[str, FulfillmentTotals]],
     fulfillment_visit_counts: Dict[str, Dict[str, int]],
     daily_reputation_changes: Dict[str, int],
     routed_no_need_counts: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> None:
     """Track fulfillment and reputation for every store visit.
 
+    ``daily_fulfillment_data`` holds a running ``[sum, count]`` pair per store and visit type.
+
     Zero-need visits are ignored for fulfillment and reputation but can be counted
     separately through ``routed_no_need_counts`` if provided.
     """
@@ -3247,12 +3516,12 @@ def record_store_visit_metrics(
 
 def record_single_store_visit(
     visit: Dict[str, Any],
-    daily_fulfillment_data: Dict[str, Dict[str, List[float]]],
+    daily_fulfillment_data: Dict[str, Dict[str, FulfillmentTotals]],
     fulfillment_visit_counts: Dict[str, Dict[str, int]],
     daily_reputation_changes: Dict[str, int],
     routed_no_need_counts: Optional[Dict[str, Dict[str, int]]] = None,
 ) -> None:
-    """Record fulfillment stats and reputation impact for a single store visit."""
+    """Record fulfillment stats and reputation impact for a single store visit (adds to its [sum, count] pair)."""
 
     store_name = visit.get("store_name")
     visit_type = visit.get("visit_type") or "allocated"
@@ -3273,8 +3542,10 @@ def record_single_store_visit(
 
     fulfillment_percentage = (visit["fulfilled"] / starting_needs) * 100
 
-    # Track fulfillment percentage for this customer visit
-    daily_fulfillment_data[store_name][visit_type].append(fulfillment_percentage)
+    # Track fulfillment percentage for this customer visit (running [sum, count])
+    fulfillment_entry = daily_fulfillment_data[store_name][visit_type]
+    fulfillment_entry[0] += fulfillment_percentage
+    fulfillment_entry[1] += 1
 
     if visit_type == "overflow":
         fulfillment_visit_counts[store_name]["overflow"] += 1
@@ -3326,11 +3597,17 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     8. Advance the day counter
     9. Apply daily price fluctuations for next day (at END of day)
 
+    When show_details is set, the day's report is collected in memory and
+    written to stdout in a single call once the simulation step is complete.
+
     Returns dictionary of daily sales.
     """
 
+    # Detailed output lines, written once at the end of the day
+    log_lines: List[str] = []
+
     if show_details:
-        print(f"\n=== Day {game_state.day} ===")
+        log_lines.append(f"\n=== Day {game_state.day} ===")
 
     # Step 1: Reset any event price changes from previous day
     if game_state.event_price_changes:
@@ -3355,7 +3632,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
             old_price2 = game_state.market_prices[selected_items[1].name]
             game_state.event_price_changes[selected_items[1].name] = old_price2
             game_state.market_prices[selected_items[1].name] = old_price2 * 1.5
-            print(f"\n🎉 SPECIAL EVENT! {selected_items[0].name} -50%, {selected_items[1].name} +50% today only!")
+            log_lines.append(f"\n🎉 SPECIAL EVENT! {selected_items[0].name} -50%, {selected_items[1].name} +50% today only!")
 
     # Calculate base customer count: 300 base + 20 per day
     base_customer_count = 300 + (game_state.day * 20)
@@ -3371,7 +3648,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
         # Show event message only on the actual milestone days
         if game_state.day % 14 == 0 and show_details:
             current_milestone_bonus = fourteen_day_periods * 100
-            print(f"🎊 14-DAY EVENT! +{current_milestone_bonus} permanent customers! (Total permanent bonus: +{permanent_bonus})")
+            log_lines.append(f"🎊 14-DAY EVENT! +{current_milestone_bonus} permanent customers! (Total permanent bonus: +{permanent_bonus})")
 
     # Calculate uncapped customers (starts at day 50, +1 every 10 days)
     uncapped_customer_count = 0
@@ -3379,9 +3656,9 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
         uncapped_customer_count = ((game_state.day - 40) // 10)
 
     if show_details:
-        print(f"Regular customers today: {base_customer_count}")
+        log_lines.append(f"Regular customers today: {base_customer_count}")
         if uncapped_customer_count > 0:
-            print(f"💎 Uncapped customers today: {uncapped_customer_count} (looking for expensive items ≥$100)")
+            log_lines.append(f"💎 Uncapped customers today: {uncapped_customer_count} (looking for expensive items ≥$100)")
 
     # Initialize list of all stores (player + competitors) for dictionary tracking
     all_stores = [game_state.player.name] if game_state.player else []
@@ -3389,7 +3666,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
     # Step 4: Execute buy orders for ALL players
     if show_details:
-        print("\nExecuting buy orders...")
+        log_lines.append("\nExecuting buy orders...")
 
     # Track daily spending per store for accurate profit calculation
     daily_spending = {store: 0.0 for store in all_stores}
@@ -3438,13 +3715,13 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
         daily_spending[player.name] = actual_spent
         if show_details and all_purchases:
-            print(f"  {player.name}: Purchased {sum(all_purchases.values())} items (bought: {daily_inventory_used[player.name]:.1f} space)(spent ${actual_spent:.2f})")
+            log_lines.append(f"  {player.name}: Purchased {sum(all_purchases.values())} items (bought: {daily_inventory_used[player.name]:.1f} space)(spent ${actual_spent:.2f})")
             if recurring_purchases:
-                print(f"    - Recurring orders: {sum(recurring_purchases.values())} items")
+                log_lines.append(f"    - Recurring orders: {sum(recurring_purchases.values())} items")
             if restock_purchases:
-                print(f"    - Auto-restock: {sum(restock_purchases.values())} items")
+                log_lines.append(f"    - Auto-restock: {sum(restock_purchases.values())} items")
             if category_restock_purchases:
-                print(f"    - Category auto-restock: {sum(category_restock_purchases.values())} items")
+                log_lines.append(f"    - Category auto-restock: {sum(category_restock_purchases.values())} items")
 
     # Track daily statistics
     daily_sales = {store: 0.0 for store in all_stores}
@@ -3460,9 +3737,9 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     # Track reputation changes (to be applied at end of day with limits)
     daily_reputation_changes = {store: 0 for store in all_stores}
 
-    # Track fulfillment percentages per store (to calculate average at end of day)
+    # Track fulfillment percentages per store as running [sum, count] pairs (averaged at end of day)
     daily_fulfillment_data = {
-        store: {"allocated": [], "overflow": []}
+        store: {"allocated": [0.0, 0], "overflow": [0.0, 0]}
         for store in all_stores
     }
     fulfillment_visit_counts = {store: {"allocated": 0, "overflow": 0} for store in all_stores}
@@ -3502,7 +3779,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
         customer_type = get_weighted_customer_type(game_state.day)
         customer = Customer(name=f"Customer_{i+1}", customer_type=customer_type, day=game_state.day)
         # Roll specializations for regular customers (low, medium, high)
-        if customer_type in ["low", "medium", "high"]:
+        if customer_type in REGULAR_CUSTOMER_TYPES:
             customer.roll_specializations(game_state.items, game_state.item_demand)
         all_customers.append(customer)
 
@@ -3511,7 +3788,9 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     daily_demand_per_item = {}  # item_name -> total quantity wanted
 
     # Build items dictionary for quick lookup (needed for CAS calculation)
-    items_by_name = {item.name: item for item in game_state.items}
+    items_by_name = game_state.items_by_name
+    # Market price and importance per item, shared by every CAS calculation this tick
+    item_market_info = build_item_market_info(game_state.market_prices, items_by_name)
 
     # Initialize CAS breakdowns (for stats display later)
     cas_breakdowns_pre_shopping = {}
@@ -3520,26 +3799,8 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     total_customers_spawned = len(all_customers)
     player = game_state.player
     if player:
-        # Calculate base player CAS
-        base_player_cas = calculate_player_cas(
-            player,
-            game_state.market_prices,
-            items_by_name,
-            game_state.items,
-            game_state.day
-        )
-
-        # Calculate competitor CAS scores
-        competitor_cas_scores = []
-        for competitor in game_state.competitors:
-            cas = calculate_competitor_cas(
-                competitor,
-                game_state.market_prices,
-                items_by_name,
-                game_state.items,
-                game_state.day
-            )
-            competitor_cas_scores.append((competitor.name, cas))
+        # Calculate base player CAS and competitor CAS scores
+        base_player_cas, competitor_cas_scores = calculate_all_store_cas(game_state, item_market_info)
 
         total_competitor_cas = sum(cas for _, cas in competitor_cas_scores)
 
@@ -3581,7 +3842,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
         # Track customer type statistics for player's allocated customers only
         for customer in customers_for_player:
-            if customer.customer_type in customer_type_stats['spawned']:
+            if customer.customer_type in REGULAR_CUSTOMER_TYPES:
                 customer_type_stats['spawned'][customer.customer_type] += 1
 
         # Process competitor customers for spillover
@@ -3659,22 +3920,22 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
         # Track overflow customer types
         for customer in overflow_customers:
-            if customer.customer_type in customer_type_stats['spawned']:
+            if customer.customer_type in REGULAR_CUSTOMER_TYPES:
                 customer_type_stats['spawned'][customer.customer_type] += 1
 
         if show_details:
-            print(f"\n🎯 Customer Allocation:")
-            print(f"  Your Base CAS: {base_player_cas:.1f}")
+            log_lines.append(f"\n🎯 Customer Allocation:")
+            log_lines.append(f"  Your Base CAS: {base_player_cas:.1f}")
             if capacity_penalty < 1.0:
-                print(f"  ⚠️  CAPACITY PENALTY: {capacity_penalty:.2f}x (CAS reduced to {player_cas:.1f})")
+                log_lines.append(f"  ⚠️  CAPACITY PENALTY: {capacity_penalty:.2f}x (CAS reduced to {player_cas:.1f})")
             for comp_name, comp_cas in competitor_cas_scores:
-                print(f"  {comp_name} CAS: {comp_cas:.1f}")
-            print(f"  Capacity: {num_customers_for_player}/{player_capacity} customers")
-            print(f"  Your Share: {player_share * 100:.1f}% of {total_customers_spawned} customers")
-            print(f"  ✓ You get {num_customers_for_player} allocated customers")
+                log_lines.append(f"  {comp_name} CAS: {comp_cas:.1f}")
+            log_lines.append(f"  Capacity: {num_customers_for_player}/{player_capacity} customers")
+            log_lines.append(f"  Your Share: {player_share * 100:.1f}% of {total_customers_spawned} customers")
+            log_lines.append(f"  ✓ You get {num_customers_for_player} allocated customers")
             if overflow_customers:
-                print(f"  ↩️  +{len(overflow_customers)} overflow from competitors (missing categories)")
-            print(f"  ✗ Competitors keep {competitor_kept_customers} customers")
+                log_lines.append(f"  ↩️  +{len(overflow_customers)} overflow from competitors (missing categories)")
+            log_lines.append(f"  ✗ Competitors keep {competitor_kept_customers} customers")
 
         # Combine allocated and overflow customers
         assigned_customers = customers_for_player + overflow_customers
@@ -3797,8 +4058,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                                         customer_bought_anything = True
 
                                         # Mark customer as having bought something for daily stats (only once)
-                                        if (customer.customer_type in customer_type_stats['bought_something']
-                                                and not customer_stat_recorded):
+                                        if customer.customer_type in REGULAR_CUSTOMER_TYPES and not customer_stat_recorded:
                                             customer_type_stats['bought_something'][customer.customer_type] += 1
                                             customers_counted_in_stats.add(customer.name)
                                             customer_stat_recorded = True
@@ -3828,13 +4088,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                     fulfillment_pct = (items_purchased_at_store / basket_size_on_entry) * 100
 
                     # Record the visit
-                    store_visits.append({
-                        'store_name': current_supplier.name,
-                        'visit_type': visit_type,
-                        'basket_on_entry': basket_size_on_entry,
-                        'items_purchased': items_purchased_at_store,
-                        'fulfillment_pct': fulfillment_pct,
-                    })
+                    store_visits.append(StoreVisit(current_supplier.name, visit_type, fulfillment_pct))
 
                     # Track that customer made purchase at this store
                     if current_supplier.name not in stores_purchased_from:
@@ -3869,13 +4123,11 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
             # Now record all visits and update counters
             customer_visited_only_one_store = len(store_visits) == 1
 
-            for visit in store_visits:
-                store_name = visit['store_name']
-                visit_type = visit['visit_type']
-                fulfillment_pct = visit['fulfillment_pct']
-
+            for store_name, visit_type, fulfillment_pct in store_visits:
                 # Record fulfillment data
-                daily_fulfillment_data[store_name][visit_type].append(fulfillment_pct)
+                fulfillment_entry = daily_fulfillment_data[store_name][visit_type]
+                fulfillment_entry[0] += fulfillment_pct
+                fulfillment_entry[1] += 1
                 fulfillment_visit_counts[store_name][visit_type] += 1
 
                 # Update reputation based on fulfillment
@@ -3896,8 +4148,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                     overflow_customers_served[store_name] += 1
 
             # Track customer type statistics for customers who never bought anything
-            if (customer.customer_type in customer_type_stats['bought_something']
-                    and not customer_stat_recorded):
+            if customer.customer_type in REGULAR_CUSTOMER_TYPES and not customer_stat_recorded:
                 if customer_bought_anything:
                     customer_type_stats['bought_something'][customer.customer_type] += 1
                 elif had_needs:
@@ -3952,52 +4203,34 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     special_customer_count = get_special_customer_count(game_state.day)
     if special_customer_count > 0:
         special_customers = []
-        lottery_winner_spawned = False
-        youtuber_spawned = False
-
-        for i in range(special_customer_count):
-            # Get weighted special customer type, with validation for item requirements
-            max_attempts = 20  # Prevent infinite loop
-            special_type = None
 
-            for _ in range(max_attempts):
-                candidate_type = get_weighted_special_customer_type()
+        # Item requirements only change when products unlock (end of day), so check each type once
+        spawn_eligibility = {
+            t: can_special_customer_type_spawn(t, game_state.items)
+            for t in SPECIAL_CUSTOMER_TYPE_WEIGHTS
+        }
 
-                # Check if this customer type can spawn (has required items)
-                if not can_special_customer_type_spawn(candidate_type, game_state.items):
-                    continue  # Try again with different type
+        # Types that can't spawn today (missing required items, already-spawned singletons)
+        excluded_special_types: Set[str] = {t for t, eligible in spawn_eligibility.items() if not eligible}
 
-                # Enforce max 1 lottery winner and 1 youtuber per day
-                if candidate_type == "lottery_winner":
-                    if lottery_winner_spawned:
-                        continue  # Try again
-                    else:
-                        lottery_winner_spawned = True
-                        special_type = candidate_type
-                        break
-                elif candidate_type == "youtuber":
-                    if youtuber_spawned:
-                        continue  # Try again
-                    else:
-                        youtuber_spawned = True
-                        special_type = candidate_type
-                        break
-                else:
-                    # Valid type that can spawn
-                    special_type = candidate_type
-                    break
+        for i in range(special_customer_count):
+            special_type = get_weighted_special_customer_type(excluded_special_types)
 
-            # If we couldn't find a valid type after max_attempts, skip this spawn
+            # No valid type left, skip this spawn
             if special_type is None:
                 continue
 
+            # Enforce max 1 lottery winner and 1 youtuber per day
+            if special_type in SINGLE_SPAWN_SPECIAL_CUSTOMER_TYPES:
+                excluded_special_types.add(special_type)
+
             customer = Customer(name=f"Special_{i+1}", customer_type=special_type, day=game_state.day)
             special_customers.append(customer)
 
         # Process each special customer
         for customer in special_customers:
             # Build items dictionary for quick lookup
-            items_by_name = {item.name: item for item in game_state.items}
+            items_by_name = game_state.items_by_name
 
             # Format customer type for display
             customer_type_display = customer.customer_type.replace("_", " ").title()
@@ -4025,6 +4258,10 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                             # Steal 1 unit
                             if target.inventory[item_name] > 0:
                                 target.inventory[item_name] -= 1
+                                target.total_stock -= 1
+                                target.state_version += 1
+                                if target.inventory[item_name] <= 0:
+                                    target.in_stock_items.discard(item_name)
                                 stolen_items.append(item_name)
 
                         if stolen_items:
@@ -4145,14 +4382,14 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
         total_warehouse_workers = sum(warehouse.workers for warehouse in player.warehouses)
         total_employees = total_warehouse_workers + player.marketing_agents
         if show_details and wages > 0:
-            print(f"  {player.name}: ${wages:.2f} MONTHLY WAGE ({total_warehouse_workers} warehouse workers, {player.marketing_agents} marketing agents)")
+            log_lines.append(f"  {player.name}: ${wages:.2f} MONTHLY WAGE ({total_warehouse_workers} warehouse workers, {player.marketing_agents} marketing agents)")
         elif show_details and total_employees > 0:
             days_until_payment = 30 - (game_state.day - player.last_wage_payment_day)
-            print(f"  {player.name}: No payment today ({days_until_payment} days until next wage)")
+            log_lines.append(f"  {player.name}: No payment today ({days_until_payment} days until next wage)")
 
     # Step 7: Print daily summary
     if show_details:
-        print(f"\nDaily Results:")
+        log_lines.append(f"\nDaily Results:")
         player = game_state.player
         if player:
             sales = daily_sales[player.name]
@@ -4173,7 +4410,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
             # Main stats line
             uncapped_text = f", 💎{uncapped_served}" if uncapped_customer_count > 0 and uncapped_served > 0 else ""
             level_up_text = f" 🎉LVL{level_ups[player.name]}!" if player.name in level_ups else ""
-            print(f"  {player.name}: Sales ${sales:.2f}, Profit ${profit:.2f}, Lvl {player.store_level} ({player.experience:.0f}/{xp_needed:.0f}XP){level_up_text}, Cust {served} (A:{allocated_served}/{allocated_assigned}, O:{overflow_served}{uncapped_text}), Items {total_items_sold}, Cash ${player.cash:.2f}")
+            log_lines.append(f"  {player.name}: Sales ${sales:.2f}, Profit ${profit:.2f}, Lvl {player.store_level} ({player.experience:.0f}/{xp_needed:.0f}XP){level_up_text}, Cust {served} (A:{allocated_served}/{allocated_assigned}, O:{overflow_served}{uncapped_text}), Items {total_items_sold}, Cash ${player.cash:.2f}")
 
             # Show per-category sales breakdown
             if per_item_sales[player.name]:
@@ -4188,8 +4425,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                         category_sales[category] = category_sales.get(category, 0) + data['units_sold']
 
                 if category_sales:
-                    categories_breakdown = [f"{cat}: {qty}" for cat, qty in sorted(category_sales.items())]
-                    print(f"    Sales: {', '.join(categories_breakdown)}")
+                    log_lines.append("    Sales: " + ", ".join(f"{cat}: {qty}" for cat, qty in sorted(category_sales.items())))
 
             # Show inventory by category (end of day)
             if player.inventory:
@@ -4203,26 +4439,25 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                     category = item_to_category.get(item_name, "Unknown")
                     category_inventory[category] = category_inventory.get(category, 0) + qty
 
-                inventory_items = [f"{cat}: {qty}" for cat, qty in sorted(category_inventory.items())]
+                inventory_text = ", ".join(f"{cat}: {qty}" for cat, qty in sorted(category_inventory.items()))
                 # Add inventory space used from buy orders
                 inv_used = daily_inventory_used[player.name]
                 if inv_used > 0:
-                    print(f"    Inv: {', '.join(inventory_items)} (bought: {inv_used:.1f} space)")
+                    log_lines.append(f"    Inv: {inventory_text} (bought: {inv_used:.1f} space)")
                 else:
-                    print(f"    Inv: {', '.join(inventory_items)}")
+                    log_lines.append(f"    Inv: {inventory_text}")
 
             # Show pricing by category (% below market)
             if player.category_pricing:
-                pricing_items = [f"{cat}: {pct:.0f}%" for cat, pct in sorted(player.category_pricing.items())]
-                print(f"    Price: {', '.join(pricing_items)}")
+                log_lines.append("    Price: " + ", ".join(f"{cat}: {pct:.0f}%" for cat, pct in sorted(player.category_pricing.items())))
 
         if unmet_demand > 0:
-            print(f"\nUnmet regular demand: {unmet_demand} items")
+            log_lines.append(f"\nUnmet regular demand: {unmet_demand} items")
         if unmet_uncapped_demand > 0:
-            print(f"Unmet uncapped demand: {unmet_uncapped_demand} items")
+            log_lines.append(f"Unmet uncapped demand: {unmet_uncapped_demand} items")
 
         # Apply inventory penalty ($1 per 10 units of size)
-        items_by_name = {item.name: item for item in game_state.items}
+        items_by_name = game_state.items_by_name
         inventory_penalties = []
         player = game_state.player
         if player:
@@ -4233,26 +4468,26 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 inventory_penalties.append(f"{player.name}: {total_size:.1f} size → ${penalty:.2f}")
 
         if inventory_penalties:
-            print(f"\n📦 Inventory Penalties: {', '.join(inventory_penalties)}")
+            log_lines.append(f"\n📦 Inventory Penalties: {', '.join(inventory_penalties)}")
 
         # Display customer type statistics
-        print(f"\nCustomer Types Today:")
+        log_lines.append(f"\nCustomer Types Today:")
         for ctype in ['low', 'medium', 'high']:
             spawned = customer_type_stats['spawned'][ctype]
             if spawned > 0:
                 bought = customer_type_stats['bought_something'][ctype]
                 found_nothing = customer_type_stats['found_nothing'][ctype]
-                print(f"  {ctype.replace('_', ' ').title()}: {spawned} spawned | {bought} bought | {found_nothing} found nothing")
+                log_lines.append(f"  {ctype.replace('_', ' ').title()}: {spawned} spawned | {bought} bought | {found_nothing} found nothing")
 
         # Display special customer events
         if special_customer_events:
-            print(f"\n🌟 Special Customers Today ({len(special_customer_events)} spawned):")
+            log_lines.append(f"\n🌟 Special Customers Today ({len(special_customer_events)} spawned):")
             for customer_type, target_name, details in special_customer_events:
-                print(f"  {customer_type} → {target_name}: {details}")
+                log_lines.append(f"  {customer_type} → {target_name}: {details}")
 
         # Display demand per category (what customers wanted today)
         if daily_demand_per_item:
-            print(f"\nItem Demand Today (Total Quantity Wanted by Category):")
+            log_lines.append(f"\nItem Demand Today (Total Quantity Wanted by Category):")
             # Aggregate demand by category
             demand_by_category = {}
             for item_name, quantity in daily_demand_per_item.items():
@@ -4264,19 +4499,19 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
             # Sort by demand (highest first), then by category name
             sorted_demand = sorted(demand_by_category.items(), key=lambda x: (-x[1], x[0]))
             formatted_items = [f"{category}: {quantity}" for category, quantity in sorted_demand]
-            print(f"  {', '.join(formatted_items)}")
+            log_lines.append(f"  {', '.join(formatted_items)}")
 
             # Display top 10 individual items by demand
-            print(f"\nTop 10 Items by Demand Today:")
+            log_lines.append(f"\nTop 10 Items by Demand Today:")
             sorted_items = sorted(daily_demand_per_item.items(), key=lambda x: -x[1])
             top_10_items = sorted_items[:10]
             for i, (item_name, quantity) in enumerate(top_10_items, 1):
-                print(f"  {i}. {item_name}: {quantity}")
+                log_lines.append(f"  {i}. {item_name}: {quantity}")
 
     # Update item demand for next day (after everything has sold)
     updated_items = update_item_demand(game_state)
     if show_details and updated_items:
-        print(f"\n📊 DEMAND UPDATE: {len(updated_items)} items had demand changes")
+        log_lines.append(f"\n📊 DEMAND UPDATE: {len(updated_items)} items had demand changes")
         # Show demand changes in compact format (5 items per line)
         demand_changes = [(item_name, game_state.item_demand[item_name]) for item_name in updated_items]
         items_per_line = 5
@@ -4291,20 +4526,20 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 else:
                     emoji = "➡️"
                 formatted_items.append(f"{emoji}{item_name}:{demand:.2f}x")
-            print(f"   {' | '.join(formatted_items)}")
+            log_lines.append(f"   {' | '.join(formatted_items)}")
 
     # Apply price fluctuations for next day (before other end-of-day processing)
     # Done here so we can display it near demand changes
     price_changes = apply_daily_price_fluctuation(game_state.market_prices, game_state.items)
 
     # Update all player prices based on their category pricing rules
-    items_by_name = {item.name: item for item in game_state.items}
+    items_by_name = game_state.items_by_name
     player = game_state.player
     if player:
         player.update_prices_from_market(game_state.market_prices, items_by_name)
 
     if show_details and price_changes:
-        print(f"\n💰 MARKET PRICE UPDATE: {len(price_changes)} items had price changes")
+        log_lines.append(f"\n💰 MARKET PRICE UPDATE: {len(price_changes)} items had price changes")
         for item_name, old_price, new_price, change_percent in price_changes:
             if change_percent > 0:
                 emoji = "📈"
@@ -4312,7 +4547,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 emoji = "📉"
             else:
                 emoji = "➡️"
-            print(f"   {emoji} {item_name}: ${old_price:.2f} → ${new_price:.2f} ({change_percent:+.1f}%)")
+            log_lines.append(f"   {emoji} {item_name}: ${old_price:.2f} → ${new_price:.2f} ({change_percent:+.1f}%)")
 
     # Unlock new products every 10 days (at end of day, so players can buy them next day)
     if game_state.day % 10 == 0 and game_state.day > 0:
@@ -4323,10 +4558,10 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 new_products.append(new_product)
 
         if new_products and show_details:
-            print(f"\n🎁 NEW PRODUCTS UNLOCKED ({len(new_products)} items):")
+            log_lines.append(f"\n🎁 NEW PRODUCTS UNLOCKED ({len(new_products)} items):")
             for product in new_products:
-                print(f"   - {product.name} (${product.base_price:.2f})")
-            print(f"   Total products available: {len(game_state.items)}")
+                log_lines.append(f"   - {product.name} (${product.base_price:.2f})")
+            log_lines.append(f"   Total products available: {len(game_state.items)}")
 
     # Step 7.8: Apply daily reputation changes with limits and decay
     import math
@@ -4349,8 +4584,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
         # Additional penalties (applied separately from customer interaction cap)
         # Penalty: -5 reputation if stock is completely empty
-        total_stock = sum(player.inventory.values())
-        if total_stock == 0:
+        if player.total_stock == 0:
             rep_change -= 5
 
         # Penalty: -5 reputation if average fulfillment is below 30%
@@ -4374,15 +4608,13 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
         fulfillment_data = daily_fulfillment_data[player.name]
         visit_counts = {
-            "allocated": len(fulfillment_data.get("allocated", [])),
-            "overflow": len(fulfillment_data.get("overflow", [])),
+            "allocated": fulfillment_data["allocated"][1],
+            "overflow": fulfillment_data["overflow"][1],
         }
 
         # Update fulfillment averages based on today's data
         update_player_fulfillment_averages(player, fulfillment_data)
-        has_fulfillment_data = bool(
-            fulfillment_data["allocated"] or fulfillment_data["overflow"]
-        )
+        has_fulfillment_data = bool(visit_counts["allocated"] or visit_counts["overflow"])
 
         # Collect reputation/fulfillment data for table display
         if show_details:
@@ -4421,37 +4653,31 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 
     # Display reputation and fulfillment table
     if show_details and reputation_data:
-        print("\n📊 Reputation & Fulfillment:")
+        log_lines.append("\n📊 Reputation & Fulfillment:")
         for data in reputation_data:
             decay_text = f" (decay: -{data['decay']})" if data['decay'] > 0 else ""
             change_text = f" ({data['rep_change']:+d}{decay_text})" if (data['rep_change'] != 0 or data['decay'] > 0) else ""
             fulfillment_text = ""
             if data['has_fulfillment']:
                 fulfillment_text = f" | Avg: {data['avg_fulfillment']:.1f}% ({data['total_customers']} cust: Alloc {data['allocated_avg']:.1f}%/{data['allocated_count']}, Ovrf {data['overflow_avg']:.1f}%/{data['overflow_count']})"
-            print(f"  {data['name']}: Rep {data['reputation']:.0f}{change_text}{fulfillment_text}")
+            log_lines.append(f"  {data['name']}: Rep {data['reputation']:.0f}{change_text}{fulfillment_text}")
 
     # Display CAS table
     if show_details and cas_data:
-        print("\n🎯 Customer Attraction Score (CAS):")
+        log_lines.append("\n🎯 Customer Attraction Score (CAS):")
         for data in cas_data:
             marketing_text = f", Mkt: {data['marketing']:.1f}" if data['marketing'] > 0 else ""
             specialty_text = f"{data['specialty_mult']:.2f}x"
             if data['specialty_mult_raw'] > 0:
                 specialty_text += f" (+{data['specialty_mult_raw']:.2f})"
-            print(f"  {data['name']}: CAS={data['final_cas']:.1f} | Rep: {data['reputation']:.0f}, Disc: {data['discount_pct']:.1f}%, Stab: {data['stability']:.1f}{marketing_text}, Spec: {specialty_text}, Fulfill: {data['fulfill_mult']:.2f}x ({data['fulfill_pct']:.0f}%)")
+            log_lines.append(f"  {data['name']}: CAS={data['final_cas']:.1f} | Rep: {data['reputation']:.0f}, Disc: {data['discount_pct']:.1f}%, Stab: {data['stability']:.1f}{marketing_text}, Spec: {specialty_text}, Fulfill: {data['fulfill_mult']:.2f}x ({data['fulfill_pct']:.0f}%)")
 
         # Show competitor comparison
         if game_state.player and cas_data and game_state.competitors:
             player_cas = cas_data[0]['final_cas']  # Player's CAS
-            print(f"\n  🏪 Competitor Comparison:")
-            for competitor in game_state.competitors:
-                comp_cas = calculate_competitor_cas(
-                    competitor,
-                    game_state.market_prices,
-                    {item.name: item for item in game_state.items},
-                    game_state.items,
-                    game_state.day
-                )
+            log_lines.append(f"\n  🏪 Competitor Comparison:")
+            competitor_cas_scores = calculate_competitor_cas_scores(game_state, item_market_info)
+            for competitor_name, comp_cas in competitor_cas_scores:
                 cas_diff = player_cas - comp_cas
                 if cas_diff >= 0:
                     symbol = "✓"
@@ -4459,7 +4685,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 else:
                     symbol = "✗"
                     status = f"behind by {abs(cas_diff):.1f}"
-                print(f"    {symbol} {competitor.name}: {comp_cas:.1f} CAS ({status})")
+                log_lines.append(f"    {symbol} {competitor_name}: {comp_cas:.1f} CAS ({status})")
 
     # Step 8: Refresh vendor inventory for next day
     # Done at END of day so buy orders are set for current vendor inventory
@@ -4471,7 +4697,7 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     # Step 9.1: Grow competitor stores (add inventory, improve reputation, etc.)
     grow_competitors(game_state.competitors, game_state.items, game_state.market_prices, game_state.day)
     if show_details:
-        print(f"\n📊 Competitor stores expanded their inventory")
+        log_lines.append(f"\n📊 Competitor stores expanded their inventory")
 
     # Step 9.25: Process pending deliveries for all players
     delivery_summary = {}  # Track deliveries per player for consolidated output
@@ -4510,6 +4736,10 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
                 player.items_stocked_today.add(item_name)
 
             player.inventory[item_name] = new_total_qty
+            player.total_stock += quantity
+            player.state_version += 1
+            if new_total_qty > 0:
+                player.in_stock_items.add(item_name)
 
             if True:
                 player_deliveries.append(f"{quantity}x {item_name}")
@@ -4524,26 +4754,39 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
     # Print consolidated delivery notifications
     if show_details and delivery_summary:
         for player_name, deliveries in delivery_summary.items():
-            print(f"\n📦 Deliveries for {player_name}: {', '.join(deliveries)}")
+            log_lines.append(f"\n📦 Deliveries for {player_name}: {', '.join(deliveries)}")
 
     # Step 9.5: Clean up expired vendor partnerships
+    # (an empty expiration heap means the player holds no temporary upgrades, so the block is skipped)
     player = game_state.player
-    if player:
-        expired_upgrades = []
-        for upgrade in player.purchased_upgrades:
-            if upgrade.duration_days > 0:  # Temporary upgrade
-                expiration_day = player.vendor_partnership_expiration.get(upgrade.name, 0)
-                if game_state.day >= expiration_day:
+    if player and player.expiration_heap:
+        # Pop temporary upgrades whose expiration day has been reached off the heap
+        expired_names = set()
+        while player.expiration_heap and player.expiration_heap[0][0] <= game_state.day:
+            expiration_day, upgrade_name = heapq.heappop(player.expiration_heap)
+            # Renewed partnerships leave their older entry behind; only the current expiration counts
+            if player.vendor_partnership_expiration.get(upgrade_name, 0) != expiration_day:
+                continue
+            expired_names.add(upgrade_name)
+            player.vendor_partnership_expiration.pop(upgrade_name, None)
+
+        # Split expired upgrades out of the purchased list in one pass
+        if expired_names:
+            kept_upgrades = []
+            expired_upgrades = []
+            for upgrade in player.purchased_upgrades:
+                if upgrade.duration_days > 0 and upgrade.name in expired_names:
                     expired_upgrades.append(upgrade)
-                    # Remove from expiration tracker
-                    if upgrade.name in player.vendor_partnership_expiration:
-                        del player.vendor_partnership_expiration[upgrade.name]
-
-        # Remove expired upgrades
-        for upgrade in expired_upgrades:
-            player.purchased_upgrades.remove(upgrade)
+                else:
+                    kept_upgrades.append(upgrade)
+            player.purchased_upgrades = kept_upgrades
+            player.production_line_items.difference_update(
+                u.vendor_name for u in expired_upgrades if u.effect_type == "production_line"
+            )
+            player.refresh_upgrade_effect_totals()
             if True and show_details:
-                print(f"\n⚠️  {player.name}: '{upgrade.name}' has expired!")
+                for upgrade in expired_upgrades:
+                    log_lines.append(f"\n⚠️  {player.name}: '{upgrade.name}' has expired!")
 
     # Display loan warnings for human players
     player = game_state.player
@@ -4552,21 +4795,28 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
             for loan in player.loans:
                 days_remaining = loan.due_day - game_state.day
                 if days_remaining <= 0:
-                    print(f"\n💸 WARNING: {player.name}'s loan from {loan.lender_name} is OVERDUE!")
-                    print(f"    Amount due: ${loan.remaining_balance:,.2f}")
+                    log_lines.append(f"\n💸 WARNING: {player.name}'s loan from {loan.lender_name} is OVERDUE!")
+                    log_lines.append(f"    Amount due: ${loan.remaining_balance:,.2f}")
                 elif days_remaining <= 5:
-                    print(f"\n⏰ REMINDER: {player.name}'s loan from {loan.lender_name} is due in {days_remaining} days")
-                    print(f"    Amount due: ${loan.remaining_balance:,.2f}")
+                    log_lines.append(f"\n⏰ REMINDER: {player.name}'s loan from {loan.lender_name} is due in {days_remaining} days")
+                    log_lines.append(f"    Amount due: ${loan.remaining_balance:,.2f}")
 
     # Step 10: Save yesterday's demand per item for each player (used for lead time calculations)
     # Use global demand (what all customers wanted) rather than individual sales (which may be limited by stock)
     player = game_state.player
     if player:
-        player.yesterday_demand = dict(daily_demand_per_item)  # Copy the global demand data
+        # Today's demand dict is rebuilt from scratch each day and only read afterwards, so hand it over without copying
+        player.yesterday_demand = daily_demand_per_item
 
     # Step 11: Reset daily vendor purchase tracking
     game_state.vendor_daily_purchases.clear()
 
+    # CAS breakdowns cached for the status screen are only valid for the day they were computed
+    game_state.cas_breakdown_cache.clear()
+
+    if log_lines:
+        sys.stdout.write("\n".join(log_lines) + "\n")
+
     return daily_sales
 
 
@@ -4574,7 +4824,118 @@ def run_day(game_state: GameState, show_details: bool = True) -> Dict[str, float
 # Interactive menu system
 # -------------------------------------------------------------------
 
-def calculate_item_stability(player: Player, market_prices: Dict[str, float], items_by_name: Dict[str, Item]) -> float:
+def build_item_market_info(market_prices: Dict[str, float], items_by_name: Dict[str, Item]) -> Dict[str, Tuple[float, int]]:
+    """
+    Map each priced item to its (market_price, importance) pair.
+
+    Built once per tick so the CAS helpers can do a single dict lookup per
+    stocked item instead of separate market price and item lookups.
+    Items missing from the catalog use the default importance of 2.
+    """
+    item_info: Dict[str, Tuple[float, int]] = {}
+    for item_name, market_price in market_prices.items():
+        item = items_by_name.get(item_name)
+        item_info[item_name] = (market_price, item.importance if item else 2)
+    return item_info
+
+
+class CasInventoryScores(NamedTuple):
+    """Inventory-based CAS inputs gathered in one pass over a player's in-stock items."""
+    discount_score: float  # Importance-weighted discount % across priced items
+    total_discount_pct: float  # Unweighted discount % across priced items
+    items_counted: int  # Priced items that contributed to the discount score
+    acceptable_discount_score: float  # Weighted discount % for items priced within 115% of market
+    has_acceptable_stock: bool  # Whether any item is priced within 115% of market
+    item_stability: float  # Total price proximity + consistency score
+    highest_market_price: float  # Highest market price among in-stock items
+    category_counts: Dict[str, int]  # category -> number of in-stock items
+
+
+def scan_cas_inventory(
+    player: Player,
+    items_by_name: Dict[str, Item],
+    item_info: Dict[str, Tuple[float, int]]
+) -> CasInventoryScores:
+    """
+    Walk the player's in-stock items once and accumulate every inventory-based CAS input:
+    discount scores, item stability, the highest market price and per-category item counts.
+    See calculate_item_stability for the stability formula.
+    """
+    discount_score = 0.0
+    total_discount_pct = 0.0
+    items_counted = 0
+    acceptable_discount_score = 0.0
+    has_acceptable_stock = False
+    total_stability = 0.0
+    highest_price = 0.0
+    category_counts: Dict[str, int] = {}
+
+    # Bind the lookups used on every item to locals for the tight loop below
+    prices = player.prices
+    price_history = player.price_history
+    get_item = items_by_name.get
+    get_info = item_info.get
+    get_count = category_counts.get
+
+    for item_name in player.in_stock_items:
+        # Specialty: count in-stock items per category
+        item = get_item(item_name)
+        if item:
+            category_counts[item.category] = get_count(item.category, 0) + 1
+
+        # Marketing: track the highest market price in stock
+        market_price, importance = get_info(item_name, (0, 2))
+        if market_price > highest_price:
+            highest_price = market_price
+
+        # Discount and stability only apply to priced items with a market price
+        if market_price <= 0 or item_name not in prices:
+            continue
+
+        player_price = prices[item_name]
+
+        # Calculate discount percentage
+        if player_price < market_price:
+            discount_pct = ((market_price - player_price) / market_price) * 100
+        else:
+            discount_pct = 0
+
+        total_discount_pct += discount_pct
+        discount_score += discount_pct * importance
+        items_counted += 1
+
+        # Customers won't pay more than 115% of market price
+        if player_price <= market_price * 1.15:
+            has_acceptable_stock = True
+            acceptable_discount_score += discount_pct * importance
+
+        # Proximity score: 5 at market price, -1 per 1% difference
+        price_diff_pct = abs((player_price - market_price) / market_price) * 100
+        proximity_score = max(0, 5 - price_diff_pct)
+
+        # Consistency bonus: +2 if price moved no more than 5%
+        consistency_bonus = 0.0
+        prev_price = price_history.get(item_name, 0)
+        if prev_price > 0:
+            price_change_pct = abs((player_price - prev_price) / prev_price) * 100
+            if price_change_pct <= 5:
+                consistency_bonus = 2.0
+
+        total_stability += (proximity_score + consistency_bonus) * importance
+
+    return CasInventoryScores(
+        discount_score, total_discount_pct, items_counted,
+        acceptable_discount_score, has_acceptable_stock,
+        total_stability, highest_price, category_counts
+    )
+
+
+def calculate_item_stability(
+    player: Player,
+    market_prices: Dict[str, float],
+    items_by_name: Dict[str, Item],
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
+) -> float:
     """
     Calculate item stability score to reward pricing close to market price and consistent pricing.
 
@@ -4591,47 +4952,30 @@ def calculate_item_stability(player: Player, market_prices: Dict[str, float], it
 
     Returns: Total item stability score
     """
-    total_stability = 0.0
-
-    for item_name, qty in player.inventory.items():
-        # Only consider items with stock and set prices
-        if qty <= 0 or item_name not in player.prices:
-            continue
-
-        player_price = player.prices[item_name]
-        market_price = market_prices.get(item_name, 0)
-
-        # Skip if no market price
-        if market_price <= 0:
-            continue
-
-        # Get item importance
-        item = items_by_name.get(item_name)
-        importance = item.importance if item else 2
+    if item_info is None:
+        item_info = build_item_market_info(market_prices, items_by_name)
+    return scan_cas_inventory(player, items_by_name, item_info).item_stability
 
-        # Calculate price difference percentage
-        price_diff_pct = abs((player_price - market_price) / market_price) * 100
 
-        # Calculate proximity score: 5 at market price, -1 per 1% difference
-        proximity_score = max(0, 5 - price_diff_pct)
+def marketing_effect_for_price(player: Player, highest_price: float) -> float:
+    """Marketing effect for a player whose most expensive in-stock item has the given market price."""
+    if player.marketing_agents <= 0:
+        return 0.0
 
-        # Calculate consistency bonus
-        consistency_bonus = 0.0
-        if item_name in player.price_history:
-            prev_price = player.price_history[item_name]
-            if prev_price > 0:
-                price_change_pct = abs((player_price - prev_price) / prev_price) * 100
-                if price_change_pct <= 5:
-                    consistency_bonus = 2.0
+    # Reputation bonus: +1 per 2 reputation, max 50
+    reputation_bonus = min(50, player.reputation / 2)
 
-        # Combine and weight by importance
-        item_stability = (proximity_score + consistency_bonus) * importance
-        total_stability += item_stability
+    # Price scaling bonus: highest_price / 10, rounded down
+    price_bonus = int(highest_price / 10)
 
-    return total_stability
+    return reputation_bonus + price_bonus
 
 
-def calculate_marketing_effect(player: Player, market_prices: Dict[str, float]) -> float:
+def calculate_marketing_effect(
+    player: Player,
+    market_prices: Dict[str, float],
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
+) -> float:
     """
     Calculate marketing effect from Marketing Agents.
 
@@ -4645,62 +4989,31 @@ def calculate_marketing_effect(player: Player, market_prices: Dict[str, float])
     if player.marketing_agents <= 0:
         return 0.0
 
-    # Reputation bonus: +1 per 2 reputation, max 50
-    reputation_bonus = min(50, player.reputation / 2)
+    # Highest market price among in-stock items (the CAS functions get this from scan_cas_inventory)
+    if item_info is not None:
+        highest_price = max((item_info.get(item_name, (0, 2))[0] for item_name in player.in_stock_items), default=0.0)
+    else:
+        highest_price = max((market_prices.get(item_name, 0) for item_name in player.in_stock_items), default=0.0)
+    return marketing_effect_for_price(player, highest_price)
 
-    # Find highest market price among items in stock
-    highest_price = 0.0
-    for item_name, qty in player.inventory.items():
-        if qty > 0:
-            market_price = market_prices.get(item_name, 0)
-            if market_price > highest_price:
-                highest_price = market_price
-
-    # Price scaling bonus: highest_price / 10, rounded down
-    price_bonus = int(highest_price / 10)
 
-    return reputation_bonus + price_bonus
-
-
-def calculate_specialty_score(player: Player, items_by_name: Dict[str, Item]) -> Tuple[float, Dict[str, int], Dict[str, float]]:
+def specialty_score_from_counts(category_counts: Dict[str, int]) -> Tuple[float, Dict[str, float]]:
     """
-    Calculate specialty score multiplier based on category item counts.
-
-    Rewards players for stocking a certain number of items from specific categories.
-    Bonuses are ADDITIVE: 1.2x (20% bonus) + 1.8x (80% bonus) = 2.0x total (100% bonus).
+    Turn per-category in-stock counts into the specialty multiplier.
 
     Returns:
         - Total specialty multiplier (1.0 + sum of all bonus percentages)
-        - Dictionary of category -> count of items in stock
         - Dictionary of category -> total bonus multiplier for that category
     """
-    # Count items in stock per category
-    category_counts: Dict[str, int] = {}
-
-    for item_name, qty in player.inventory.items():
-        if qty <= 0:
-            continue
-
-        item = items_by_name.get(item_name)
-        if not item:
-            continue
-
-        category = item.category
-        category_counts[category] = category_counts.get(category, 0) + 1
-
-    # Calculate specialty bonuses for each category
     category_multipliers: Dict[str, float] = {}
     total_bonus = 0.0  # Sum of bonus percentages (not full multipliers)
 
     for category, count in category_counts.items():
-        thresholds = SPECIALTY_SCORE_THRESHOLDS.get(category, [])
-        category_bonus = 0.0
+        thresholds, cumulative_bonuses = SPECIALTY_SCORE_CUMULATIVE.get(category, ([], []))
 
-        # Sum all BONUSES for thresholds met (bonus = multiplier - 1.0)
-        for threshold, multiplier in thresholds:
-            if count >= threshold:
-                bonus = multiplier - 1.0  # Extract the bonus percentage
-                category_bonus += bonus
+        # Sum of BONUSES for all thresholds met (bonus = multiplier - 1.0)
+        reached = bisect.bisect_right(thresholds, count)
+        category_bonus = cumulative_bonuses[reached - 1] if reached else 0.0
 
         if category_bonus > 0:
             category_total_mult = 1.0 + category_bonus  # Convert back to multiplier for display
@@ -4708,76 +5021,72 @@ def calculate_specialty_score(player: Player, items_by_name: Dict[str, Item]) ->
             total_bonus += category_bonus
 
     total_multiplier = 1.0 + total_bonus
+    return total_multiplier, category_multipliers
+
+
+def calculate_specialty_score(player: Player, items_by_name: Dict[str, Item]) -> Tuple[float, Dict[str, int], Dict[str, float]]:
+    """
+    Calculate specialty score multiplier based on category item counts.
+
+    Rewards players for stocking a certain number of items from specific categories.
+    Bonuses are ADDITIVE: 1.2x (20% bonus) + 1.8x (80% bonus) = 2.0x total (100% bonus).
+
+    Returns:
+        - Total specialty multiplier (1.0 + sum of all bonus percentages)
+        - Dictionary of category -> count of items in stock
+        - Dictionary of category -> total bonus multiplier for that category
+    """
+    category_counts = scan_cas_inventory(player, items_by_name, {}).category_counts
+    total_multiplier, category_multipliers = specialty_score_from_counts(category_counts)
     return total_multiplier, category_counts, category_multipliers
 
 
-def calculate_cas_breakdown(player: Player, market_prices: Dict[str, float], items_by_name: Dict[str, Item], all_available_items: List[Item], current_day: int = 1) -> Dict[str, Any]:
+def calculate_cas_breakdown(
+    player: Player,
+    market_prices: Dict[str, float],
+    items_by_name: Dict[str, Item],
+    all_available_items: List[Item],
+    current_day: int = 1,
+    item_info: Optional[Dict[str, Tuple[float, int]]] = None
+) -> Dict[str, Any]:
     """
     Calculate Customer Attraction Score (CAS) breakdown for a player.
     Returns a dictionary with all CAS components.
     """
+    if item_info is None:
+        item_info = build_item_market_info(market_prices, items_by_name)
+
     # Calculate reputation multiplier
     reputation_multiplier = 10 ** (player.reputation / 100)
 
-    # Calculate discount score (sum across all stocked items)
-    discount_score = 0.0
-    total_discount_pct = 0.0
-    items_counted = 0
-    if player.inventory and player.prices:
-        for item_name, qty in player.inventory.items():
-            if qty > 0 and item_name in player.prices:
-                market_price = market_prices.get(item_name, 0)
-                if market_price > 0:
-                    player_price = player.prices[item_name]
-                    # Get item importance
-                    item = next((i for i in all_available_items if i.name == item_name), None)
-                    importance = item.importance if item else 2
-
-                    # Calculate discount percentage
-                    if player_price < market_price:
-                        discount_pct = ((market_price - player_price) / market_price) * 100
-                    else:
-                        discount_pct = 0
-
-                    total_discount_pct += discount_pct
-                    discount_score += discount_pct * importance
-                    items_counted += 1
-
-    # Calculate item stability score
-    item_stability = calculate_item_stability(player, market_prices, items_by_name)
+    # Discount score, item stability, specialty counts and marketing price in one inventory pass
+    scores = scan_cas_inventory(player, items_by_name, item_info)
+    discount_score = scores.discount_score
+    total_discount_pct = scores.total_discount_pct
+    items_counted = scores.items_counted
+    item_stability = scores.item_stability
 
     # Calculate specialty score (category-based bonuses for item variety)
-    specialty_multiplier_effective, category_counts, category_multipliers = calculate_specialty_score(player, items_by_name)
+    category_counts = scores.category_counts
+    specialty_multiplier_effective, category_multipliers = specialty_score_from_counts(category_counts)
 
     # Calculate fulfillment multiplier
     fulfillment_pct = player.average_fulfillment_pct
-    if fulfillment_pct >= 100:
-        fulfillment_multiplier = 2.0
-    elif fulfillment_pct >= 90:
-        fulfillment_multiplier = 1.4
-    elif fulfillment_pct > 70:
-        fulfillment_multiplier = 1.1
-    elif fulfillment_pct >= 50:
-        fulfillment_multiplier = 1.0
-    elif fulfillment_pct >= 20:
-        fulfillment_multiplier = 0.9
-    elif fulfillment_pct >= 10:
-        fulfillment_multiplier = 0.5
-    else:
-        fulfillment_multiplier = 0.1
+    fulfillment_multiplier = get_fulfillment_multiplier(fulfillment_pct)
 
     # Calculate marketing effect
-    marketing_effect = calculate_marketing_effect(player, market_prices)
+    marketing_effect = marketing_effect_for_price(player, scores.highest_market_price)
 
-    # Calculate adjacency multiplier (penalty for non-adjacent categories)
-    adjacency_multiplier = calculate_adjacency_multiplier(player, items_by_name, current_day, check_temporary=True)
-
-    # Get non-adjacent categories for display
-    non_adjacent_categories = get_non_adjacent_categories(player, items_by_name, current_day)
-    main_category = get_player_main_category(player, current_day)
+    # Resolve main category, non-adjacent categories and adjacency multiplier together
+    category_state = compute_category_state(
+        player, items_by_name, current_day, check_temporary=True, stocked_categories=category_counts
+    )
+    adjacency_multiplier = category_state.adjacency_multiplier
+    non_adjacent_categories = category_state.non_adjacent_categories
+    main_category = category_state.main_category
 
-    # Calculate final CAS
-    final_cas = (discount_score + marketing_effect + item_stability + marketing_effect) * reputation_multiplier * specialty_multiplier_effective * fulfillment_multiplier * adjacency_multiplier
+    # Calculate final CAS (marketing effect boosts both components)
+    final_cas = (discount_score + item_stability + 2 * marketing_effect) * reputation_multiplier * specialty_multiplier_effective * fulfillment_multiplier * adjacency_multiplier
 
     # Return all components as a dictionary
     return {
@@ -4792,6 +5101,8 @@ def calculate_cas_breakdown(player: Player, market_prices: Dict[str, float], ite
         "specialty_multiplier_raw": specialty_multiplier_effective - 1.0,  # Just the bonus amount
         "category_counts": category_counts,
         "category_multipliers": category_multipliers,
+        # Highest bonus first, ready for display
+        "category_multipliers_sorted": sorted(category_multipliers.items(), key=lambda x: x[1], reverse=True),
         "fulfillment_multiplier": fulfillment_multiplier,
         "fulfillment_pct": fulfillment_pct,
         "adjacency_multiplier": adjacency_multiplier,
@@ -4805,11 +5116,13 @@ def display_cas_breakdown(player: Player, game_state: GameState, breakdown: Dict
     """Display Customer Attraction Score (CAS) breakdown for a player."""
     print(f"\n🎯 {player.name} - Customer Attraction Score (CAS):")
 
-    # Use pre-calculated breakdown if provided, otherwise calculate it
+    # Use pre-calculated breakdown if provided, otherwise reuse today's cached one or calculate it
     if breakdown is None:
-        # Build items_by_name dict for item_stability calculation
-        items_by_name = {item.name: item for item in game_state.items}
-        breakdown = calculate_cas_breakdown(player, game_state.market_prices, items_by_name, game_state.items, game_state.day)
+        cache_key = (player.name, game_state.day, player.state_version)
+        breakdown = game_state.cas_breakdown_cache.get(cache_key)
+        if breakdown is None:
+            breakdown = calculate_cas_breakdown(player, game_state.market_prices, game_state.items_by_name, game_state.items, game_state.day)
+            game_state.cas_breakdown_cache[cache_key] = breakdown
 
     # Extract values from breakdown
     discount_score = breakdown["discount_score"]
@@ -4821,7 +5134,7 @@ def display_cas_breakdown(player: Player, game_state: GameState, breakdown: Dict
     specialty_multiplier = breakdown["specialty_multiplier"]
     specialty_multiplier_raw = breakdown["specialty_multiplier_raw"]
     category_counts = breakdown["category_counts"]
-    category_multipliers = breakdown["category_multipliers"]
+    category_multipliers_sorted = breakdown["category_multipliers_sorted"]
     fulfillment_multiplier = breakdown["fulfillment_multiplier"]
     fulfillment_pct = breakdown["fulfillment_pct"]
     adjacency_multiplier = breakdown.get("adjacency_multiplier", 1.0)
@@ -4839,9 +5152,9 @@ def display_cas_breakdown(player: Player, game_state: GameState, breakdown: Dict
 
     # Display specialty score with category breakdown
     print(f"   Specialty Multiplier:    {specialty_multiplier:6.2f}x  (base 1.0 + {specialty_multiplier_raw:.2f} bonus)")
-    if category_multipliers:
+    if category_multipliers_sorted:
         print(f"      Category Bonuses:")
-        for category, multiplier in sorted(category_multipliers.items(), key=lambda x: x[1], reverse=True):
+        for category, multiplier in category_multipliers_sorted:
             count = category_counts.get(category, 0)
             bonus = multiplier - 1.0  # Convert full multiplier to bonus for display
             print(f"        • {category}: {count} items → +{bonus:.2f}x")
@@ -4923,18 +5236,18 @@ def display_player_status(player: Player, game_state: GameState = None) -> None:
     print(f"  Marketing Agents: {player.marketing_agents} (Boost customer attraction)")
     total_employees = total_warehouse_workers + player.marketing_agents
     monthly_wage = 1000.0
-    wage_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "wage_reduction")
+    wage_reduction = player.get_upgrade_effect_total("wage_reduction")
     actual_wage = max(0, monthly_wage - wage_reduction)
     print(f"  Monthly wages: ${total_employees * actual_wage:.2f} (${actual_wage:.2f}/employee)")
 
     if game_state:
         inventory_size_used = player.get_inventory_size_used(game_state.items_by_name)
-        total_items = sum(player.inventory.values())
-        num_products = len([i for i, q in player.inventory.items() if q > 0])
+        total_items = player.total_stock
+        num_products = len(player.in_stock_items)
         print(f"\nInventory ({inventory_size_used:.1f}/{player.get_max_inventory()} space, {total_items} items, {num_products} products):")
     else:
-        total_items = sum(player.inventory.values())
-        num_products = len([i for i, q in player.inventory.items() if q > 0])
+        total_items = player.total_stock
+        num_products = len(player.in_stock_items)
         print(f"\nInventory ({total_items} items, {num_products} different products):")
     if player.inventory:
         for item_name, quantity in player.inventory.items():
@@ -5091,8 +5404,403 @@ def vendor_menu(game_state: GameState, player: Player) -> None:
             print("\n✗ Invalid input!")
 
 
+# Vendor picks typed into the buy order menus: "vendor_number" or "vendor_number quantity"
+VENDOR_QUANTITY_INPUT_PATTERN = re.compile(r"^\s*([+-]?\d+)(?:\s+([+-]?\d+))?\s*$")
+
+
+def parse_int_input(text: str) -> Optional[int]:
+    """
+    Parse a typed whole number, returning None instead of raising on bad input.
+    Accepts the same forms as int(): an optional sign, surrounding whitespace and
+    single underscores between digits (e.g. "1_000").
+    """
+    text = text.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    if "_" in digits:
+        if digits.startswith("_") or digits.endswith("_") or "__" in digits:
+            return None
+        digits = digits.replace("_", "")
+    return int(text) if digits.isdecimal() else None
+
+
+def report_invalid_input() -> None:
+    """Tell the player their entry wasn't a number and wait for acknowledgement."""
+    print("\n✗ Invalid input!")
+    input("Press Enter to continue...")
+
+
+def build_vendor_labels(game_state: GameState, lead_time_reduction: int) -> List[Tuple[str, str]]:
+    """
+    Build the item-independent part of each "Available Vendors" row: the numbered
+    vendor name with its purchase requirements, and its effective lead time.
+    """
+    labels = []
+    for i, vendor in enumerate(game_state.vendors, 1):
+        # Calculate effective lead time with player's upgrades
+        effective_lead_time = max(0, vendor.lead_time - lead_time_reduction)
+        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
+        labels.append((f"  {i}. {vendor.name}{vendor.requirement_text}", lead_time_str))
+    return labels
+
+
+def build_vendor_discounts(game_state: GameState, player: Player) -> Dict[str, float]:
+    """
+    Get the player's current discount with every vendor. Discounts only change with
+    purchased upgrades or the day, so menus build this once on entry.
+    """
+    discounts = player.get_vendor_discounts(game_state.day)
+    return {vendor.name: discounts.get(vendor.name, 0.0) for vendor in game_state.vendors}
+
+
+def display_available_vendors(
+    game_state: GameState,
+    item_name: str,
+    vendor_labels: List[Tuple[str, str]],
+    vendor_discounts: Optional[Dict[str, float]] = None
+) -> None:
+    """
+    Print the numbered vendor list shown when picking a vendor for a buy order.
+    Rows reuse the labels from build_vendor_labels and add the vendor's base price for
+    the item; passing vendor_discounts (from build_vendor_discounts) applies them to the price.
+    """
+    lines = ["\nAvailable Vendors:"]
+    for vendor, (label, lead_time_str) in zip(game_state.vendors, vendor_labels):
+        price = vendor.get_price(item_name, 1)  # Show base price
+        if price and vendor_discounts is not None:
+            discount = vendor_discounts[vendor.name]
+            final_price = price * (1 - discount)
+            discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
+            lines.append(f"{label} - ${final_price:.2f}{discount_text} (lead: {lead_time_str})")
+        elif price:
+            lines.append(f"{label} - ${price:.2f} (lead: {lead_time_str})")
+        else:
+            status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
+            lines.append(f"{label} - {status}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def display_vendor_estimates(
+    game_state: GameState,
+    vendor_labels: List[Tuple[str, str]],
+    vendor_discounts: Dict[str, float],
+    item: Optional[Item] = None,
+    unavailable_text: str = "(not available)"
+) -> None:
+    """
+    Print the numbered vendor list for recurring orders and auto-restock. Those buy on
+    later days, so prices are estimated from the item's market price and each vendor's
+    pricing multiplier; without an item only lead times are listed.
+    """
+    lines = ["\nAvailable Vendors:"]
+    if item is None:
+        lines.extend(f"{label} (lead: {lead_time_str})" for label, lead_time_str in vendor_labels)
+    else:
+        market_price = game_state.market_prices.get(item.name, item.base_price)
+        for vendor, (label, lead_time_str) in zip(game_state.vendors, vendor_labels):
+            # Check if vendor would sell this item based on their criteria
+            if vendor_would_sell_item(vendor, item, market_price):
+                estimated_price = market_price * vendor.pricing_multiplier
+                discount = vendor_discounts[vendor.name]
+                final_price = estimated_price * (1 - discount)
+                discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
+                lines.append(f"{label} - ~${final_price:.2f}{discount_text} (lead: {lead_time_str})")
+            else:
+                lines.append(f"{label} - {unavailable_text}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def update_buy_order_vendor(
+    game_state: GameState,
+    player: Player,
+    item: Item,
+    vendor_orders: List[tuple],
+    vendor_labels: List[Tuple[str, str]],
+    vendor_discounts: Optional[Dict[str, float]] = None
+) -> bool:
+    """Replace (or remove) one of an item's three buy order vendors. Returns True if the buy order changed."""
+    print(f"\n⚠ Already have 3 vendors. Select a vendor to update:")
+    for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
+        print(f"  {i}. {vendor_name}")
+    print(f"  0. Cancel")
+
+    update_num = parse_int_input(input(f"\nSelect vendor to update (0-{len(vendor_orders)}): "))
+    if update_num is None:
+        report_invalid_input()
+        return False
+    if update_num == 0:
+        return False
+    if not 1 <= update_num <= len(vendor_orders):
+        print("\n✗ Invalid selection!")
+        input("Press Enter to continue...")
+        return False
+
+    # User wants to update this vendor
+    qty_to_update, vendor_to_update = vendor_orders[update_num - 1]
+    print(f"\nUpdating: {vendor_to_update} (currently {qty_to_update} units)")
+
+    # Show vendor list
+    display_available_vendors(game_state, item.name, vendor_labels, vendor_discounts)
+
+    vendor_num = parse_int_input(input(f"\nSelect new vendor (1-{len(game_state.vendors)}, 0 to cancel): "))
+    if vendor_num is None:
+        report_invalid_input()
+        return False
+    if not 1 <= vendor_num <= len(game_state.vendors):
+        return False
+    selected_vendor = game_state.vendors[vendor_num - 1]
+
+    quantity = parse_int_input(input(f"Enter new quantity (0 to remove): "))
+    if quantity is None:
+        report_invalid_input()
+    elif quantity == 0:
+        # Remove this vendor
+        player.remove_vendor_from_buy_order(item.name, vendor_to_update)
+        print(f"\n✓ Removed {vendor_to_update} from buy order")
+        return True
+    elif quantity > 0:
+        # Check minimum purchase
+        if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
+            print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
+            input("Press Enter to continue...")
+            return False
+
+        # Swap the new vendor into the old vendor's slot
+        player.replace_vendor_in_buy_order(item.name, vendor_to_update, selected_vendor.name, quantity)
+        print(f"\n✓ Updated: {quantity} {item.name} from {selected_vendor.name}")
+        return True
+    else:
+        print("\n✗ Quantity must be non-negative!")
+        input("Press Enter to continue...")
+    return False
+
+
+def add_buy_order_vendor(
+    game_state: GameState,
+    player: Player,
+    item: Item,
+    vendor_labels: List[Tuple[str, str]],
+    vendor_discounts: Optional[Dict[str, float]] = None
+) -> bool:
+    """Add one vendor to an item's buy order from a 'vendor [quantity]' entry. Returns True if it was added."""
+    display_available_vendors(game_state, item.name, vendor_labels, vendor_discounts)
+
+    vendor_choice = input(f"\nEnter vendor number and quantity (e.g., '2 100'), or just vendor number (0 to cancel): ").strip()
+    # Parse input - support both "vendor_num quantity" and just "vendor_num"
+    match = VENDOR_QUANTITY_INPUT_PATTERN.match(vendor_choice)
+    if not match:
+        report_invalid_input()
+        return False
+
+    vendor_num = int(match.group(1))
+    if vendor_num == 0:
+        return False
+    if not 1 <= vendor_num <= len(game_state.vendors):
+        print("\n✗ Invalid vendor selection!")
+        input("Press Enter to continue...")
+        return False
+    selected_vendor = game_state.vendors[vendor_num - 1]
+
+    # Get quantity - either from second part or prompt
+    if match.group(2) is not None:
+        quantity = int(match.group(2))
+    else:
+        quantity = parse_int_input(input(f"Enter quantity to buy: "))
+        if quantity is None:
+            report_invalid_input()
+            return False
+
+    if quantity > 0:
+        # Check minimum purchase
+        if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
+            print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
+            input("Press Enter to continue...")
+            return False
+
+        success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
+        if success:
+            print(f"\n✓ Added: {quantity} {item.name} from {selected_vendor.name}")
+            return True
+        else:
+            print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
+            input("Press Enter to continue...")
+    else:
+        print("\n✗ Quantity must be positive!")
+        input("Press Enter to continue...")
+    return False
+
+
+def remove_buy_order_vendor(player: Player, item: Item, vendor_orders: List[tuple]) -> bool:
+    """Remove one vendor from an item's buy order. Returns True if a vendor was removed."""
+    print("\nSelect vendor to remove:")
+    for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
+        print(f"  {i}. {vendor_name} ({qty} units)")
+    print(f"  0. Cancel")
+
+    remove_num = parse_int_input(input(f"\nSelect vendor (0-{len(vendor_orders)}): "))
+    if remove_num is None:
+        report_invalid_input()
+    elif 1 <= remove_num <= len(vendor_orders):
+        qty, vendor_name = vendor_orders[remove_num - 1]
+        player.remove_vendor_from_buy_order(item.name, vendor_name)
+        print(f"\n✓ Removed {vendor_name} from buy order")
+        return True
+    elif remove_num != 0:
+        print("\n✗ Invalid selection!")
+        input("Press Enter to continue...")
+    return False
+
+
+def add_multiple_buy_order_vendors(
+    game_state: GameState,
+    player: Player,
+    item: Item,
+    vendor_orders: List[tuple],
+    vendor_labels: List[Tuple[str, str]],
+    vendor_discounts: Optional[Dict[str, float]] = None
+) -> None:
+    """Fill an item's free buy order vendor slots, one 'vendor quantity' entry per line."""
+    display_available_vendors(game_state, item.name, vendor_labels, vendor_discounts)
+
+    slots_available = 3 - len(vendor_orders)
+    print(f"\nEnter up to {slots_available} vendor(s) in format: vendor_number quantity")
+    print(f"One per line, or press Enter to finish")
+
+    vendors_added = 0
+    while vendors_added < slots_available:
+        try:
+            vendor_input = input(f"\nVendor {vendors_added + 1} (or Enter to finish): ").strip()
+            if not vendor_input:
+                break
+
+            match = VENDOR_QUANTITY_INPUT_PATTERN.match(vendor_input)
+            if not match or match.group(2) is None:
+                print("\n✗ Invalid format! Use: vendor_number quantity (e.g., '2 100')")
+                continue
+
+            vendor_num = int(match.group(1))
+            quantity = int(match.group(2))
+
+            if vendor_num < 1 or vendor_num > len(game_state.vendors):
+                print(f"\n✗ Invalid vendor number! Must be 1-{len(game_state.vendors)}")
+                continue
+
+            selected_vendor = game_state.vendors[vendor_num - 1]
+
+            if quantity <= 0:
+                print("\n✗ Quantity must be positive!")
+                continue
+
+            # Check minimum purchase
+            if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
+                print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
+                continue
+
+            success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
+            if success:
+                print(f"✓ Added: {quantity} {item.name} from {selected_vendor.name}")
+                vendors_added += 1
+            else:
+                print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
+
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+
+    if vendors_added > 0:
+        print(f"\n✓ Successfully added {vendors_added} vendor(s)")
+        input("Press Enter to continue...")
+
+
+def display_item_buy_order(
+    game_state: GameState,
+    item: Item,
+    vendor_orders: List[tuple],
+    lead_time_strs: Dict[str, str],
+    quick_edit: bool = False
+) -> None:
+    """Print an item's current buy order vendors and the submenu options."""
+    lines = ["\n" + "=" * 80, f"Configuring Buy Orders for: {item.name}", "=" * 80]
+
+    lines.append(f"\nCurrent orders ({len(vendor_orders)}/3 vendors):")
+    if vendor_orders:
+        for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
+            # Get vendor price and lead time
+            vendor = game_state.get_vendor(vendor_name)
+            if vendor:
+                # Quick edit passes the quantity for volume pricing
+                price = vendor.get_price(item.name, qty if quick_edit else 1)
+                price_str = f"${price:.2f}" if price else "N/A"
+                lines.append(f"  {i}. {vendor_name}: {qty} units @ {price_str} (lead: {lead_time_strs[vendor_name]})")
+    else:
+        lines.append("  (no vendors configured)")
+
+    lines.append(f"\nOptions:")
+    lines.append(f"  1. Add/update vendor (max 3)")
+    if vendor_orders:
+        lines.append(f"  2. Remove vendor")
+        lines.append(f"  3. Clear all vendors")
+    if len(vendor_orders) < 3:
+        lines.append(f"  4. Add multiple vendors at once")
+    lines.append(f"  0. Back to item list")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def item_buy_order_menu(
+    game_state: GameState,
+    player: Player,
+    item: Item,
+    lead_time_reduction: int,
+    quick_edit: bool = False
+) -> None:
+    """
+    Submenu for configuring one item's buy order (up to 3 vendors).
+    Quick edit (used by the combined orders and prices menu) shows volume and discounted
+    vendor prices, clears without confirmation and doesn't pause on an invalid option.
+    """
+    # Vendor names, requirements and lead times don't change while the submenu is open
+    vendor_labels = build_vendor_labels(game_state, lead_time_reduction)
+    lead_time_strs = {vendor.name: lead_time_str for vendor, (_, lead_time_str) in zip(game_state.vendors, vendor_labels)}
+    vendor_discounts = build_vendor_discounts(game_state, player) if quick_edit else None
+
+    # Invalid options and vendor edits that change nothing only repeat the prompt;
+    # the submenu is redrawn after the buy order changes
+    needs_redraw = True
+
+    while True:
+        vendor_orders = player.get_buy_order(item.name)
+
+        if needs_redraw:
+            display_item_buy_order(game_state, item, vendor_orders, lead_time_strs, quick_edit)
+        needs_redraw = True
+
+        sub_choice = input(f"\nSelect option: ").strip()
+
+        if sub_choice == "0":
+            break
+        elif sub_choice == "1" and len(vendor_orders) >= 3:
+            needs_redraw = update_buy_order_vendor(game_state, player, item, vendor_orders, vendor_labels, vendor_discounts)
+        elif sub_choice == "1":
+            needs_redraw = add_buy_order_vendor(game_state, player, item, vendor_labels, vendor_discounts)
+        elif sub_choice == "2" and vendor_orders:
+            needs_redraw = remove_buy_order_vendor(player, item, vendor_orders)
+        elif sub_choice == "3" and vendor_orders:
+            # Clear all vendors
+            if quick_edit or input(f"\nClear all vendors for {item.name}? (y/n): ").strip().lower() == 'y':
+                player.clear_buy_order(item.name)
+                print(f"\n✓ Cleared all buy orders for {item.name}")
+        elif sub_choice == "4" and len(vendor_orders) < 3:
+            add_multiple_buy_order_vendors(game_state, player, item, vendor_orders, vendor_labels, vendor_discounts)
+        else:
+            print("\n✗ Invalid option!")
+            if not quick_edit:
+                input("Press Enter to continue...")
+            needs_redraw = False
+
+
 def configure_orders_and_prices_menu(game_state: GameState, player: Player) -> None:
     """Combined menu for configuring buy orders and sell prices."""
+    # Upgrades can't be bought from this menu, so the lead time reduction is fixed while it is open
+    lead_time_reduction = int(player.get_upgrade_effect_total("lead_time_reduction"))
+
     while True:
         print("\n" + "=" * 120)
         print("CONFIGURE BUY ORDERS AND SALE PRICES")
@@ -5102,6 +5810,9 @@ def configure_orders_and_prices_menu(game_state: GameState, player: Player) -> N
         print(f"\n{'Item':<15} {'Qty':>6} {'Market':>8} {'Buy Qty':>8} {'Vendors (qty each)':>40} {'Vend $':>8} {'Sell $':>8}")
         print("-" * 140)
 
+        # Vendor discounts scan the player's upgrades, so look each vendor up once per redraw
+        vendor_discounts: Dict[str, float] = {}
+
         for item in game_state.items:
             # Get current inventory quantity
             inv_qty = player.inventory.get(item.name, 0)
@@ -5138,15 +5849,17 @@ def configure_orders_and_prices_menu(game_state: GameState, player: Player) -> N
                 # Find cheapest vendor price among all orders (using their ordered quantities)
                 cheapest_price = float('inf')
                 for qty, vendor_name in vendor_orders:
-                    for vendor in game_state.vendors:
-                        if vendor.name == vendor_name:
-                            price = vendor.get_price(item.name, qty)  # Pass quantity for volume pricing
-                            if price:
+                    vendor = game_state.get_vendor(vendor_name)
+                    if vendor:
+                        price = vendor.get_price(item.name, qty)  # Pass quantity for volume pricing
+                        if price:
+                            discount = vendor_discounts.get(vendor_name)
+                            if discount is None:
                                 discount = player.get_vendor_discount(vendor_name, game_state.day)
-                                actual_price = price * (1 - discount)
-                                if actual_price < cheapest_price:
-                                    cheapest_price = actual_price
-                            break
+                                vendor_discounts[vendor_name] = discount
+                            actual_price = price * (1 - discount)
+                            if actual_price < cheapest_price:
+                                cheapest_price = actual_price
                 if cheapest_price < float('inf'):
                     vendor_buy_price = cheapest_price
 
@@ -5195,293 +5908,7 @@ def configure_orders_and_prices_menu(game_state: GameState, player: Player) -> N
                         item = game_state.items[item_num - 1]
 
                         # Item configuration submenu (supports up to 3 vendors)
-                        while True:
-                            print(f"\n{'='*80}")
-                            print(f"Configuring Buy Orders for: {item.name}")
-                            print(f"{'='*80}")
-
-                            vendor_orders = player.get_buy_order(item.name)
-                            print(f"\nCurrent orders ({len(vendor_orders)}/3 vendors):")
-                            if vendor_orders:
-                                for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                                    # Get vendor price and lead time
-                                    vendor = next((v for v in game_state.vendors if v.name == vendor_name), None)
-                                    if vendor:
-                                        price = vendor.get_price(item.name, qty)  # Pass quantity for volume pricing
-                                        # Calculate effective lead time with player's upgrades
-                                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                        price_str = f"${price:.2f}" if price else "N/A"
-                                        print(f"  {i}. {vendor_name}: {qty} units @ {price_str} (lead: {lead_time_str})")
-                            else:
-                                print("  (no vendors configured)")
-
-                            print(f"\nOptions:")
-                            print(f"  1. Add/update vendor (max 3)")
-                            if vendor_orders:
-                                print(f"  2. Remove vendor")
-                                print(f"  3. Clear all vendors")
-                            if len(vendor_orders) < 3:
-                                print(f"  4. Add multiple vendors at once")
-                            print(f"  0. Back to item list")
-
-                            sub_choice = input(f"\nSelect option: ").strip()
-
-                            if sub_choice == "0":
-                                break
-                            elif sub_choice == "1":
-                                # Add/update vendor
-                                if len(vendor_orders) >= 3:
-                                    print(f"\n⚠ Already have 3 vendors. Select a vendor to update:")
-                                    for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                                        print(f"  {i}. {vendor_name}")
-                                    print(f"  0. Cancel")
-
-                                    update_choice = input(f"\nSelect vendor to update (0-{len(vendor_orders)}): ").strip()
-                                    try:
-                                        update_num = int(update_choice)
-                                        if update_num == 0:
-                                            continue
-                                        elif 1 <= update_num <= len(vendor_orders):
-                                            # User wants to update this vendor
-                                            qty_to_update, vendor_to_update = vendor_orders[update_num - 1]
-                                            print(f"\nUpdating: {vendor_to_update} (currently {qty_to_update} units)")
-
-                                            # Show vendor list
-                                            print("\nAvailable Vendors:")
-                                            for i, vendor in enumerate(game_state.vendors, 1):
-                                                price = vendor.get_price(item.name, 1)  # Show base price
-                                                min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                                                vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                                                req_parts = []
-                                                if vendor.required_reputation:
-                                                    req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                                                if vendor.required_level:
-                                                    req_parts.append(f"lvl: {vendor.required_level}")
-                                                rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                                                # Calculate effective lead time with player's upgrades
-                                                lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                                effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                                lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                                if price:
-                                                    discount = player.get_vendor_discount(vendor.name, game_state.day)
-                                                    final_price = price * (1 - discount)
-                                                    discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                                                    print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                                                else:
-                                                    status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                                    print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                                            vendor_choice = input(f"\nSelect new vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
-                                            vendor_num = int(vendor_choice)
-                                            if vendor_num == 0:
-                                                continue
-                                            elif 1 <= vendor_num <= len(game_state.vendors):
-                                                selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                                quantity_str = input(f"Enter new quantity (0 to remove): ").strip()
-                                                quantity = int(quantity_str)
-
-                                                if quantity == 0:
-                                                    # Remove this vendor
-                                                    player.remove_vendor_from_buy_order(item.name, vendor_to_update)
-                                                    print(f"\n✓ Removed {vendor_to_update} from buy order")
-                                                elif quantity > 0:
-                                                    # Check minimum purchase
-                                                    if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                                        print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                                        input("Press Enter to continue...")
-                                                        continue
-
-                                                    # Remove old vendor and add new one
-                                                    player.remove_vendor_from_buy_order(item.name, vendor_to_update)
-                                                    player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                                    print(f"\n✓ Updated: {quantity} {item.name} from {selected_vendor.name}")
-                                                else:
-                                                    print("\n✗ Quantity must be non-negative!")
-                                                    input("Press Enter to continue...")
-                                        else:
-                                            print("\n✗ Invalid selection!")
-                                            input("Press Enter to continue...")
-                                    except ValueError:
-                                        print("\n✗ Invalid input!")
-                                        input("Press Enter to continue...")
-                                else:
-                                    # Add new vendor
-                                    print("\nAvailable Vendors:")
-                                    for i, vendor in enumerate(game_state.vendors, 1):
-                                        price = vendor.get_price(item.name, 1)  # Show base price
-                                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                                        req_parts = []
-                                        if vendor.required_reputation:
-                                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                                        if vendor.required_level:
-                                            req_parts.append(f"lvl: {vendor.required_level}")
-                                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                                        # Calculate effective lead time with player's upgrades
-                                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                        if price:
-                                            discount = player.get_vendor_discount(vendor.name, game_state.day)
-                                            final_price = price * (1 - discount)
-                                            discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                                        else:
-                                            status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                                    vendor_choice = input(f"\nEnter vendor number and quantity (e.g., '2 100'), or just vendor number (0 to cancel): ").strip()
-                                    try:
-                                        # Parse input - support both "vendor_num quantity" and just "vendor_num"
-                                        parts = vendor_choice.split()
-                                        vendor_num = int(parts[0])
-
-                                        if vendor_num == 0:
-                                            continue
-                                        elif 1 <= vendor_num <= len(game_state.vendors):
-                                            selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                            # Get quantity - either from second part or prompt
-                                            if len(parts) >= 2:
-                                                quantity = int(parts[1])
-                                            else:
-                                                quantity_str = input(f"Enter quantity to buy: ").strip()
-                                                quantity = int(quantity_str)
-
-                                            if quantity > 0:
-                                                # Check minimum purchase
-                                                if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                                    print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                                    input("Press Enter to continue...")
-                                                    continue
-
-                                                success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                                if success:
-                                                    print(f"\n✓ Added: {quantity} {item.name} from {selected_vendor.name}")
-                                                else:
-                                                    print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
-                                                    input("Press Enter to continue...")
-                                            else:
-                                                print("\n✗ Quantity must be positive!")
-                                                input("Press Enter to continue...")
-                                        else:
-                                            print("\n✗ Invalid vendor selection!")
-                                            input("Press Enter to continue...")
-                                    except ValueError:
-                                        print("\n✗ Invalid input!")
-                                        input("Press Enter to continue...")
-
-                            elif sub_choice == "2" and vendor_orders:
-                                # Remove vendor
-                                print("\nSelect vendor to remove:")
-                                for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                                    print(f"  {i}. {vendor_name} ({qty} units)")
-                                print(f"  0. Cancel")
-
-                                remove_choice = input(f"\nSelect vendor (0-{len(vendor_orders)}): ").strip()
-                                try:
-                                    remove_num = int(remove_choice)
-                                    if remove_num == 0:
-                                        continue
-                                    elif 1 <= remove_num <= len(vendor_orders):
-                                        qty, vendor_name = vendor_orders[remove_num - 1]
-                                        player.remove_vendor_from_buy_order(item.name, vendor_name)
-                                        print(f"\n✓ Removed {vendor_name} from buy order")
-                                    else:
-                                        print("\n✗ Invalid selection!")
-                                        input("Press Enter to continue...")
-                                except ValueError:
-                                    print("\n✗ Invalid input!")
-                                    input("Press Enter to continue...")
-
-                            elif sub_choice == "3" and vendor_orders:
-                                # Clear all vendors
-                                player.clear_buy_order(item.name)
-                                print(f"\n✓ Cleared all buy orders for {item.name}")
-
-                            elif sub_choice == "4" and len(vendor_orders) < 3:
-                                # Add multiple vendors at once
-                                print("\nAvailable Vendors:")
-                                for i, vendor in enumerate(game_state.vendors, 1):
-                                    price = vendor.get_price(item.name, 1)  # Show base price
-                                    min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                                    vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                                    req_parts = []
-                                    if vendor.required_reputation:
-                                        req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                                    if vendor.required_level:
-                                        req_parts.append(f"lvl: {vendor.required_level}")
-                                    rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                                    # Calculate effective lead time with player's upgrades
-                                    lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                    effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                    lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                    if price:
-                                        discount = player.get_vendor_discount(vendor.name, game_state.day)
-                                        final_price = price * (1 - discount)
-                                        discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                                        print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                                    else:
-                                        status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                        print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                                slots_available = 3 - len(vendor_orders)
-                                print(f"\nEnter up to {slots_available} vendor(s) in format: vendor_number quantity")
-                                print(f"One per line, or press Enter to finish")
-
-                                vendors_added = 0
-                                while vendors_added < slots_available:
-                                    try:
-                                        vendor_input = input(f"\nVendor {vendors_added + 1} (or Enter to finish): ").strip()
-                                        if not vendor_input:
-                                            break
-
-                                        parts = vendor_input.split()
-                                        if len(parts) != 2:
-                                            print("\n✗ Invalid format! Use: vendor_number quantity (e.g., '2 100')")
-                                            continue
-
-                                        vendor_num = int(parts[0])
-                                        quantity = int(parts[1])
-
-                                        if vendor_num < 1 or vendor_num > len(game_state.vendors):
-                                            print(f"\n✗ Invalid vendor number! Must be 1-{len(game_state.vendors)}")
-                                            continue
-
-                                        selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                        if quantity <= 0:
-                                            print("\n✗ Quantity must be positive!")
-                                            continue
-
-                                        # Check minimum purchase
-                                        if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                            print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                            continue
-
-                                        success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                        if success:
-                                            print(f"✓ Added: {quantity} {item.name} from {selected_vendor.name}")
-                                            vendors_added += 1
-                                            # Update vendor_orders for current display
-                                            vendor_orders = player.get_buy_order(item.name)
-                                        else:
-                                            print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
-
-                                    except ValueError:
-                                        print("\n✗ Invalid input! Use numbers only (e.g., '2 100')")
-                                    except Exception as e:
-                                        print(f"\n✗ Error: {e}")
-
-                                if vendors_added > 0:
-                                    print(f"\n✓ Successfully added {vendors_added} vendor(s)")
-                                    input("Press Enter to continue...")
-
-                            else:
-                                print("\n✗ Invalid option!")
+                        item_buy_order_menu(game_state, player, item, lead_time_reduction, quick_edit=True)
                 else:
                     print("\n✗ Invalid item selection!")
 
@@ -5492,6 +5919,28 @@ def configure_orders_and_prices_menu(game_state: GameState, player: Player) -> N
             print("\n✗ Invalid input!")
 
 
+def display_buy_order_table(game_state: GameState, player: Player) -> None:
+    """Print the manual buy order banner, every item's current orders and the item picker."""
+    lines = [
+        "\n" + "=" * 100,
+        "MANUAL BUY ORDER MENU - Configure Automatic Purchasing (Up to 3 Vendors Per Item)",
+        "=" * 100,
+        "⚠ REQUIREMENT: Total warehouse space in orders must be ≥ 1000 to execute",
+        "=" * 100,
+        "\nCurrent Buy Orders:",
+        f"{'Item':<15} {'Total Qty':>10} {'Vendors':<70}",
+        "-" * 100,
+    ]
+
+    summaries = [(item.name, player.get_buy_order_summary(item.name)) for item in game_state.items]
+    lines.extend(f"{name:<15} {total_qty:>10} {vendor_display:<70}" for name, (total_qty, vendor_display) in summaries)
+
+    lines.append("\nSelect item to configure:")
+    lines.extend(f"  {i}. {item.name}" for i, item in enumerate(game_state.items, 1))
+    lines.append(f"  0. Back to Main Menu")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def buy_order_menu(game_state: GameState, player: Player) -> None:
     """Menu for setting buy orders (quantity and vendor selection per item) - supports up to 3 vendors per item."""
     # Check level requirement
@@ -5505,354 +5954,62 @@ def buy_order_menu(game_state: GameState, player: Player) -> None:
         input("\nPress Enter to continue...")
         return
 
-    while True:
-        print("\n" + "=" * 100)
-        print("MANUAL BUY ORDER MENU - Configure Automatic Purchasing (Up to 3 Vendors Per Item)")
-        print("=" * 100)
-        print("⚠ REQUIREMENT: Total warehouse space in orders must be ≥ 1000 to execute")
-        print("=" * 100)
-        print("\nCurrent Buy Orders:")
-        print(f"{'Item':<15} {'Total Qty':>10} {'Vendors':<70}")
-        print("-" * 100)
-
-        for item in game_state.items:
-            vendor_orders = player.get_buy_order(item.name)
-            total_qty = sum(q for q, v in vendor_orders)
-            if vendor_orders:
-                vendor_strs = [f"{v} ({q})" for q, v in vendor_orders]
-                vendor_display = ", ".join(vendor_strs)
-            else:
-                vendor_display = "(none)"
-            print(f"{item.name:<15} {total_qty:>10} {vendor_display:<70}")
-
-        print("\nSelect item to configure:")
-        for i, item in enumerate(game_state.items, 1):
-            print(f"  {i}. {item.name}")
-        print(f"  0. Back to Main Menu")
-
-        try:
-            choice = input(f"\nSelect item (0-{len(game_state.items)}): ")
-            choice_num = int(choice)
-
-            if choice_num == 0:
-                break
-
-            if 1 <= choice_num <= len(game_state.items):
-                item = game_state.items[choice_num - 1]
-
-                # Item configuration submenu
-                while True:
-                    print(f"\n{'='*80}")
-                    print(f"Configuring Buy Orders for: {item.name}")
-                    print(f"{'='*80}")
-
-                    vendor_orders = player.get_buy_order(item.name)
-                    print(f"\nCurrent orders ({len(vendor_orders)}/3 vendors):")
-                    if vendor_orders:
-                        for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                            # Get vendor price and lead time
-                            vendor = game_state.get_vendor(vendor_name)
-                            if vendor:
-                                price = vendor.get_price(item.name)
-                                # Calculate effective lead time with player's upgrades
-                                lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                price_str = f"${price:.2f}" if price else "N/A"
-                                print(f"  {i}. {vendor_name}: {qty} units @ {price_str} (lead: {lead_time_str})")
-                    else:
-                        print("  (no vendors configured)")
-
-                    print(f"\nOptions:")
-                    print(f"  1. Add/update vendor (max 3)")
-                    if vendor_orders:
-                        print(f"  2. Remove vendor")
-                        print(f"  3. Clear all vendors")
-                    if len(vendor_orders) < 3:
-                        print(f"  4. Add multiple vendors at once")
-                    print(f"  0. Back to item list")
-
-                    sub_choice = input(f"\nSelect option: ").strip()
-
-                    if sub_choice == "0":
-                        break
-                    elif sub_choice == "1":
-                        # Add/update vendor
-                        if len(vendor_orders) >= 3:
-                            print(f"\n⚠ Already have 3 vendors. Select a vendor to update:")
-                            for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                                print(f"  {i}. {vendor_name}")
-                            print(f"  0. Cancel")
-
-                            update_choice = input(f"\nSelect vendor to update (0-{len(vendor_orders)}): ").strip()
-                            try:
-                                update_num = int(update_choice)
-                                if update_num == 0:
-                                    continue
-                                elif 1 <= update_num <= len(vendor_orders):
-                                    # User wants to update this vendor
-                                    qty_to_update, vendor_to_update = vendor_orders[update_num - 1]
-                                    print(f"\nUpdating: {vendor_to_update} (currently {qty_to_update} units)")
-
-                                    # Show vendor list
-                                    print("\nAvailable Vendors:")
-                                    for i, vendor in enumerate(game_state.vendors, 1):
-                                        price = vendor.get_price(item.name, 1)  # Show base price
-                                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                                        req_parts = []
-                                        if vendor.required_reputation:
-                                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                                        if vendor.required_level:
-                                            req_parts.append(f"lvl: {vendor.required_level}")
-                                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                                        # Calculate effective lead time with player's upgrades
-                                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                        if price:
-                                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${price:.2f} (lead: {lead_time_str})")
-                                        else:
-                                            status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                                    vendor_choice = input(f"\nSelect new vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
-                                    vendor_num = int(vendor_choice)
-                                    if vendor_num == 0:
-                                        continue
-                                    elif 1 <= vendor_num <= len(game_state.vendors):
-                                        selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                        quantity_str = input(f"Enter new quantity (0 to remove): ").strip()
-                                        quantity = int(quantity_str)
-
-                                        if quantity == 0:
-                                            # Remove this vendor
-                                            player.remove_vendor_from_buy_order(item.name, vendor_to_update)
-                                            print(f"\n✓ Removed {vendor_to_update} from buy order")
-                                        elif quantity > 0:
-                                            # Check minimum purchase
-                                            if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                                print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                                input("Press Enter to continue...")
-                                                continue
-
-                                            # Remove old vendor and add new one
-                                            player.remove_vendor_from_buy_order(item.name, vendor_to_update)
-                                            player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                            print(f"\n✓ Updated: {quantity} {item.name} from {selected_vendor.name}")
-                                        else:
-                                            print("\n✗ Quantity must be non-negative!")
-                                            input("Press Enter to continue...")
-                                else:
-                                    print("\n✗ Invalid selection!")
-                                    input("Press Enter to continue...")
-                            except ValueError:
-                                print("\n✗ Invalid input!")
-                                input("Press Enter to continue...")
-                        else:
-                            # Add new vendor
-                            print("\nAvailable Vendors:")
-                            for i, vendor in enumerate(game_state.vendors, 1):
-                                price = vendor.get_price(item.name, 1)  # Show base price
-                                min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                                vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                                req_parts = []
-                                if vendor.required_reputation:
-                                    req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                                if vendor.required_level:
-                                    req_parts.append(f"lvl: {vendor.required_level}")
-                                rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                                # Calculate effective lead time with player's upgrades
-                                lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                                effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                                lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                                if price:
-                                    print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${price:.2f} (lead: {lead_time_str})")
-                                else:
-                                    status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                    print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                            vendor_choice = input(f"\nEnter vendor number and quantity (e.g., '2 100'), or just vendor number (0 to cancel): ").strip()
-                            try:
-                                # Parse input - support both "vendor_num quantity" and just "vendor_num"
-                                parts = vendor_choice.split()
-                                vendor_num = int(parts[0])
-
-                                if vendor_num == 0:
-                                    continue
-                                elif 1 <= vendor_num <= len(game_state.vendors):
-                                    selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                    # Get quantity - either from second part or prompt
-                                    if len(parts) >= 2:
-                                        quantity = int(parts[1])
-                                    else:
-                                        quantity_str = input(f"Enter quantity to buy: ").strip()
-                                        quantity = int(quantity_str)
-
-                                    if quantity > 0:
-                                        # Check minimum purchase
-                                        if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                            print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                            input("Press Enter to continue...")
-                                            continue
-
-                                        success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                        if success:
-                                            print(f"\n✓ Added: {quantity} {item.name} from {selected_vendor.name}")
-                                        else:
-                                            print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
-                                            input("Press Enter to continue...")
-                                    else:
-                                        print("\n✗ Quantity must be positive!")
-                                        input("Press Enter to continue...")
-                                else:
-                                    print("\n✗ Invalid vendor selection!")
-                                    input("Press Enter to continue...")
-                            except ValueError:
-                                print("\n✗ Invalid input!")
-                                input("Press Enter to continue...")
-
-                    elif sub_choice == "2" and vendor_orders:
-                        # Remove vendor
-                        print("\nSelect vendor to remove:")
-                        for i, (qty, vendor_name) in enumerate(vendor_orders, 1):
-                            print(f"  {i}. {vendor_name} ({qty} units)")
-                        print(f"  0. Cancel")
-
-                        remove_choice = input(f"\nSelect vendor (0-{len(vendor_orders)}): ").strip()
-                        try:
-                            remove_num = int(remove_choice)
-                            if remove_num == 0:
-                                continue
-                            elif 1 <= remove_num <= len(vendor_orders):
-                                qty, vendor_name = vendor_orders[remove_num - 1]
-                                player.remove_vendor_from_buy_order(item.name, vendor_name)
-                                print(f"\n✓ Removed {vendor_name} from buy order")
-                            else:
-                                print("\n✗ Invalid selection!")
-                                input("Press Enter to continue...")
-                        except ValueError:
-                            print("\n✗ Invalid input!")
-                            input("Press Enter to continue...")
-
-                    elif sub_choice == "3" and vendor_orders:
-                        # Clear all vendors
-                        confirm = input(f"\nClear all vendors for {item.name}? (y/n): ").strip().lower()
-                        if confirm == 'y':
-                            player.clear_buy_order(item.name)
-                            print(f"\n✓ Cleared all buy orders for {item.name}")
-
-                    elif sub_choice == "4" and len(vendor_orders) < 3:
-                        # Add multiple vendors at once
-                        print("\nAvailable Vendors:")
-                        for i, vendor in enumerate(game_state.vendors, 1):
-                            price = vendor.get_price(item.name, 1)  # Show base price
-                            min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                            vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                            req_parts = []
-                            if vendor.required_reputation:
-                                req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                            if vendor.required_level:
-                                req_parts.append(f"lvl: {vendor.required_level}")
-                            rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                            # Calculate effective lead time with player's upgrades
-                            lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                            effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                            lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                            if price:
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ${price:.2f} (lead: {lead_time_str})")
-                            else:
-                                status = "(not in stock today)" if vendor.selection_type == "random_daily" else "(not available)"
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - {status}")
-
-                        slots_available = 3 - len(vendor_orders)
-                        print(f"\nEnter up to {slots_available} vendor(s) in format: vendor_number quantity")
-                        print(f"One per line, or press Enter to finish")
-
-                        vendors_added = 0
-                        while vendors_added < slots_available:
-                            try:
-                                vendor_input = input(f"\nVendor {vendors_added + 1} (or Enter to finish): ").strip()
-                                if not vendor_input:
-                                    break
-
-                                parts = vendor_input.split()
-                                if len(parts) != 2:
-                                    print("\n✗ Invalid format! Use: vendor_number quantity (e.g., '2 100')")
-                                    continue
-
-                                vendor_num = int(parts[0])
-                                quantity = int(parts[1])
-
-                                if vendor_num < 1 or vendor_num > len(game_state.vendors):
-                                    print(f"\n✗ Invalid vendor number! Must be 1-{len(game_state.vendors)}")
-                                    continue
-
-                                selected_vendor = game_state.vendors[vendor_num - 1]
-
-                                if quantity <= 0:
-                                    print("\n✗ Quantity must be positive!")
-                                    continue
-
-                                # Check minimum purchase
-                                if selected_vendor.min_purchase is not None and quantity < selected_vendor.min_purchase:
-                                    print(f"\n✗ {selected_vendor.name} requires minimum {selected_vendor.min_purchase} units")
-                                    continue
-
-                                success = player.add_vendor_to_buy_order(item.name, quantity, selected_vendor.name)
-                                if success:
-                                    print(f"✓ Added: {quantity} {item.name} from {selected_vendor.name}")
-                                    vendors_added += 1
-                                    # Update vendor_orders for current display
-                                    vendor_orders = player.get_buy_order(item.name)
-                                else:
-                                    print(f"\n✗ Failed to add vendor (limit reached or duplicate)")
-
-                            except ValueError:
-                                print("\n✗ Invalid input! Use numbers only (e.g., '2 100')")
-                            except Exception as e:
-                                print(f"\n✗ Error: {e}")
+    # Upgrades can't be bought from this menu, so the lead time reduction is fixed while it is open
+    lead_time_reduction = int(player.get_upgrade_effect_total("lead_time_reduction"))
+    # Invalid selections only repeat the prompt instead of redrawing the full table
+    needs_redraw = True
 
-                        if vendors_added > 0:
-                            print(f"\n✓ Successfully added {vendors_added} vendor(s)")
-                            input("Press Enter to continue...")
+    while True:
+        if needs_redraw:
+            display_buy_order_table(game_state, player)
+        needs_redraw = True
 
-                    else:
-                        print("\n✗ Invalid option!")
-                        input("Press Enter to continue...")
-            else:
-                print("\n✗ Invalid item selection!")
+        choice_num = parse_int_input(input(f"\nSelect item (0-{len(game_state.items)}): "))
 
-        except (ValueError, IndexError):
+        if choice_num is None:
             print("\n✗ Invalid input!")
+            needs_redraw = False
+        elif choice_num == 0:
+            break
+        elif 1 <= choice_num <= len(game_state.items):
+            item = game_state.items[choice_num - 1]
+
+            # Item configuration submenu
+            item_buy_order_menu(game_state, player, item, lead_time_reduction)
+        else:
+            print("\n✗ Invalid item selection!")
+            needs_redraw = False
 
 
 def recurring_buy_order_menu(game_state: GameState, player: Player) -> None:
     """Menu for managing recurring buy orders (scheduled auto-buy every N days)."""
+    vendor_labels = build_vendor_labels(game_state, int(player.get_upgrade_effect_total("lead_time_reduction")))
+    vendor_discounts = build_vendor_discounts(game_state, player)
+
     while True:
-        print("\n" + "=" * 100)
-        print("RECURRING BUY ORDERS - Automatic Purchasing Every N Days")
-        print("=" * 100)
-        print("\nCurrent Recurring Orders:")
+        lines = [
+            "\n" + "=" * 100,
+            "RECURRING BUY ORDERS - Automatic Purchasing Every N Days",
+            "=" * 100,
+            "\nCurrent Recurring Orders:",
+        ]
 
         if not player.recurring_buy_orders:
-            print("  (no recurring orders set)")
+            lines.append("  (no recurring orders set)")
         else:
-            print(f"{'#':<4} {'Item':<20} {'Vendor':<25} {'Qty':>8} {'Every':>8} {'Last Run':>10}")
-            print("-" * 100)
+            lines.append(f"{'#':<4} {'Item':<20} {'Vendor':<25} {'Qty':>8} {'Every':>8} {'Last Run':>10}")
+            lines.append("-" * 100)
             for i, order in enumerate(player.recurring_buy_orders, 1):
-                days_since = game_state.day - order.last_executed_day
                 last_run_str = f"Day {order.last_executed_day}" if order.last_executed_day > 0 else "Never"
-                print(f"{i:<4} {order.item_name:<20} {order.vendor_name:<25} {order.quantity:>8} {order.interval_days}d {last_run_str:>10}")
+                lines.append(f"{i:<4} {order.item_name:<20} {order.vendor_name:<25} {order.quantity:>8} {order.interval_days}d {last_run_str:>10}")
 
-        print("\nOptions:")
-        print("  1. Add New Recurring Order")
+        lines.append("\nOptions:")
+        lines.append("  1. Add New Recurring Order")
         if player.recurring_buy_orders:
-            print("  2. Edit Existing Recurring Order (change vendor/qty/interval)")
-            print("  3. Cancel Recurring Order (costs $500)")
-        print("  0. Back to Auto Buy Menu")
+            lines.append("  2. Edit Existing Recurring Order (change vendor/qty/interval)")
+            lines.append("  3. Cancel Recurring Order (costs $500)")
+        lines.append("  0. Back to Auto Buy Menu")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         try:
             choice = input("\nSelect option: ").strip()
@@ -5876,32 +6033,7 @@ def recurring_buy_order_menu(game_state: GameState, player: Player) -> None:
                     item = game_state.items[item_num - 1]
 
                     # Select vendor
-                    print("\nAvailable Vendors:")
-                    for i, vendor in enumerate(game_state.vendors, 1):
-                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                        req_parts = []
-                        if vendor.required_reputation:
-                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                        if vendor.required_level:
-                            req_parts.append(f"lvl: {vendor.required_level}")
-                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                        # Calculate effective lead time with player's upgrades
-                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-
-                        # Check if vendor would sell this item based on their criteria
-                        market_price = game_state.market_prices.get(item.name, item.base_price)
-                        if vendor_would_sell_item(vendor, item, market_price):
-                            # Calculate estimated price
-                            estimated_price = market_price * vendor.pricing_multiplier
-                            discount = player.get_vendor_discount(vendor.name, game_state.day)
-                            final_price = estimated_price * (1 - discount)
-                            discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ~${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                        else:
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - (not available)")
+                    display_vendor_estimates(game_state, vendor_labels, vendor_discounts, item)
 
                     vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
                     vendor_num = int(vendor_choice)
@@ -5971,38 +6103,13 @@ def recurring_buy_order_menu(game_state: GameState, player: Player) -> None:
                         continue
                     elif edit_option in ["1", "4"]:
                         # Change vendor
-                        print("\nAvailable Vendors:")
                         # Get the item object for this order
                         order_item = game_state.items_by_name.get(order_to_edit.item_name)
                         if not order_item:
                             print(f"Error: Item {order_to_edit.item_name} not found!")
                             continue
 
-                        for i, vendor in enumerate(game_state.vendors, 1):
-                            min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                            vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                            req_parts = []
-                            if vendor.required_reputation:
-                                req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                            if vendor.required_level:
-                                req_parts.append(f"lvl: {vendor.required_level}")
-                            rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                            # Calculate effective lead time with player's upgrades
-                            lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                            effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                            lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-
-                            # Check if vendor would sell this item based on their criteria
-                            market_price = game_state.market_prices.get(order_to_edit.item_name, order_item.base_price)
-                            if vendor_would_sell_item(vendor, order_item, market_price):
-                                # Calculate estimated price
-                                estimated_price = market_price * vendor.pricing_multiplier
-                                discount = player.get_vendor_discount(vendor.name, game_state.day)
-                                final_price = estimated_price * (1 - discount)
-                                discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ~${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                            else:
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - (not available)")
+                        display_vendor_estimates(game_state, vendor_labels, vendor_discounts, order_item)
 
                         vendor_choice = input(f"\nSelect new vendor (1-{len(game_state.vendors)}, 0 to keep current): ").strip()
                         vendor_num = int(vendor_choice)
@@ -6067,30 +6174,35 @@ def recurring_buy_order_menu(game_state: GameState, player: Player) -> None:
 
 def category_recurring_buy_order_menu(game_state: GameState, player: Player) -> None:
     """Menu for managing recurring buy orders for entire categories (scheduled auto-buy every N days)."""
+    vendor_labels = build_vendor_labels(game_state, int(player.get_upgrade_effect_total("lead_time_reduction")))
+    vendor_discounts = build_vendor_discounts(game_state, player)
+
     while True:
-        print("\n" + "=" * 100)
-        print("CATEGORY RECURRING BUY ORDERS - Automatic Category Purchasing Every N Days")
-        print("=" * 100)
-        print("\nCurrent Category Recurring Orders:")
+        lines = [
+            "\n" + "=" * 100,
+            "CATEGORY RECURRING BUY ORDERS - Automatic Category Purchasing Every N Days",
+            "=" * 100,
+            "\nCurrent Category Recurring Orders:",
+        ]
 
         if not player.category_recurring_buy_orders:
-            print("  (no category recurring orders set)")
+            lines.append("  (no category recurring orders set)")
         else:
-            print(f"{'#':<4} {'Category':<25} {'Vendor':<25} {'Qty/Item':>10} {'Every':>8} {'Last Run':>10}")
-            print("-" * 100)
+            lines.append(f"{'#':<4} {'Category':<25} {'Vendor':<25} {'Qty/Item':>10} {'Every':>8} {'Last Run':>10}")
+            lines.append("-" * 100)
             for i, order in enumerate(player.category_recurring_buy_orders, 1):
-                days_since = game_state.day - order.last_executed_day
                 last_run_str = f"Day {order.last_executed_day}" if order.last_executed_day > 0 else "Never"
                 # Count items in category
-                item_count = len([item for item in game_state.items if item.category == order.category_name])
-                print(f"{i:<4} {order.category_name:<25} {order.vendor_name:<25} {order.quantity_per_item:>10} {order.interval_days}d {last_run_str:>10} ({item_count} items)")
+                item_count = len(game_state.items_by_category.get(order.category_name, []))
+                lines.append(f"{i:<4} {order.category_name:<25} {order.vendor_name:<25} {order.quantity_per_item:>10} {order.interval_days}d {last_run_str:>10} ({item_count} items)")
 
-        print("\nOptions:")
-        print("  1. Add New Category Recurring Order")
+        lines.append("\nOptions:")
+        lines.append("  1. Add New Category Recurring Order")
         if player.category_recurring_buy_orders:
-            print("  2. Edit Existing Category Recurring Order (change vendor/qty/interval)")
-            print("  3. Cancel Category Recurring Order (costs $500)")
-        print("  0. Back to Auto Buy Menu")
+            lines.append("  2. Edit Existing Category Recurring Order (change vendor/qty/interval)")
+            lines.append("  3. Cancel Category Recurring Order (costs $500)")
+        lines.append("  0. Back to Auto Buy Menu")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         try:
             choice = input("\nSelect option: ").strip()
@@ -6100,9 +6212,9 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
             elif choice == "1":
                 # Add new category recurring order
                 print("\nSelect category for recurring order:")
-                categories = sorted(PRODUCT_CATEGORIES.keys())
+                categories = CATEGORIES_ALPHABETICAL
                 for i, category in enumerate(categories, 1):
-                    item_count = len([item for item in game_state.items if item.category == category])
+                    item_count = len(game_state.items_by_category.get(category, []))
                     print(f"  {i}. {category} ({item_count} items)")
                 print("  0. Cancel")
 
@@ -6115,21 +6227,7 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
                     category_name = categories[cat_num - 1]
 
                     # Select vendor
-                    print("\nAvailable Vendors:")
-                    for i, vendor in enumerate(game_state.vendors, 1):
-                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                        req_parts = []
-                        if vendor.required_reputation:
-                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                        if vendor.required_level:
-                            req_parts.append(f"lvl: {vendor.required_level}")
-                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                        # Calculate effective lead time with player's upgrades
-                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                        print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} (lead: {lead_time_str})")
+                    display_vendor_estimates(game_state, vendor_labels, vendor_discounts)
 
                     vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
                     vendor_num = int(vendor_choice)
@@ -6166,7 +6264,7 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
                             last_executed_day=0
                         )
                         player.category_recurring_buy_orders.append(new_order)
-                        item_count = len([item for item in game_state.items if item.category == category_name])
+                        item_count = len(game_state.items_by_category.get(category_name, []))
                         print(f"\n✓ Added category recurring order: {quantity} per item for {category_name} ({item_count} items) from {vendor.name} every {interval} days")
                         input("Press Enter to continue...")
 
@@ -6174,7 +6272,7 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
                 # Edit existing category recurring order
                 print("\nSelect category recurring order to edit:")
                 for i, order in enumerate(player.category_recurring_buy_orders, 1):
-                    item_count = len([item for item in game_state.items if item.category == order.category_name])
+                    item_count = len(game_state.items_by_category.get(order.category_name, []))
                     print(f"  {i}. {order.category_name} ({order.quantity_per_item} per item from {order.vendor_name} every {order.interval_days}d, {item_count} items)")
                 print("  0. Back")
 
@@ -6201,20 +6299,7 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
                         continue
                     elif edit_option in ["1", "4"]:
                         # Change vendor
-                        print("\nAvailable Vendors:")
-                        for i, vendor in enumerate(game_state.vendors, 1):
-                            min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                            vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                            req_parts = []
-                            if vendor.required_reputation:
-                                req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                            if vendor.required_level:
-                                req_parts.append(f"lvl: {vendor.required_level}")
-                            rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                            lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                            effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                            lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} (lead: {lead_time_str})")
+                        display_vendor_estimates(game_state, vendor_labels, vendor_discounts)
 
                         vendor_choice = input(f"\nSelect new vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
                         vendor_num = int(vendor_choice)
@@ -6250,7 +6335,7 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
                 # Cancel category recurring order
                 print("\nSelect category recurring order to cancel:")
                 for i, order in enumerate(player.category_recurring_buy_orders, 1):
-                    item_count = len([item for item in game_state.items if item.category == order.category_name])
+                    item_count = len(game_state.items_by_category.get(order.category_name, []))
                     print(f"  {i}. {order.category_name} ({order.quantity_per_item} per item from {order.vendor_name} every {order.interval_days}d, {item_count} items)")
                 print("  0. Back")
 
@@ -6282,29 +6367,66 @@ def category_recurring_buy_order_menu(game_state: GameState, player: Player) ->
             input("Press Enter to continue...")
 
 
+def select_restock_vendor(game_state: GameState, current_vendor: Optional[str]) -> Optional[str]:
+    """
+    Prompt for an auto-restock vendor after the vendor list has been shown.
+    With a current vendor, 0 keeps it; otherwise 0 cancels. Returns the chosen vendor
+    name, or None if cancelled or invalid. Non-numeric input raises ValueError.
+    """
+    if current_vendor is not None:
+        print(f"\nCurrent vendor: {current_vendor}")
+        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to keep current): ").strip()
+    else:
+        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
+
+    vendor_num = int(vendor_choice)
+
+    if vendor_num == 0:
+        # Keep current vendor, or cancel if there isn't one
+        return current_vendor
+    if 1 <= vendor_num <= len(game_state.vendors):
+        return game_state.vendors[vendor_num - 1].name
+
+    print("\n✗ Invalid vendor selection!")
+    input("Press Enter to continue...")
+    return None
+
+
 def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
     """Menu for managing stock minimum auto-restock (threshold-based auto-buy)."""
+    vendor_labels = build_vendor_labels(game_state, int(player.get_upgrade_effect_total("lead_time_reduction")))
+    vendor_discounts = build_vendor_discounts(game_state, player)
+
     while True:
-        print("\n" + "=" * 100)
-        print("STOCK MINIMUM AUTO-RESTOCK - Automatic Reordering When Stock Falls Below Threshold")
-        print("=" * 100)
-        print("\nCurrent Stock Minimum Settings:")
+        restock = player.stock_minimum_restock
+        inventory = player.inventory
+        items = game_state.items
+
+        lines = [
+            "\n" + "=" * 100,
+            "STOCK MINIMUM AUTO-RESTOCK - Automatic Reordering When Stock Falls Below Threshold",
+            "=" * 100,
+            "\nCurrent Stock Minimum Settings:",
+        ]
 
-        if not player.stock_minimum_restock:
-            print("  (no auto-restock rules set)")
+        if not restock:
+            lines.append("  (no auto-restock rules set)")
         else:
-            print(f"{'Item':<20} {'Current Stock':>15} {'Minimum':>10} {'Vendor':<25}")
-            print("-" * 100)
-            for item_name, (minimum, vendor_name) in player.stock_minimum_restock.items():
-                current = player.inventory.get(item_name, 0)
+            lines.append(f"{'Item':<20} {'Current Stock':>15} {'Minimum':>10} {'Vendor':<25}")
+            lines.append("-" * 100)
+            for item_name, (minimum, vendor_name) in restock.items():
+                current = inventory.get(item_name, 0)
                 status = "✓ OK" if current >= minimum else "⚠ LOW"
-                print(f"{item_name:<20} {current:>15} {minimum:>10} {vendor_name:<25} {status}")
+                lines.append(f"{item_name:<20} {current:>15} {minimum:>10} {vendor_name:<25} {status}")
 
-        print("\nOptions:")
-        print("  1. Set/Update Stock Minimum (setting to 0 removes it and costs $500)")
-        print("  2. Bulk Change Vendor for All Set Items")
-        print("  3. Bulk Change Minimum Quantity for All Set Items")
-        print("  0. Back to Auto Buy Menu")
+        lines.extend([
+            "\nOptions:",
+            "  1. Set/Update Stock Minimum (setting to 0 removes it and costs $500)",
+            "  2. Bulk Change Vendor for All Set Items",
+            "  3. Bulk Change Minimum Quantity for All Set Items",
+            "  0. Back to Auto Buy Menu",
+        ])
+        sys.stdout.write("\n".join(lines) + "\n")
 
         try:
             choice = input("\nSelect option: ").strip()
@@ -6313,28 +6435,15 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
                 break
             elif choice == "2":
                 # Bulk change vendor for all set items
-                if not player.stock_minimum_restock:
+                if not restock:
                     print("\n✗ No auto-restock items configured!")
                     input("Press Enter to continue...")
                     continue
 
                 print("\nBulk Change Vendor - This will change the vendor for ALL currently set items")
-                print(f"Currently configured items: {len(player.stock_minimum_restock)}")
-
-                print("\nAvailable Vendors:")
-                for i, vendor in enumerate(game_state.vendors, 1):
-                    min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                    vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                    req_parts = []
-                    if vendor.required_reputation:
-                        req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                    if vendor.required_level:
-                        req_parts.append(f"lvl: {vendor.required_level}")
-                    rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                    lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                    effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                    lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-                    print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} (lead: {lead_time_str})")
+                print(f"Currently configured items: {len(restock)}")
+
+                display_vendor_estimates(game_state, vendor_labels, vendor_discounts)
 
                 vendor_choice = input(f"\nSelect new vendor for all items (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
                 vendor_num = int(vendor_choice)
@@ -6345,10 +6454,11 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
                     selected_vendor_name = game_state.vendors[vendor_num - 1].name
 
                     # Update all items
-                    updated_count = 0
-                    for item_name, (minimum, old_vendor) in list(player.stock_minimum_restock.items()):
-                        player.stock_minimum_restock[item_name] = (minimum, selected_vendor_name)
-                        updated_count += 1
+                    player.stock_minimum_restock = {
+                        item_name: (minimum, selected_vendor_name)
+                        for item_name, (minimum, old_vendor) in restock.items()
+                    }
+                    updated_count = len(player.stock_minimum_restock)
 
                     print(f"\n✓ Updated vendor to '{selected_vendor_name}' for {updated_count} items")
                     input("Press Enter to continue...")
@@ -6358,13 +6468,13 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
 
             elif choice == "3":
                 # Bulk change minimum quantity for all set items
-                if not player.stock_minimum_restock:
+                if not restock:
                     print("\n✗ No auto-restock items configured!")
                     input("Press Enter to continue...")
                     continue
 
                 print("\nBulk Change Minimum Quantity - This will change the minimum for ALL currently set items")
-                print(f"Currently configured items: {len(player.stock_minimum_restock)}")
+                print(f"Currently configured items: {len(restock)}")
 
                 min_str = input(f"\nSet new minimum quantity for all items (0 to cancel): ").strip()
                 minimum = int(min_str)
@@ -6379,35 +6489,39 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
                     continue
 
                 # Update all items
-                updated_count = 0
-                for item_name, (old_minimum, vendor) in list(player.stock_minimum_restock.items()):
-                    player.stock_minimum_restock[item_name] = (minimum, vendor)
-                    updated_count += 1
+                player.stock_minimum_restock = {
+                    item_name: (minimum, vendor)
+                    for item_name, (old_minimum, vendor) in restock.items()
+                }
+                updated_count = len(player.stock_minimum_restock)
 
                 print(f"\n✓ Updated minimum quantity to {minimum} for {updated_count} items")
                 input("Press Enter to continue...")
 
             elif choice == "1":
                 # Set/Update stock minimum
-                print("\nSelect item to set/update stock minimum:")
-                for i, item in enumerate(game_state.items, 1):
-                    current_inv = player.inventory.get(item.name, 0)
-                    existing = player.stock_minimum_restock.get(item.name)
+                lines = ["\nSelect item to set/update stock minimum:"]
+                get_stock = inventory.get
+                get_restock = restock.get
+                for i, item in enumerate(items, 1):
+                    current_inv = get_stock(item.name, 0)
+                    existing = get_restock(item.name)
                     if existing:
                         min_qty, vendor = existing
-                        print(f"  {i}. {item.name} (stock: {current_inv}, min: {min_qty}, vendor: {vendor})")
+                        lines.append(f"  {i}. {item.name} (stock: {current_inv}, min: {min_qty}, vendor: {vendor})")
                     else:
-                        print(f"  {i}. {item.name} (stock: {current_inv}, no auto-restock set)")
-                print("  0. Cancel")
+                        lines.append(f"  {i}. {item.name} (stock: {current_inv}, no auto-restock set)")
+                lines.append("  0. Cancel")
+                sys.stdout.write("\n".join(lines) + "\n")
 
-                item_choice = input(f"\nSelect item (0-{len(game_state.items)}): ").strip()
+                item_choice = input(f"\nSelect item (0-{len(items)}): ").strip()
                 item_num = int(item_choice)
 
                 if item_num == 0:
                     continue
-                elif 1 <= item_num <= len(game_state.items):
-                    item = game_state.items[item_num - 1]
-                    existing = player.stock_minimum_restock.get(item.name)
+                elif 1 <= item_num <= len(items):
+                    item = items[item_num - 1]
+                    existing = restock.get(item.name)
 
                     # Show current settings if any
                     if existing:
@@ -6428,7 +6542,7 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
 
                     # If setting to 0, this is a removal (costs $500)
                     if minimum == 0:
-                        if item.name in player.stock_minimum_restock:
+                        if existing:
                             cancellation_cost = 500
                             print(f"\n⚠ WARNING: Removing auto-restock costs ${cancellation_cost:.2f}")
                             confirm = input("Type 'yes' to confirm removal: ").strip().lower()
@@ -6436,7 +6550,7 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
                             if confirm == "yes":
                                 if player.cash >= cancellation_cost:
                                     player.cash -= cancellation_cost
-                                    del player.stock_minimum_restock[item.name]
+                                    del restock[item.name]
                                     print(f"\n✓ Auto-restock removed for {item.name}. Paid ${cancellation_cost:.2f} cancellation fee.")
                                 else:
                                     print(f"\n✗ Insufficient cash! Need ${cancellation_cost:.2f}, have ${player.cash:.2f}")
@@ -6450,54 +6564,10 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
                         continue
 
                     # If setting to positive value, select vendor
-                    print("\nAvailable Vendors:")
-                    for i, vendor in enumerate(game_state.vendors, 1):
-                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                        req_parts = []
-                        if vendor.required_reputation:
-                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                        if vendor.required_level:
-                            req_parts.append(f"lvl: {vendor.required_level}")
-                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                        # Calculate effective lead time with player's upgrades
-                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-
-                        # Check if vendor would sell this item based on their criteria
-                        market_price = game_state.market_prices.get(item.name, item.base_price)
-                        if vendor_would_sell_item(vendor, item, market_price):
-                            # Calculate estimated price
-                            estimated_price = market_price * vendor.pricing_multiplier
-                            discount = player.get_vendor_discount(vendor.name, game_state.day)
-                            final_price = estimated_price * (1 - discount)
-                            discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ~${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                        else:
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - (not available)")
-
-                    # If updating, show option to keep current vendor
-                    if existing:
-                        print(f"\nCurrent vendor: {current_vendor}")
-                        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to keep current): ").strip()
-                    else:
-                        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
-
-                    vendor_num = int(vendor_choice)
+                    display_vendor_estimates(game_state, vendor_labels, vendor_discounts, item)
 
-                    if vendor_num == 0:
-                        if existing:
-                            # Keep current vendor
-                            selected_vendor_name = current_vendor
-                        else:
-                            # Cancel
-                            continue
-                    elif 1 <= vendor_num <= len(game_state.vendors):
-                        selected_vendor_name = game_state.vendors[vendor_num - 1].name
-                    else:
-                        print("\n✗ Invalid vendor selection!")
-                        input("Press Enter to continue...")
+                    selected_vendor_name = select_restock_vendor(game_state, existing[1] if existing else None)
+                    if selected_vendor_name is None:
                         continue
 
                     # Check if item is packaged
@@ -6508,7 +6578,7 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
 
                     # Set/update the minimum (free to set up or update)
                     action = "Updated" if existing else "Set"
-                    player.stock_minimum_restock[item.name] = (minimum, selected_vendor_name)
+                    restock[item.name] = (minimum, selected_vendor_name)
                     print(f"\n✓ {action} auto-restock: {item.name} minimum {minimum} from {selected_vendor_name}{package_info}")
                     input("Press Enter to continue...")
 
@@ -6519,26 +6589,42 @@ def stock_minimum_restock_menu(game_state: GameState, player: Player) -> None:
 
 def category_minimum_restock_menu(game_state: GameState, player: Player) -> None:
     """Menu for managing category-wide stock minimum auto-restock."""
+    vendor_labels = build_vendor_labels(game_state, int(player.get_upgrade_effect_total("lead_time_reduction")))
+    vendor_discounts = build_vendor_discounts(game_state, player)
+
+    # The settings screen only changes when a category rule is set or removed
+    screen = None
+
     while True:
-        print("\n" + "=" * 100)
-        print("CATEGORY AUTO-RESTOCK - Automatic Reordering For All Items In A Category")
-        print("=" * 100)
-        print("\nCurrent Category Auto-Restock Settings:")
+        restock = player.category_minimum_restock
+        inventory = player.inventory
+        items_by_category = game_state.items_by_category
+
+        if screen is None:
+            lines = [
+                "\n" + "=" * 100,
+                "CATEGORY AUTO-RESTOCK - Automatic Reordering For All Items In A Category",
+                "=" * 100,
+                "\nCurrent Category Auto-Restock Settings:",
+            ]
 
-        if not player.category_minimum_restock:
-            print("  (no category auto-restock rules set)")
-        else:
-            print(f"{'Category':<25} {'Items in Category':>18} {'Minimum Per Item':>18} {'Vendor':<25}")
-            print("-" * 100)
-            for category_name, (minimum, vendor_name) in player.category_minimum_restock.items():
-                # Count items in this category
-                category_items = [item for item in game_state.items if item.category == category_name]
-                item_count = len(category_items)
-                print(f"{category_name:<25} {item_count:>18} {minimum:>18} {vendor_name:<25}")
+            if not restock:
+                lines.append("  (no category auto-restock rules set)")
+            else:
+                lines.append(f"{'Category':<25} {'Items in Category':>18} {'Minimum Per Item':>18} {'Vendor':<25}")
+                lines.append("-" * 100)
+                for category_name, (minimum, vendor_name) in restock.items():
+                    # Count items in this category
+                    item_count = len(items_by_category.get(category_name, []))
+                    lines.append(f"{category_name:<25} {item_count:>18} {minimum:>18} {vendor_name:<25}")
 
-        print("\nOptions:")
-        print("  1. Set/Update Category Auto-Restock (setting to 0 removes it and costs $500)")
-        print("  0. Back to Auto Buy Menu")
+            lines.extend([
+                "\nOptions:",
+                "  1. Set/Update Category Auto-Restock (setting to 0 removes it and costs $500)",
+                "  0. Back to Auto Buy Menu",
+            ])
+            screen = "\n".join(lines) + "\n"
+        sys.stdout.write(screen)
 
         try:
             choice = input("\nSelect option: ").strip()
@@ -6550,25 +6636,22 @@ def category_minimum_restock_menu(game_state: GameState, player: Player) -> None
                 print("\nSelect category to set/update auto-restock:")
 
                 # Get all unique categories sorted by importance
-                categories_sorted = sorted(PRODUCT_CATEGORIES.keys(), key=lambda c: PRODUCT_CATEGORIES[c], reverse=True)
+                categories_sorted = CATEGORIES_BY_IMPORTANCE
 
+                get_stock = inventory.get
                 for i, category in enumerate(categories_sorted, 1):
-                    # Count items in this category
-                    category_items = [item for item in game_state.items if item.category == category]
+                    # Count items in this category and their average stock
+                    category_items = items_by_category.get(category, [])
                     item_count = len(category_items)
+                    total_stock = sum(get_stock(item.name, 0) for item in category_items)
+                    avg_stock = total_stock / item_count if item_count > 0 else 0
 
                     # Check if auto-restock is set
-                    existing = player.category_minimum_restock.get(category)
+                    existing = restock.get(category)
                     if existing:
                         min_qty, vendor = existing
-                        # Calculate average stock
-                        total_stock = sum(player.inventory.get(item.name, 0) for item in category_items)
-                        avg_stock = total_stock / item_count if item_count > 0 else 0
                         print(f"  {i}. {category} ({item_count} items, avg stock: {avg_stock:.1f}, min: {min_qty}, vendor: {vendor})")
                     else:
-                        # Calculate average stock
-                        total_stock = sum(player.inventory.get(item.name, 0) for item in category_items)
-                        avg_stock = total_stock / item_count if item_count > 0 else 0
                         print(f"  {i}. {category} ({item_count} items, avg stock: {avg_stock:.1f}, no auto-restock set)")
 
                 print("  0. Cancel")
@@ -6580,7 +6663,7 @@ def category_minimum_restock_menu(game_state: GameState, player: Player) -> None
                     continue
                 elif 1 <= cat_num <= len(categories_sorted):
                     category = categories_sorted[cat_num - 1]
-                    existing = player.category_minimum_restock.get(category)
+                    existing = restock.get(category)
 
                     # Show current settings if any
                     if existing:
@@ -6601,7 +6684,7 @@ def category_minimum_restock_menu(game_state: GameState, player: Player) -> None
 
                     # If setting to 0, this is a removal (costs $500)
                     if minimum == 0:
-                        if category in player.category_minimum_restock:
+                        if existing:
                             cancellation_cost = 500
                             print(f"\n⚠ WARNING: Removing category auto-restock costs ${cancellation_cost:.2f}")
                             confirm = input("Type 'yes' to confirm removal: ").strip().lower()
@@ -6609,7 +6692,8 @@ def category_minimum_restock_menu(game_state: GameState, player: Player) -> None
                             if confirm == "yes":
                                 if player.cash >= cancellation_cost:
                                     player.cash -= cancellation_cost
-                                    del player.category_minimum_restock[category]
+                                    del restock[category]
+                                    screen = None
                                     print(f"\n✓ Category auto-restock removed for {category}. Paid ${cancellation_cost:.2f} cancellation fee.")
                                 else:
                                     print(f"\n✗ Insufficient cash! Need ${cancellation_cost:.2f}, have ${player.cash:.2f}")
@@ -6623,67 +6707,19 @@ def category_minimum_restock_menu(game_state: GameState, player: Player) -> None
                         continue
 
                     # If setting to positive value, select vendor
-                    print("\nAvailable Vendors:")
-
                     # Get a sample item from this category to check vendor compatibility
-                    category_items = [item for item in game_state.items if item.category == category]
+                    category_items = items_by_category.get(category, [])
                     sample_item = category_items[0] if category_items else None
+                    display_vendor_estimates(game_state, vendor_labels, vendor_discounts, sample_item, "(may not have all items)")
 
-                    for i, vendor in enumerate(game_state.vendors, 1):
-                        min_text = f" (min: {vendor.min_purchase})" if vendor.min_purchase else ""
-                        vol_text = " [volume pricing]" if vendor.volume_pricing_tiers else ""
-                        req_parts = []
-                        if vendor.required_reputation:
-                            req_parts.append(f"rep: {vendor.required_reputation:.0f}")
-                        if vendor.required_level:
-                            req_parts.append(f"lvl: {vendor.required_level}")
-                        rep_text = f" [req {', '.join(req_parts)}]" if req_parts else ""
-                        # Calculate effective lead time with player's upgrades
-                        lead_time_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "lead_time_reduction")
-                        effective_lead_time = max(0, vendor.lead_time - int(lead_time_reduction))
-                        lead_time_str = f"{effective_lead_time}d" if effective_lead_time > 0 else "instant"
-
-                        # Check if vendor would sell items from this category
-                        if sample_item:
-                            market_price = game_state.market_prices.get(sample_item.name, sample_item.base_price)
-                            if vendor_would_sell_item(vendor, sample_item, market_price):
-                                # Calculate estimated price for sample item
-                                estimated_price = market_price * vendor.pricing_multiplier
-                                discount = player.get_vendor_discount(vendor.name, game_state.day)
-                                final_price = estimated_price * (1 - discount)
-                                discount_text = f" (-{discount*100:.0f}%)" if discount > 0 else ""
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - ~${final_price:.2f}{discount_text} (lead: {lead_time_str})")
-                            else:
-                                print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} - (may not have all items)")
-                        else:
-                            print(f"  {i}. {vendor.name}{min_text}{vol_text}{rep_text} (lead: {lead_time_str})")
-
-                    # If updating, show option to keep current vendor
-                    if existing:
-                        print(f"\nCurrent vendor: {current_vendor}")
-                        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to keep current): ").strip()
-                    else:
-                        vendor_choice = input(f"\nSelect vendor (1-{len(game_state.vendors)}, 0 to cancel): ").strip()
-
-                    vendor_num = int(vendor_choice)
-
-                    if vendor_num == 0:
-                        if existing:
-                            # Keep current vendor
-                            selected_vendor_name = current_vendor
-                        else:
-                            # Cancel
-                            continue
-                    elif 1 <= vendor_num <= len(game_state.vendors):
-                        selected_vendor_name = game_state.vendors[vendor_num - 1].name
-                    else:
-                        print("\n✗ Invalid vendor selection!")
-                        input("Press Enter to continue...")
+                    selected_vendor_name = select_restock_vendor(game_state, existing[1] if existing else None)
+                    if selected_vendor_name is None:
                         continue
 
                     # Set/update the minimum (free to set up or update)
                     action = "Updated" if existing else "Set"
-                    player.category_minimum_restock[category] = (minimum, selected_vendor_name)
+                    restock[category] = (minimum, selected_vendor_name)
+                    screen = None
                     item_count = len(category_items)
                     print(f"\n✓ {action} category auto-restock: {category} minimum {minimum} per item from {selected_vendor_name}")
                     print(f"   This applies to {item_count} items in the {category} category")
@@ -6741,147 +6777,150 @@ def warehouse_menu(game_state: GameState, player: Player) -> None:
     WORKER_MONTHLY_WAGE = 500.0
 
     while True:
-        print("\n" + "=" * 70)
-        print("WAREHOUSE MANAGEMENT MENU")
-        print("=" * 70)
-        print(f"\nYour Cash: ${player.cash:.2f}")
         inventory_size_used = player.get_inventory_size_used(game_state.items_by_name)
-        total_items = sum(player.inventory.values())
-        print(f"Current Inventory: {inventory_size_used:.1f}/{player.get_max_inventory()} space ({total_items} items)")
-        print(f"\nWarehouses: {len(player.warehouses)}/4")
-
-        # Display warehouse information
-        print("\n" + "-" * 70)
+        total_items = player.total_stock
+        lines = [
+            "\n" + "=" * 70,
+            "WAREHOUSE MANAGEMENT MENU",
+            "=" * 70,
+            f"\nYour Cash: ${player.cash:.2f}",
+            f"Current Inventory: {inventory_size_used:.1f}/{player.get_max_inventory()} space ({total_items} items)",
+            f"\nWarehouses: {len(player.warehouses)}/4",
+            # Display warehouse information
+            "\n" + "-" * 70,
+        ]
         total_workers = 0
+        total_level = 0
         for i, warehouse in enumerate(player.warehouses):
             capacity = warehouse.level * 1000
-            print(f"  Warehouse {i + 1}: Level {warehouse.level}/10 | {warehouse.workers}/5 workers | Capacity: {capacity}")
+            lines.append(f"  Warehouse {i + 1}: Level {warehouse.level}/10 | {warehouse.workers}/5 workers | Capacity: {capacity}")
             total_workers += warehouse.workers
+            total_level += warehouse.level
 
-        print("-" * 70)
+        lines.append("-" * 70)
 
         # Calculate wages
-        wage_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "wage_reduction")
+        wage_reduction = player.get_upgrade_effect_total("wage_reduction")
         actual_worker_wage = max(0, WORKER_MONTHLY_WAGE - wage_reduction)
         marketing_agent_wage = max(0, 1000.0 - wage_reduction)
         total_employees = total_workers + player.marketing_agents
         total_monthly_wages = (total_workers * actual_worker_wage) + (player.marketing_agents * marketing_agent_wage)
 
-        print(f"\nEmployees:")
-        print(f"  Warehouse Workers: {total_workers} (${actual_worker_wage:.2f}/month each)")
-        print(f"  Marketing Agents: {player.marketing_agents} (${marketing_agent_wage:.2f}/month each)")
-        print(f"  Total monthly wages: ${total_monthly_wages:.2f}")
+        lines.extend([
+            f"\nEmployees:",
+            f"  Warehouse Workers: {total_workers} (${actual_worker_wage:.2f}/month each)",
+            f"  Marketing Agents: {player.marketing_agents} (${marketing_agent_wage:.2f}/month each)",
+            f"  Total monthly wages: ${total_monthly_wages:.2f}",
+        ])
 
         # Show days until next wage payment
         days_until_payment = 30 - (game_state.day - player.last_wage_payment_day)
         if total_employees > 0:
-            print(f"  Next wage payment: Day {player.last_wage_payment_day + 30} ({days_until_payment} days)")
+            lines.append(f"  Next wage payment: Day {player.last_wage_payment_day + 30} ({days_until_payment} days)")
 
-        # Calculate costs
-        total_level = player.get_total_warehouse_level()
+        # Calculate costs (total_level was summed with the warehouse listing above)
+        warehouse_count = len(player.warehouses)
         upgrade_cost = 5000.0 * total_level
-        new_warehouse_cost = 20000.0 * len(player.warehouses)
+        new_warehouse_cost = 20000.0 * warehouse_count
 
-        print("\nOptions:")
-        print(f"  1. Upgrade Warehouse (Cost: ${upgrade_cost:.2f})")
-        if len(player.warehouses) < 4:
-            print(f"  2. Buy New Warehouse (Cost: ${new_warehouse_cost:.2f})")
+        lines.append("\nOptions:")
+        lines.append(f"  1. Upgrade Warehouse (Cost: ${upgrade_cost:.2f})")
+        if warehouse_count < 4:
+            lines.append(f"  2. Buy New Warehouse (Cost: ${new_warehouse_cost:.2f})")
         else:
-            print(f"  2. Buy New Warehouse (Max 4 warehouses reached)")
-        print(f"  3. Hire Warehouse Worker (Cost: ${WORKER_HIRE_COST:.2f})")
-        print("  0. Back to Main Menu")
+            lines.append(f"  2. Buy New Warehouse (Max 4 warehouses reached)")
+        lines.append(f"  3. Hire Warehouse Worker (Cost: ${WORKER_HIRE_COST:.2f})")
+        lines.append("  0. Back to Main Menu")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        try:
-            choice = input("\nSelect option (0-3): ")
-            choice_num = int(choice)
+        choice_num = parse_int_input(input("\nSelect option (0-3): "))
 
-            if choice_num == 0:
-                break
-            elif choice_num == 1:
-                # Upgrade warehouse submenu
-                print("\nWhich warehouse to upgrade?")
-                for i, warehouse in enumerate(player.warehouses):
-                    status = f"(Level {warehouse.level}/10)" if warehouse.level < 10 else "(Max Level)"
-                    print(f"  {i + 1}. Warehouse {i + 1} {status}")
-                print("  0. Cancel")
-
-                try:
-                    w_choice = input("\nSelect warehouse (0-{}): ".format(len(player.warehouses)))
-                    w_num = int(w_choice)
-
-                    if w_num == 0:
-                        continue
-                    if 1 <= w_num <= len(player.warehouses):
-                        warehouse = player.warehouses[w_num - 1]
-                        if warehouse.level >= 10:
-                            print(f"\n✗ Warehouse {w_num} is already at max level (10)")
-                        elif player.cash < upgrade_cost:
-                            print(f"\n✗ Not enough cash! Need ${upgrade_cost:.2f}, have ${player.cash:.2f}")
-                        else:
-                            if player.upgrade_warehouse(w_num - 1):
-                                print(f"\n✓ Upgraded Warehouse {w_num} to Level {warehouse.level}")
-                                print(f"  Capacity increased to {warehouse.level * 1000} items")
-                                next_cost = 5000.0 * player.get_total_warehouse_level()
-                                print(f"  Next upgrade will cost: ${next_cost:.2f}")
-                            else:
-                                print("\n✗ Failed to upgrade warehouse")
+        if choice_num is None:
+            print("\n✗ Invalid input!")
+        elif choice_num == 0:
+            break
+        elif choice_num == 1:
+            # Upgrade warehouse submenu
+            print("\nWhich warehouse to upgrade?")
+            for i, warehouse in enumerate(player.warehouses):
+                status = f"(Level {warehouse.level}/10)" if warehouse.level < 10 else "(Max Level)"
+                print(f"  {i + 1}. Warehouse {i + 1} {status}")
+            print("  0. Cancel")
+
+            w_num = parse_int_input(input("\nSelect warehouse (0-{}): ".format(len(player.warehouses))))
+
+            if w_num is None:
+                print("\n✗ Invalid input!")
+            elif w_num == 0:
+                continue
+            elif 1 <= w_num <= len(player.warehouses):
+                warehouse = player.warehouses[w_num - 1]
+                if warehouse.level >= 10:
+                    print(f"\n✗ Warehouse {w_num} is already at max level (10)")
+                elif player.cash < upgrade_cost:
+                    print(f"\n✗ Not enough cash! Need ${upgrade_cost:.2f}, have ${player.cash:.2f}")
+                else:
+                    if player.upgrade_warehouse(w_num - 1):
+                        print(f"\n✓ Upgraded Warehouse {w_num} to Level {warehouse.level}")
+                        print(f"  Capacity increased to {warehouse.level * 1000} items")
+                        next_cost = 5000.0 * player.get_total_warehouse_level()
+                        print(f"  Next upgrade will cost: ${next_cost:.2f}")
                     else:
-                        print("\n✗ Invalid warehouse number!")
-                except (ValueError, IndexError):
-                    print("\n✗ Invalid input!")
+                        print("\n✗ Failed to upgrade warehouse")
+            else:
+                print("\n✗ Invalid warehouse number!")
 
-            elif choice_num == 2:
-                if len(player.warehouses) >= 4:
-                    print("\n✗ Maximum warehouses (4) reached!")
-                elif player.cash < new_warehouse_cost:
-                    print(f"\n✗ Not enough cash! Need ${new_warehouse_cost:.2f}, have ${player.cash:.2f}")
+        elif choice_num == 2:
+            if len(player.warehouses) >= 4:
+                print("\n✗ Maximum warehouses (4) reached!")
+            elif player.cash < new_warehouse_cost:
+                print(f"\n✗ Not enough cash! Need ${new_warehouse_cost:.2f}, have ${player.cash:.2f}")
+            else:
+                if player.buy_warehouse():
+                    print(f"\n✓ Bought new warehouse for ${new_warehouse_cost:.2f}")
+                    print(f"  Total warehouses: {len(player.warehouses)}/4")
+                    next_cost = 20000.0 * len(player.warehouses)
+                    print(f"  Next warehouse will cost: ${next_cost:.2f}")
                 else:
-                    if player.buy_warehouse():
-                        print(f"\n✓ Bought new warehouse for ${new_warehouse_cost:.2f}")
-                        print(f"  Total warehouses: {len(player.warehouses)}/4")
-                        next_cost = 20000.0 * len(player.warehouses)
-                        print(f"  Next warehouse will cost: ${next_cost:.2f}")
-                    else:
-                        print("\n✗ Failed to buy warehouse")
+                    print("\n✗ Failed to buy warehouse")
 
-            elif choice_num == 3:
-                # Hire worker submenu
-                print("\nWhich warehouse to hire for?")
-                for i, warehouse in enumerate(player.warehouses):
-                    status = f"({warehouse.workers}/5 workers)" if warehouse.workers < 5 else "(Full - 5/5)"
-                    print(f"  {i + 1}. Warehouse {i + 1} {status}")
-                print("  0. Cancel")
+        elif choice_num == 3:
+            # Hire worker submenu
+            print("\nWhich warehouse to hire for?")
+            for i, warehouse in enumerate(player.warehouses):
+                status = f"({warehouse.workers}/5 workers)" if warehouse.workers < 5 else "(Full - 5/5)"
+                print(f"  {i + 1}. Warehouse {i + 1} {status}")
+            print("  0. Cancel")
 
-                try:
-                    w_choice = input("\nSelect warehouse (0-{}): ".format(len(player.warehouses)))
-                    w_num = int(w_choice)
+            w_num = parse_int_input(input("\nSelect warehouse (0-{}): ".format(len(player.warehouses))))
 
-                    if w_num == 0:
-                        continue
-                    if 1 <= w_num <= len(player.warehouses):
-                        warehouse = player.warehouses[w_num - 1]
-                        if warehouse.workers >= 5:
-                            print(f"\n✗ Warehouse {w_num} is full (5/5 workers)")
-                        elif player.cash < WORKER_HIRE_COST:
-                            print(f"\n✗ Not enough cash! Need ${WORKER_HIRE_COST:.2f}, have ${player.cash:.2f}")
-                        else:
-                            if player.hire_warehouse_worker(w_num - 1):
-                                print(f"\n✓ Hired worker for Warehouse {w_num}")
-                                print(f"  Cost: ${WORKER_HIRE_COST:.2f}")
-                                print(f"  Workers: {warehouse.workers}/5")
-                                print(f"  New max inventory: {player.get_max_inventory()} items")
-                            else:
-                                print("\n✗ Failed to hire worker")
+            if w_num is None:
+                print("\n✗ Invalid input!")
+            elif w_num == 0:
+                continue
+            elif 1 <= w_num <= len(player.warehouses):
+                warehouse = player.warehouses[w_num - 1]
+                if warehouse.workers >= 5:
+                    print(f"\n✗ Warehouse {w_num} is full (5/5 workers)")
+                elif player.cash < WORKER_HIRE_COST:
+                    print(f"\n✗ Not enough cash! Need ${WORKER_HIRE_COST:.2f}, have ${player.cash:.2f}")
+                else:
+                    if player.hire_warehouse_worker(w_num - 1):
+                        print(f"\n✓ Hired worker for Warehouse {w_num}")
+                        print(f"  Cost: ${WORKER_HIRE_COST:.2f}")
+                        print(f"  Workers: {warehouse.workers}/5")
+                        print(f"  New max inventory: {player.get_max_inventory()} items")
                     else:
-                        print("\n✗ Invalid warehouse number!")
-                except (ValueError, IndexError):
-                    print("\n✗ Invalid input!")
-
+                        print("\n✗ Failed to hire worker")
             else:
-                print("\n✗ Invalid option!")
+                print("\n✗ Invalid warehouse number!")
 
-        except (ValueError, IndexError):
-            print("\n✗ Invalid input!")
+        else:
+            print("\n✗ Invalid option!")
+
+
+# Row layout of the discard menu's inventory table: number, item, quantity, size each, total size
+DISCARD_ROW_FORMAT = "{:<4} {:<25} {:>10} {:>12.1f} {:>12.1f}".format
 
 
 def discard_inventory_menu(game_state: GameState, player: Player) -> None:
@@ -6894,153 +6933,169 @@ def discard_inventory_menu(game_state: GameState, player: Player) -> None:
 
         # Show current inventory
         inventory_size_used = player.get_inventory_size_used(game_state.items_by_name)
-        total_items = sum(player.inventory.values())
+        total_items = player.total_stock
         print(f"Current Inventory: {inventory_size_used:.1f}/{player.get_max_inventory()} space ({total_items} items)")
 
-        if not player.inventory:
+        if not player.in_stock_items:
             print("\n✗ Your inventory is empty. Nothing to discard.")
             input("\nPress Enter to continue...")
             break
 
         # Display inventory items
-        print("\n" + "-" * 70)
-        print(f"{'#':<4} {'Item':<25} {'Quantity':>10} {'Size Each':>12} {'Total Size':>12}")
-        print("-" * 70)
+        lines = [
+            "\n" + "-" * 70,
+            f"{'#':<4} {'Item':<25} {'Quantity':>10} {'Size Each':>12} {'Total Size':>12}",
+            "-" * 70,
+        ]
 
         inventory_items = []
-        for idx, (item_name, qty) in enumerate(sorted(player.inventory.items()), 1):
-            if qty > 0:  # Only show items with quantity > 0
-                item_obj = game_state.items_by_name.get(item_name)
-                size = item_obj.size if item_obj else 1.0
-                total_size = size * qty
-                print(f"{idx:<4} {item_name:<25} {qty:>10} {size:>12.1f} {total_size:>12.1f}")
-                inventory_items.append((item_name, qty))
-
-        print("-" * 70)
-        print("\nOptions:")
-        print("  Enter item # to discard")
-        print("  0. Back to Main Menu")
-
-        try:
-            choice = input("\nSelect item (0-{}): ".format(len(inventory_items)))
-            choice_num = int(choice)
-
-            if choice_num == 0:
-                break
+        inventory = player.inventory
+        get_item = game_state.items_by_name.get
+        # in_stock_items holds exactly the items with quantity > 0, so every row is selectable
+        for idx, item_name in enumerate(sorted(player.in_stock_items), 1):
+            qty = inventory[item_name]
+            item_obj = get_item(item_name)
+            size = item_obj.size if item_obj else 1.0
+            lines.append(DISCARD_ROW_FORMAT(idx, item_name, qty, size, size * qty))
+            inventory_items.append((item_name, qty))
+
+        lines.append("-" * 70)
+        lines.append("\nOptions:")
+        lines.append("  Enter item # to discard")
+        lines.append("  0. Back to Main Menu")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        choice_num = parse_int_input(input("\nSelect item (0-{}): ".format(len(inventory_items))))
+
+        if choice_num is None:
+            print("\n✗ Invalid input!")
+        elif choice_num == 0:
+            break
+        elif 1 <= choice_num <= len(inventory_items):
+            item_name, current_qty = inventory_items[choice_num - 1]
 
-            if 1 <= choice_num <= len(inventory_items):
-                item_name, current_qty = inventory_items[choice_num - 1]
+            # Submenu for discard amount
+            print(f"\n{item_name} - Current Quantity: {current_qty}")
+            print("\nDiscard Options:")
+            print("  1. Discard specific amount")
+            print("  2. Discard all")
+            print("  0. Cancel")
 
-                # Submenu for discard amount
-                print(f"\n{item_name} - Current Quantity: {current_qty}")
-                print("\nDiscard Options:")
-                print("  1. Discard specific amount")
-                print("  2. Discard all")
-                print("  0. Cancel")
+            discard_num = parse_int_input(input("\nSelect option (0-2): "))
 
-                discard_choice = input("\nSelect option (0-2): ")
-                discard_num = int(discard_choice)
+            if discard_num is None:
+                print("\n✗ Invalid input!")
+            elif discard_num == 0:
+                continue
+            elif discard_num == 1:
+                # Discard specific amount
+                amount = parse_int_input(input(f"\nEnter amount to discard (1-{current_qty}): "))
 
-                if discard_num == 0:
+                if amount is None:
+                    print("\n✗ Invalid input!")
                     continue
-                elif discard_num == 1:
-                    # Discard specific amount
-                    amount_str = input(f"\nEnter amount to discard (1-{current_qty}): ")
-                    amount = int(amount_str)
-
-                    if amount <= 0:
-                        print("\n✗ Amount must be greater than 0")
-                    elif amount > current_qty:
-                        print(f"\n✗ You only have {current_qty} {item_name}")
-                    else:
-                        # Confirm discard
-                        confirm = input(f"\nAre you sure you want to discard {amount} {item_name}? (y/n): ").strip().lower()
-                        if confirm == 'y':
-                            player.inventory[item_name] -= amount
-                            if player.inventory[item_name] == 0:
-                                del player.inventory[item_name]
-                            print(f"\n✓ Discarded {amount} {item_name}")
-                        else:
-                            print("\n✗ Discard cancelled")
-
-                    input("\nPress Enter to continue...")
-
-                elif discard_num == 2:
-                    # Discard all
-                    confirm = input(f"\nAre you sure you want to discard ALL {current_qty} {item_name}? (y/n): ").strip().lower()
+                if amount <= 0:
+                    print("\n✗ Amount must be greater than 0")
+                elif amount > current_qty:
+                    print(f"\n✗ You only have {current_qty} {item_name}")
+                else:
+                    # Confirm discard
+                    confirm = input(f"\nAre you sure you want to discard {amount} {item_name}? (y/n): ").strip().lower()
                     if confirm == 'y':
-                        del player.inventory[item_name]
-                        print(f"\n✓ Discarded all {current_qty} {item_name}")
+                        player.inventory[item_name] -= amount
+                        player.total_stock -= amount
+                        player.state_version += 1
+                        if player.inventory[item_name] == 0:
+                            del player.inventory[item_name]
+                            player.in_stock_items.discard(item_name)
+                        print(f"\n✓ Discarded {amount} {item_name}")
                     else:
                         print("\n✗ Discard cancelled")
 
-                    input("\nPress Enter to continue...")
+                input("\nPress Enter to continue...")
+
+            elif discard_num == 2:
+                # Discard all
+                confirm = input(f"\nAre you sure you want to discard ALL {current_qty} {item_name}? (y/n): ").strip().lower()
+                if confirm == 'y':
+                    del player.inventory[item_name]
+                    player.total_stock -= current_qty
+                    player.state_version += 1
+                    player.in_stock_items.discard(item_name)
+                    print(f"\n✓ Discarded all {current_qty} {item_name}")
                 else:
-                    print("\n✗ Invalid option!")
-            else:
-                print("\n✗ Invalid item number!")
+                    print("\n✗ Discard cancelled")
 
-        except (ValueError, IndexError):
-            print("\n✗ Invalid input!")
+                input("\nPress Enter to continue...")
+            else:
+                print("\n✗ Invalid option!")
+        else:
+            print("\n✗ Invalid item number!")
 
 
 def employee_menu(game_state: GameState, player: Player) -> None:
     """Menu for hiring cashiers and marketing agents."""
 
-    while True:
-        print("\n" + "=" * 60)
-        print("EMPLOYEE MENU - Hire Staff")
-        print("=" * 60)
-        print(f"\nYour Cash: ${player.cash:.2f}")
-        print(f"Store Level: {player.store_level}")
-        print(f"\nCurrent Employees:")
-        print(f"  Cashiers: {player.cashiers} (Handle 200 customers/day each)")
-        print(f"  Marketing Agents: {player.marketing_agents} (Boost customer attraction)")
-
-        # Total employees including warehouse workers
-        total_warehouse_workers = sum(w.workers for w in player.warehouses)
-        total_employees = total_warehouse_workers + player.cashiers + player.marketing_agents
-
-        # Calculate actual wages with upgrades
-        wage_reduction = sum(u.effect_value for u in player.purchased_upgrades if u.effect_type == "wage_reduction")
-        worker_wage = max(0, 500.0 - wage_reduction)
-        cashier_wage = max(0, 500.0 - wage_reduction)
-        agent_wage = max(0, 1000.0 - wage_reduction)
-        total_monthly_wages = (total_warehouse_workers * worker_wage) + (player.cashiers * cashier_wage) + (player.marketing_agents * agent_wage)
-
-        print(f"  Warehouse Workers (in Warehouse menu): {total_warehouse_workers}")
-        print(f"  Total monthly wages: ${total_monthly_wages:.2f}")
-
-        # Show customer capacity
-        customer_capacity = 100 + (player.cashiers * 200)
-        print(f"\nCustomer Capacity: {customer_capacity} customers/day (100 base + {player.cashiers * 200} from cashiers)")
-        print(f"Note: Going over capacity reduces CAS through soft penalty")
-
-        if wage_reduction > 0:
-            print(f"\nMonthly Wage per Cashier: ${cashier_wage:.2f} (reduced from $500.00)")
-            print(f"Monthly Wage per Agent: ${agent_wage:.2f} (reduced from $1000.00)")
-        else:
-            print(f"\nMonthly Wage per Cashier: ${cashier_wage:.2f}")
-            print(f"Monthly Wage per Agent: ${agent_wage:.2f}")
-
-        # Show days until next wage payment
-        days_until_payment = 30 - (game_state.day - player.last_wage_payment_day)
-        if total_employees > 0:
-            print(f"Next wage payment: Day {player.last_wage_payment_day + 30} ({days_until_payment} days)")
-        print(f"Note: Wages paid every 30 days for ALL employees (including newly hired)")
+    # Invalid input only repeats the prompt instead of redrawing the menu
+    needs_redraw = True
 
-        # Calculate costs
-        cashier_cost = 500.0
-        marketing_cost = 1000.0 * (5 ** player.marketing_agents)
+    while True:
+        if needs_redraw:
+            lines = ["\n" + "=" * 60]
+            lines.append("EMPLOYEE MENU - Hire Staff")
+            lines.append("=" * 60)
+            lines.append(f"\nYour Cash: ${player.cash:.2f}")
+            lines.append(f"Store Level: {player.store_level}")
+            lines.append(f"\nCurrent Employees:")
+            lines.append(f"  Cashiers: {player.cashiers} (Handle 200 customers/day each)")
+            lines.append(f"  Marketing Agents: {player.marketing_agents} (Boost customer attraction)")
+
+            # Total employees including warehouse workers
+            total_warehouse_workers = sum(w.workers for w in player.warehouses)
+            total_employees = total_warehouse_workers + player.cashiers + player.marketing_agents
+
+            # Calculate actual wages with upgrades
+            wage_reduction = player.get_upgrade_effect_total("wage_reduction")
+            worker_wage = max(0, 500.0 - wage_reduction)
+            cashier_wage = max(0, 500.0 - wage_reduction)
+            agent_wage = max(0, 1000.0 - wage_reduction)
+            total_monthly_wages = (total_warehouse_workers * worker_wage) + (player.cashiers * cashier_wage) + (player.marketing_agents * agent_wage)
+
+            lines.append(f"  Warehouse Workers (in Warehouse menu): {total_warehouse_workers}")
+            lines.append(f"  Total monthly wages: ${total_monthly_wages:.2f}")
+
+            # Show customer capacity
+            customer_capacity = 100 + (player.cashiers * 200)
+            lines.append(f"\nCustomer Capacity: {customer_capacity} customers/day (100 base + {player.cashiers * 200} from cashiers)")
+            lines.append(f"Note: Going over capacity reduces CAS through soft penalty")
+
+            if wage_reduction > 0:
+                lines.append(f"\nMonthly Wage per Cashier: ${cashier_wage:.2f} (reduced from $500.00)")
+                lines.append(f"Monthly Wage per Agent: ${agent_wage:.2f} (reduced from $1000.00)")
+            else:
+                lines.append(f"\nMonthly Wage per Cashier: ${cashier_wage:.2f}")
+                lines.append(f"Monthly Wage per Agent: ${agent_wage:.2f}")
 
-        print("\nOptions:")
-        print("  [For warehouse workers, use: 9. Warehouse Management]")
-        print(f"  1. Hire Cashier (Handle more customers) - ${cashier_cost:.2f}")
-        if player.store_level >= 5:
-            print(f"  2. Hire Marketing Agent (Boost CAS) - ${marketing_cost:.2f}")
-        else:
-            print(f"  2. Hire Marketing Agent (Requires Level 5+)")
-        print("  0. Back to Main Menu")
+            # Show days until next wage payment
+            days_until_payment = 30 - (game_state.day - player.last_wage_payment_day)
+            if total_employees > 0:
+                lines.append(f"Next wage payment: Day {player.last_wage_payment_day + 30} ({days_until_payment} days)")
+            lines.append(f"Note: Wages paid every 30 days for ALL employees (including newly hired)")
+
+            # Calculate costs
+            cashier_cost = 500.0
+            marketing_cost = 1000.0 * (5 ** player.marketing_agents)
+
+            lines.append("\nOptions:")
+            lines.append("  [For warehouse workers, use: 9. Warehouse Management]")
+            lines.append(f"  1. Hire Cashier (Handle more customers) - ${cashier_cost:.2f}")
+            if player.store_level >= 5:
+                lines.append(f"  2. Hire Marketing Agent (Boost CAS) - ${marketing_cost:.2f}")
+            else:
+                lines.append(f"  2. Hire Marketing Agent (Requires Level 5+)")
+            lines.append("  0. Back to Main Menu")
+            sys.stdout.write("\n".join(lines) + "\n")
+        needs_redraw = True
 
         try:
             choice = input("\nSelect option (0-2): ")
@@ -7074,55 +7129,65 @@ def employee_menu(game_state: GameState, player: Player) -> None:
                         print("\n✗ Failed to hire Marketing Agent")
             else:
                 print("\n✗ Invalid option!")
+                needs_redraw = False
 
         except (ValueError, IndexError):
             print("\n✗ Invalid input!")
+            needs_redraw = False
 
 
 def production_line_menu(game_state: GameState, player: Player) -> None:
     """Menu for purchasing production line upgrades (own production for items)."""
-    while True:
-        print("\n" + "=" * 80)
-        print("PRODUCTION LINE UPGRADES - Own Your Supply Chain")
-        print("=" * 80)
-        print(f"\nYour Cash: ${player.cash:.2f}")
-        print("\nOwning a production line gives you:")
-        print("  • Automatic 'Own' vendor for that item")
-        print("  • Purchase at 50% of market price (incredible savings!)")
-        print("  • Perfect for late-game investment")
-
-        # Show owned production lines
-        owned_lines = [u for u in player.purchased_upgrades if u.effect_type == "production_line"]
-        if owned_lines:
-            print("\n✅ Your Production Lines:")
-            for upgrade in owned_lines:
-                item_name = upgrade.vendor_name
-                market_price = game_state.market_prices.get(item_name, 0)
-                own_price = market_price * 0.5
-                print(f"  • {item_name}: ${own_price:.2f} (50% of ${market_price:.2f} market)")
-        else:
-            print("\n✅ No production lines owned yet")
+    # Invalid input only repeats the prompt instead of redrawing the menu
+    needs_redraw = True
 
-        # Show available production lines (only for unlocked products)
-        print("\n🏭 Available Production Lines:")
-        available = []
-        for i, item in enumerate(game_state.items, 1):
-            # Check if already owned
-            already_owned = player.has_production_line(item.name)
-            if not already_owned:
-                # Calculate cost: 10,000 times the base cost
-                upgrade_cost = item.base_cost * 20000
-                market_price = game_state.market_prices.get(item.name, item.base_price)
-                own_price = market_price * 0.5
-
-                print(f"  {i}. {item.name}")
-                print(f"      Cost: ${upgrade_cost:,.2f} | Current Market: ${market_price:.2f} → Own: ${own_price:.2f}")
-                available.append((i, item, upgrade_cost))
+    while True:
+        if needs_redraw:
+            lines = ["\n" + "=" * 80]
+            lines.append("PRODUCTION LINE UPGRADES - Own Your Supply Chain")
+            lines.append("=" * 80)
+            lines.append(f"\nYour Cash: ${player.cash:.2f}")
+            lines.append("\nOwning a production line gives you:")
+            lines.append("  • Automatic 'Own' vendor for that item")
+            lines.append("  • Purchase at 50% of market price (incredible savings!)")
+            lines.append("  • Perfect for late-game investment")
+
+            get_market_price = game_state.market_prices.get
+
+            # Show owned production lines
+            owned_lines = [u for u in player.purchased_upgrades if u.effect_type == "production_line"]
+            if owned_lines:
+                lines.append("\n✅ Your Production Lines:")
+                for upgrade in owned_lines:
+                    item_name = upgrade.vendor_name
+                    market_price = get_market_price(item_name, 0)
+                    own_price = market_price * 0.5
+                    lines.append(f"  • {item_name}: ${own_price:.2f} (50% of ${market_price:.2f} market)")
+            else:
+                lines.append("\n✅ No production lines owned yet")
+
+            # Show available production lines (only for unlocked products)
+            lines.append("\n🏭 Available Production Lines:")
+            available = {}
+            for i, item in enumerate(game_state.items, 1):
+                # Check if already owned
+                already_owned = player.has_production_line(item.name)
+                if not already_owned:
+                    # Calculate cost: 10,000 times the base cost
+                    upgrade_cost = item.base_cost * 20000
+                    market_price = get_market_price(item.name, item.base_price)
+                    own_price = market_price * 0.5
+
+                    lines.append(f"  {i}. {item.name}")
+                    lines.append(f"      Cost: ${upgrade_cost:,.2f} | Current Market: ${market_price:.2f} → Own: ${own_price:.2f}")
+                    available[i] = (item, upgrade_cost)
 
-        if not available:
-            print("  (All production lines owned!)")
+            if not available:
+                lines.append("  (All production lines owned!)")
 
-        print("\n  0. Back to Upgrades Menu")
+            lines.append("\n  0. Back to Upgrades Menu")
+            sys.stdout.write("\n".join(lines) + "\n")
+        needs_redraw = True
 
         try:
             if not available:
@@ -7136,15 +7201,10 @@ def production_line_menu(game_state: GameState, player: Player) -> None:
                 break
 
             # Find selected item
-            selected_item = None
-            selected_cost = 0
-            for idx, item, cost in available:
-                if idx == choice_num:
-                    selected_item = item
-                    selected_cost = cost
-                    break
+            selected = available.get(choice_num)
 
-            if selected_item:
+            if selected:
+                selected_item, selected_cost = selected
                 if player.cash < selected_cost:
                     print(f"\n✗ Not enough cash! Need ${selected_cost:,.2f}, have ${player.cash:.2f}")
                 else:
@@ -7168,56 +7228,66 @@ def production_line_menu(game_state: GameState, player: Player) -> None:
                         print("\n✗ Failed to purchase production line")
             else:
                 print("\n✗ Invalid selection!")
+                needs_redraw = False
 
         except (ValueError, IndexError):
             print("\n✗ Invalid input!")
+            needs_redraw = False
 
 
 def vendor_partnerships_menu(game_state: GameState, player: Player) -> None:
     """Menu for purchasing vendor partnerships (temporary, 30-day duration, max 15% discount)."""
+    # Invalid input only repeats the prompt instead of redrawing the menu
+    needs_redraw = True
+
     while True:
-        print("\n" + "=" * 70)
-        print("VENDOR PARTNERSHIPS MENU")
-        print("=" * 70)
-        print(f"\nYour Cash: ${player.cash:.2f}")
-        print(f"Current Day: {game_state.day}")
-        print("\n⚠️  Partnerships last 30 days and DO NOT stack (max 15% total discount per vendor)")
-
-        # Show active partnerships with expiration
-        active_partnerships = [u for u in player.purchased_upgrades if u.effect_type == "vendor_discount"]
-        if active_partnerships:
-            print("\n📋 Active Partnerships:")
-            for upgrade in active_partnerships:
-                expiration_day = player.vendor_partnership_expiration.get(upgrade.name, 0)
-                days_left = expiration_day - game_state.day
-                discount = player.get_vendor_discount(upgrade.vendor_name, game_state.day)
-                print(f"  ✓ {upgrade.name} - {upgrade.effect_value}% discount")
-                print(f"      Expires: Day {expiration_day} ({days_left} days left)")
-                print(f"      Total discount for {upgrade.vendor_name}: {discount * 100:.0f}%")
-        else:
-            print("\n📋 No active partnerships")
+        if needs_redraw:
+            lines = ["\n" + "=" * 70]
+            lines.append("VENDOR PARTNERSHIPS MENU")
+            lines.append("=" * 70)
+            lines.append(f"\nYour Cash: ${player.cash:.2f}")
+            lines.append(f"Current Day: {game_state.day}")
+            lines.append("\n⚠️  Partnerships last 30 days and DO NOT stack (max 15% total discount per vendor)")
+
+            discounts = player.get_vendor_discounts(game_state.day)
+
+            # Show active partnerships with expiration
+            active_partnerships = [u for u in player.purchased_upgrades if u.effect_type == "vendor_discount"]
+            if active_partnerships:
+                lines.append("\n📋 Active Partnerships:")
+                for upgrade in active_partnerships:
+                    expiration_day = player.vendor_partnership_expiration.get(upgrade.name, 0)
+                    days_left = expiration_day - game_state.day
+                    discount = discounts.get(upgrade.vendor_name, 0.0)
+                    lines.append(f"  ✓ {upgrade.name} - {upgrade.effect_value}% discount")
+                    lines.append(f"      Expires: Day {expiration_day} ({days_left} days left)")
+                    lines.append(f"      Total discount for {upgrade.vendor_name}: {discount * 100:.0f}%")
+            else:
+                lines.append("\n📋 No active partnerships")
 
-        # Show available partnerships (including those that can be re-purchased)
-        print("\n🛒 Available Partnerships:")
-        available = []
-        vendor_partnerships = [u for u in game_state.available_upgrades if u.effect_type == "vendor_discount"]
+            # Show available partnerships (including those that can be re-purchased)
+            lines.append("\n🛒 Available Partnerships:")
+            available = {}
+            vendor_partnerships = [u for u in game_state.available_upgrades if u.effect_type == "vendor_discount"]
 
-        for i, upgrade in enumerate(vendor_partnerships, 1):
-            current_discount = player.get_vendor_discount(upgrade.vendor_name, game_state.day)
-            can_purchase = current_discount < 0.15  # Max 15%
+            for i, upgrade in enumerate(vendor_partnerships, 1):
+                current_discount = discounts.get(upgrade.vendor_name, 0.0)
+                can_purchase = current_discount < 0.15  # Max 15%
 
-            if can_purchase:
-                status = ""
-                if current_discount > 0:
-                    status = f" (Current: {current_discount * 100:.0f}%, New total: {(current_discount + upgrade.effect_value / 100) * 100:.0f}%)"
-                print(f"  {i}. {upgrade.name} - ${upgrade.cost:,.2f}")
-                print(f"      Effect: +{upgrade.effect_value}% discount for 30 days{status}")
-                available.append((i, upgrade))
+                if can_purchase:
+                    status = ""
+                    if current_discount > 0:
+                        status = f" (Current: {current_discount * 100:.0f}%, New total: {(current_discount + upgrade.effect_value / 100) * 100:.0f}%)"
+                    lines.append(f"  {i}. {upgrade.name} - ${upgrade.cost:,.2f}")
+                    lines.append(f"      Effect: +{upgrade.effect_value}% discount for 30 days{status}")
+                    available[i] = upgrade
 
-        if not available:
-            print("  (All partnerships at maximum discount!)")
+            if not available:
+                lines.append("  (All partnerships at maximum discount!)")
 
-        print("\n  0. Back to Upgrades Menu")
+            lines.append("\n  0. Back to Upgrades Menu")
+            sys.stdout.write("\n".join(lines) + "\n")
+        needs_redraw = True
 
         try:
             choice = input(f"\nSelect partnership to purchase (0-{len(vendor_partnerships)}): ").strip()
@@ -7227,11 +7297,7 @@ def vendor_partnerships_menu(game_state: GameState, player: Player) -> None:
                 break
 
             # Find selected upgrade
-            selected_upgrade = None
-            for idx, upgrade in available:
-                if idx == choice_num:
-                    selected_upgrade = upgrade
-                    break
+            selected_upgrade = available.get(choice_num)
 
             if selected_upgrade:
                 if player.cash < selected_upgrade.cost:
@@ -7249,51 +7315,59 @@ def vendor_partnerships_menu(game_state: GameState, player: Player) -> None:
                         print("\n✗ Failed to purchase partnership (at maximum discount)")
             else:
                 print("\n✗ Invalid partnership selection!")
+                needs_redraw = False
 
         except (ValueError, IndexError):
             print("\n✗ Invalid input!")
+            needs_redraw = False
 
 
 def upgrades_menu(game_state: GameState, player: Player) -> None:
     """Menu for purchasing store upgrades."""
-    while True:
-        print("\n" + "=" * 70)
-        print("STORE UPGRADES MENU")
-        print("=" * 70)
-        print(f"\nYour Cash: ${player.cash:.2f}")
+    # Invalid input only repeats the prompt instead of redrawing the menu
+    needs_redraw = True
 
-        # Show purchased permanent upgrades (exclude vendor partnerships)
-        permanent_upgrades = [u for u in player.purchased_upgrades if u.effect_type != "vendor_discount"]
-        if permanent_upgrades:
-            print("\n📦 Your Permanent Upgrades:")
-            for upgrade in permanent_upgrades:
-                effect_desc = _get_upgrade_effect_description(upgrade)
-                print(f"  ✓ {upgrade.name} - {effect_desc}")
-        else:
-            print("\n📦 No permanent upgrades purchased yet")
-
-        # Show available permanent upgrades (not yet purchased, exclude vendor partnerships)
-        print("\n🛒 Available Permanent Upgrades:")
-        available = []
-        for i, upgrade in enumerate(game_state.available_upgrades, 1):
-            # Skip vendor partnerships (shown in separate submenu)
-            if upgrade.effect_type == "vendor_discount":
-                continue
+    while True:
+        if needs_redraw:
+            lines = ["\n" + "=" * 70]
+            lines.append("STORE UPGRADES MENU")
+            lines.append("=" * 70)
+            lines.append(f"\nYour Cash: ${player.cash:.2f}")
+
+            # Show purchased permanent upgrades (exclude vendor partnerships)
+            permanent_upgrades = [u for u in player.purchased_upgrades if u.effect_type != "vendor_discount"]
+            if permanent_upgrades:
+                lines.append("\n📦 Your Permanent Upgrades:")
+                for upgrade in permanent_upgrades:
+                    effect_desc = _get_upgrade_effect_description(upgrade)
+                    lines.append(f"  ✓ {upgrade.name} - {effect_desc}")
+            else:
+                lines.append("\n📦 No permanent upgrades purchased yet")
+
+            # Show available permanent upgrades (not yet purchased, exclude vendor partnerships)
+            lines.append("\n🛒 Available Permanent Upgrades:")
+            available = {}
+            purchased_names = {u.name for u in player.purchased_upgrades}
+            for i, upgrade in enumerate(game_state.available_upgrades, 1):
+                # Skip vendor partnerships (shown in separate submenu)
+                if upgrade.effect_type == "vendor_discount":
+                    continue
 
-            # Check if already purchased
-            already_purchased = any(u.name == upgrade.name for u in player.purchased_upgrades)
-            if not already_purchased:
-                effect_desc = _get_upgrade_effect_description(upgrade)
-                print(f"  {i}. {upgrade.name} - ${upgrade.cost:,.2f}")
-                print(f"      Effect: {effect_desc}")
-                available.append((i, upgrade))
+                # Check if already purchased
+                if upgrade.name not in purchased_names:
+                    effect_desc = _get_upgrade_effect_description(upgrade)
+                    lines.append(f"  {i}. {upgrade.name} - ${upgrade.cost:,.2f}")
+                    lines.append(f"      Effect: {effect_desc}")
+                    available[i] = upgrade
 
-        if not available:
-            print("  (All permanent upgrades purchased!)")
+            if not available:
+                lines.append("  (All permanent upgrades purchased!)")
 
-        print("\n  v. Vendor Partnerships (30-day duration, max 15% discount)")
-        print("  p. Production Line Upgrades (Late Game)")
-        print("  0. Back to Main Menu")
+            lines.append("\n  v. Vendor Partnerships (30-day duration, max 15% discount)")
+            lines.append("  p. Production Line Upgrades (Late Game)")
+            lines.append("  0. Back to Main Menu")
+            sys.stdout.write("\n".join(lines) + "\n")
+        needs_redraw = True
 
         try:
             choice = input(f"\nSelect upgrade to purchase (0-{len(game_state.available_upgrades)}, v, p): ").strip().lower()
@@ -7318,11 +7392,7 @@ def upgrades_menu(game_state: GameState, player: Player) -> None:
                 break
 
             # Find selected upgrade
-            selected_upgrade = None
-            for idx, upgrade in available:
-                if idx == choice_num:
-                    selected_upgrade = upgrade
-                    break
+            selected_upgrade = available.get(choice_num)
 
             if selected_upgrade:
                 if player.cash < selected_upgrade.cost:
@@ -7337,139 +7407,166 @@ def upgrades_menu(game_state: GameState, player: Player) -> None:
                         print("\n✗ Failed to purchase upgrade (already owned)")
             else:
                 print("\n✗ Invalid upgrade selection!")
+                needs_redraw = False
 
         except (ValueError, IndexError):
             print("\n✗ Invalid input!")
+            needs_redraw = False
 
 
 def _get_upgrade_effect_description(upgrade: Upgrade) -> str:
     """Get a human-readable description of an upgrade's effect."""
-    if upgrade.effect_type == "xp_gain":
-        return f"+{int(upgrade.effect_value)}% XP gain"
-    elif upgrade.effect_type == "vendor_discount":
-        return f"+{int(upgrade.effect_value)}% discount at {upgrade.vendor_name}"
-    elif upgrade.effect_type == "wage_reduction":
-        return f"-${int(upgrade.effect_value)} monthly wage per employee (from $1000 to $900)"
-    elif upgrade.effect_type == "lead_time_reduction":
-        return f"-{int(upgrade.effect_value)} day lead time for all vendors"
-    elif upgrade.effect_type == "production_line":
-        return f"Own production for {upgrade.vendor_name} (50% market price)"
+    return _describe_upgrade_effect(upgrade.effect_type, upgrade.effect_value, upgrade.vendor_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _describe_upgrade_effect(effect_type: str, effect_value: float, vendor_name: str) -> str:
+    """Describe an upgrade effect; cached since upgrades menus redraw the same few."""
+    if effect_type == "xp_gain":
+        return f"+{int(effect_value)}% XP gain"
+    elif effect_type == "vendor_discount":
+        return f"+{int(effect_value)}% discount at {vendor_name}"
+    elif effect_type == "wage_reduction":
+        return f"-${int(effect_value)} monthly wage per employee (from $1000 to $900)"
+    elif effect_type == "lead_time_reduction":
+        return f"-{int(effect_value)} day lead time for all vendors"
+    elif effect_type == "production_line":
+        return f"Own production for {vendor_name} (50% market price)"
     return "Unknown effect"
 
 
+# Row layout of the pricing menu's category table: category, importance, item count, pricing, price range
+PRICING_ROW_FORMAT = "{:<25} {:>3} {:>5} {:>12} {}".format
+
+
 def pricing_menu(game_state: GameState, player: Player) -> None:
     """Menu for setting category-based pricing as a percentage below market."""
-    items_by_name = {item.name: item for item in game_state.items}
+    items_by_name = game_state.items_by_name
+    items_by_category = game_state.items_by_category
 
-    while True:
-        # Get items from inventory, buy orders, and auto-features
-        relevant_item_names = set()
-        relevant_categories = set()
+    # Invalid input only repeats the prompt instead of redrawing the menu
+    needs_redraw = True
 
-        # Add items from inventory
-        for item_name, qty in player.inventory.items():
-            if qty > 0:
+    while True:
+        if needs_redraw:
+            # Get items from inventory, buy orders, and auto-features
+            relevant_item_names = set()
+            relevant_categories = set()
+
+            # Add items from inventory
+            for item_name, qty in player.inventory.items():
+                if qty > 0:
+                    relevant_item_names.add(item_name)
+
+            # Add items from buy orders
+            for item_name, vendor_list in player.buy_orders.items():
+                total_qty = sum(q for q, v in vendor_list)
+                if total_qty > 0:
+                    relevant_item_names.add(item_name)
+
+            # Add items from recurring buy orders
+            for order in player.recurring_buy_orders:
+                relevant_item_names.add(order.item_name)
+
+            # Add items from auto-restock
+            for item_name in player.stock_minimum_restock.keys():
                 relevant_item_names.add(item_name)
 
-        # Add items from buy orders
-        for item_name, vendor_list in player.buy_orders.items():
-            total_qty = sum(q for q, v in vendor_list)
-            if total_qty > 0:
-                relevant_item_names.add(item_name)
+            # Add categories from category recurring buy orders
+            for order in player.category_recurring_buy_orders:
+                relevant_categories.add(order.category_name)
 
-        # Add items from recurring buy orders
-        for order in player.recurring_buy_orders:
-            relevant_item_names.add(order.item_name)
-
-        # Add items from auto-restock
-        for item_name in player.stock_minimum_restock.keys():
-            relevant_item_names.add(item_name)
-
-        # Add categories from category recurring buy orders
-        for order in player.category_recurring_buy_orders:
-            relevant_categories.add(order.category_name)
-
-        # Add categories from category auto-restock
-        for category_name in player.category_minimum_restock.keys():
-            relevant_categories.add(category_name)
-
-        # Get categories that have items in inventory, buy orders, or auto-features
-        categories_with_items = {}
-        for item_name in relevant_item_names:
-            if item_name in items_by_name:
-                item = items_by_name[item_name]
-                if item.category not in categories_with_items:
-                    categories_with_items[item.category] = []
-                categories_with_items[item.category].append(item)
-
-        # Add categories from category auto-restock (include all items in those categories)
-        for category_name in relevant_categories:
-            if category_name not in categories_with_items:
-                categories_with_items[category_name] = []
-            # Add all items from this category
-            for item in game_state.items:
-                if item.category == category_name and item not in categories_with_items[category_name]:
-                    categories_with_items[category_name].append(item)
-
-        if not categories_with_items:
-            print("\n" + "=" * 70)
-            print("CATEGORY PRICING - Set Prices by Category")
-            print("=" * 70)
-            print("\nYou have no items in inventory, buy orders, or auto-features to price.")
-            input("\nPress Enter to return to main menu...")
-            break
+            # Add categories from category auto-restock
+            for category_name in player.category_minimum_restock.keys():
+                relevant_categories.add(category_name)
 
-        print("\n" + "=" * 70)
-        print("CATEGORY PRICING - Set Prices by Category")
-        print("=" * 70)
-        print("\nSet pricing as a percentage below market price for all items in a category.")
-        print("Prices will automatically update when market prices change.")
-
-        # Display categories with their info
-        print(f"\n{'Category':<25} {'Imp':>3} {'Items':>5} {'Pricing':>12} {'Price Range'}")
-        print("-" * 70)
-
-        # Sort categories by importance (descending) then name
-        sorted_categories = sorted(categories_with_items.keys(),
-                                  key=lambda c: (-PRODUCT_CATEGORIES.get(c, 0), c))
-
-        for category in sorted_categories:
-            items_in_cat = categories_with_items[category]
-            importance = PRODUCT_CATEGORIES.get(category, 0)
-            num_items = len(items_in_cat)
-
-            # Get current pricing percentage
-            pricing_pct = player.get_category_pricing_percent(category)
-            if pricing_pct is not None:
-                if pricing_pct > 0:
-                    pricing_str = f"{pricing_pct:.1f}% below"
-                elif pricing_pct < 0:
-                    pricing_str = f"{abs(pricing_pct):.1f}% above"
+            # Get categories that have items in inventory, buy orders, or auto-features
+            categories_with_items = {}
+            for item_name in relevant_item_names:
+                if item_name in items_by_name:
+                    item = items_by_name[item_name]
+                    if item.category not in categories_with_items:
+                        categories_with_items[item.category] = []
+                    categories_with_items[item.category].append(item)
+
+            # Add categories from category auto-restock (include all items in those categories)
+            for category_name in relevant_categories:
+                category_items = categories_with_items.setdefault(category_name, [])
+                listed_names = {item.name for item in category_items}
+                # Add all items from this category
+                category_items.extend(item for item in items_by_category.get(category_name, [])
+                                      if item.name not in listed_names)
+
+            if not categories_with_items:
+                print("\n" + "=" * 70)
+                print("CATEGORY PRICING - Set Prices by Category")
+                print("=" * 70)
+                print("\nYou have no items in inventory, buy orders, or auto-features to price.")
+                input("\nPress Enter to return to main menu...")
+                break
+
+            lines = ["\n" + "=" * 70]
+            lines.append("CATEGORY PRICING - Set Prices by Category")
+            lines.append("=" * 70)
+            lines.append("\nSet pricing as a percentage below market price for all items in a category.")
+            lines.append("Prices will automatically update when market prices change.")
+
+            # Display categories with their info
+            lines.append(f"\n{'Category':<25} {'Imp':>3} {'Items':>5} {'Pricing':>12} {'Price Range'}")
+            lines.append("-" * 70)
+
+            # Sort categories by importance (descending) then name
+            sorted_categories = [c for c in CATEGORIES_BY_IMPORTANCE_AND_NAME if c in categories_with_items]
+            if len(sorted_categories) < len(categories_with_items):
+                # Unknown categories have importance 0, so they come last
+                sorted_categories.extend(sorted(c for c in categories_with_items if c not in PRODUCT_CATEGORIES))
+
+            get_market_price = game_state.market_prices.get
+            get_importance = PRODUCT_CATEGORIES.get
+            get_pricing_percent = player.get_category_pricing_percent
+            for category in sorted_categories:
+                items_in_cat = categories_with_items[category]
+                importance = get_importance(category, 0)
+                num_items = len(items_in_cat)
+
+                # Get current pricing percentage
+                pricing_pct = get_pricing_percent(category)
+                if pricing_pct is not None:
+                    if pricing_pct > 0:
+                        pricing_str = f"{pricing_pct:.1f}% below"
+                    elif pricing_pct < 0:
+                        pricing_str = f"{abs(pricing_pct):.1f}% above"
+                    else:
+                        pricing_str = "At market"
                 else:
-                    pricing_str = "At market"
-            else:
-                pricing_str = "Not set"
-
-            # Calculate price range for items in this category
-            market_prices_in_cat = [game_state.market_prices.get(item.name, 0) for item in items_in_cat]
-            if market_prices_in_cat:
-                min_price = min(market_prices_in_cat)
-                max_price = max(market_prices_in_cat)
-                if min_price == max_price:
-                    price_range = f"${min_price:.2f}"
+                    pricing_str = "Not set"
+
+                # Calculate price range for items in this category in one pass
+                if items_in_cat:
+                    min_price = max_price = get_market_price(items_in_cat[0].name, 0)
+                    for item in items_in_cat:
+                        price = get_market_price(item.name, 0)
+                        if price < min_price:
+                            min_price = price
+                        elif price > max_price:
+                            max_price = price
+                    if min_price == max_price:
+                        price_range = f"${min_price:.2f}"
+                    else:
+                        price_range = f"${min_price:.2f}-${max_price:.2f}"
                 else:
-                    price_range = f"${min_price:.2f}-${max_price:.2f}"
-            else:
-                price_range = "N/A"
+                    price_range = "N/A"
 
-            print(f"{category:<25} {importance:>3} {num_items:>5} {pricing_str:>12} {price_range}")
+                lines.append(PRICING_ROW_FORMAT(category, importance, num_items, pricing_str, price_range))
 
-        print("\n" + "-" * 70)
-        print("Importance levels: 3 = Essentials, 2 = Non-essentials, 1 = Luxury")
-        print("\nSelect a category to set pricing:")
-        for i, category in enumerate(sorted_categories, 1):
-            print(f"  {i}. {category}")
-        print(f"  0. Back to Main Menu")
+            lines.append("\n" + "-" * 70)
+            lines.append("Importance levels: 3 = Essentials, 2 = Non-essentials, 1 = Luxury")
+            lines.append("\nSelect a category to set pricing:")
+            for i, category in enumerate(sorted_categories, 1):
+                lines.append(f"  {i}. {category}")
+            lines.append(f"  0. Back to Main Menu")
+            sys.stdout.write("\n".join(lines) + "\n")
+        needs_redraw = True
 
         try:
             choice = input(f"\nSelect category (0-{len(sorted_categories)}): ").strip()
@@ -7537,9 +7634,11 @@ def pricing_menu(game_state: GameState, player: Player) -> None:
                 input("\nPress Enter to continue...")
             else:
                 print("\n✗ Invalid category selection!")
+                needs_redraw = False
 
         except (ValueError, IndexError):
             print("\n✗ Invalid input!")
+            needs_redraw = False
 
 
 def display_customer_forecast(game_state: GameState) -> None:
@@ -7620,26 +7719,26 @@ def get_available_loan_offers() -> List[LoanOffer]:
 def loans_menu(game_state: GameState, player: Player) -> None:
     """Menu for managing loans - taking new loans and paying back existing ones."""
     while True:
-        print("\n" + "=" * 70)
-        print("LOANS MENU")
-        print("=" * 70)
-        print(f"\nYour Cash: ${player.cash:.2f}")
+        lines = ["\n" + "=" * 70]
+        lines.append("LOANS MENU")
+        lines.append("=" * 70)
+        lines.append(f"\nYour Cash: ${player.cash:.2f}")
 
         # Display active loans
         if player.loans:
             total_debt = sum(loan.remaining_balance for loan in player.loans)
-            print(f"\n💳 Active Loans (Total Debt: ${total_debt:,.2f}):")
+            lines.append(f"\n💳 Active Loans (Total Debt: ${total_debt:,.2f}):")
             for i, loan in enumerate(player.loans, 1):
                 days_remaining = loan.due_day - game_state.day
                 interest_amount = loan.remaining_balance - loan.principal
-                print(f"\n  {i}. {loan.lender_name}")
-                print(f"     Principal: ${loan.principal:,.2f}")
-                print(f"     Current Balance: ${loan.remaining_balance:,.2f} (includes ${interest_amount:,.2f} interest)")
-                print(f"     Due: Day {loan.due_day} ({days_remaining} days remaining)")
+                lines.append(f"\n  {i}. {loan.lender_name}")
+                lines.append(f"     Principal: ${loan.principal:,.2f}")
+                lines.append(f"     Current Balance: ${loan.remaining_balance:,.2f} (includes ${interest_amount:,.2f} interest)")
+                lines.append(f"     Due: Day {loan.due_day} ({days_remaining} days remaining)")
                 if days_remaining < 0:
-                    print(f"     ⚠️  OVERDUE by {abs(days_remaining)} days!")
+                    lines.append(f"     ⚠️  OVERDUE by {abs(days_remaining)} days!")
         else:
-            print("\n💳 No active loans")
+            lines.append("\n💳 No active loans")
 
         # Display loan offers - separate available and locked
         all_offers = get_available_loan_offers()
@@ -7655,22 +7754,22 @@ def loans_menu(game_state: GameState, player: Player) -> None:
                 locked_offers.append(offer)
 
         # Show available offers
-        print("\n🏦 Available Loan Offers:")
+        lines.append("\n🏦 Available Loan Offers:")
         if available_offers:
             for i, offer in enumerate(available_offers, 1):
                 total_with_interest = offer.amount * (1 + offer.interest_rate)
                 early_payoff_interest = offer.amount * offer.early_interest_rate
-                print(f"\n  {i}. {offer.lender_name}")
-                print(f"     Amount: ${offer.amount:,.2f}")
-                print(f"     Repayment Period: {offer.days_to_repay} days")
-                print(f"     Interest Rate: {offer.interest_rate * 100:.1f}% (Total: ${total_with_interest:,.2f})")
-                print(f"     Early Payoff: {offer.early_interest_rate * 100:.1f}% interest (Total: ${offer.amount + early_payoff_interest:,.2f})")
+                lines.append(f"\n  {i}. {offer.lender_name}")
+                lines.append(f"     Amount: ${offer.amount:,.2f}")
+                lines.append(f"     Repayment Period: {offer.days_to_repay} days")
+                lines.append(f"     Interest Rate: {offer.interest_rate * 100:.1f}% (Total: ${total_with_interest:,.2f})")
+                lines.append(f"     Early Payoff: {offer.early_interest_rate * 100:.1f}% interest (Total: ${offer.amount + early_payoff_interest:,.2f})")
         else:
-            print("  (No loans available at your level)")
+            lines.append("  (No loans available at your level)")
 
         # Show locked offers
         if locked_offers:
-            print("\n🔒 Locked Loan Offers:")
+            lines.append("\n🔒 Locked Loan Offers:")
             for offer in locked_offers:
                 requirements = []
                 if offer.min_level > player.store_level:
@@ -7679,13 +7778,14 @@ def loans_menu(game_state: GameState, player: Player) -> None:
                     requirements.append(f"Reputation {offer.min_reputation:.0f} (you: {player.reputation:.0f})")
                 req_str = ", ".join(requirements)
                 total_with_interest = offer.amount * (1 + offer.interest_rate)
-                print(f"\n  🔒 {offer.lender_name} - ${offer.amount:,.2f} at {offer.interest_rate * 100:.1f}%")
-                print(f"     Requires: {req_str}")
+                lines.append(f"\n  🔒 {offer.lender_name} - ${offer.amount:,.2f} at {offer.interest_rate * 100:.1f}%")
+                lines.append(f"     Requires: {req_str}")
 
-        print("\n  t. Take a new loan")
+        lines.append("\n  t. Take a new loan")
         if player.loans:
-            print("  p. Pay back a loan")
-        print("  0. Back to Main Menu")
+            lines.append("  p. Pay back a loan")
+        lines.append("  0. Back to Main Menu")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         try:
             choice = input("\nSelect option (t, p, 0): ").strip().lower()
@@ -7870,30 +7970,17 @@ def main_menu(game_state: GameState) -> bool:
             print(f"Total Debt: ${total_debt:,.2f}")
 
         # Show CAS comparison with competitors
-        player_cas = calculate_player_cas(
-            player,
-            game_state.market_prices,
-            game_state.items_by_name,
-            game_state.items,
-            game_state.day
-        )
+        player_cas, competitor_cas_scores = calculate_all_store_cas(game_state)
         print(f"\n📊 Your CAS: {player_cas:.2f}")
-        if game_state.competitors:
+        if competitor_cas_scores:
             print("   Competitors:")
-            for competitor in game_state.competitors:
-                comp_cas = calculate_competitor_cas(
-                    competitor,
-                    game_state.market_prices,
-                    game_state.items_by_name,
-                    game_state.items,
-                    game_state.day
-                )
+            for competitor_name, comp_cas in competitor_cas_scores:
                 cas_diff = player_cas - comp_cas
                 if cas_diff >= 0:
                     symbol = "✓"
                 else:
                     symbol = "✗"
-                print(f"   {symbol} {competitor.name}: {comp_cas:.2f} (diff: {cas_diff:+.2f})")
+                print(f"   {symbol} {competitor_name}: {comp_cas:.2f} (diff: {cas_diff:+.2f})")
 
         print("\nOptions:")
         print("  1. Pass Day (Simulate)")
@@ -8130,7 +8217,7 @@ def deserialize_game_state(data: dict) -> GameState:
     items = []
     for item_data in data["items"]:
         # Try to find matching item in PRODUCT_CATALOG for backward compatibility
-        matching_item = next((item for item in PRODUCT_CATALOG if item.name == item_data["name"]), None)
+        matching_item = PRODUCT_CATALOG_BY_NAME.get(item_data["name"])
 
         # Get category from saved data, or look it up in PRODUCT_CATALOG, or use default
         category = item_data.get("category")
@@ -8575,7 +8662,7 @@ def run_game() -> None:
         print(f"\nPlayer: {player.name}")
         print(f"Final cash: ${player.cash:.2f}")
         print(f"Store level: {player.store_level}")
-        print(f"Inventory value: {sum(player.inventory.values())} units")
+        print(f"Inventory value: {player.total_stock} units")
         print(f"Reputation: {player.reputation}")
         print("\n" + "=" * 60)
         print("🎉 THANKS FOR PLAYING! 🎉")
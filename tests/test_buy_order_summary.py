@@ -0,0 +1,69 @@
+"""Test the cached buy order summaries shown in the manual buy order menu."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import Player
+
+
+def test_buy_order_summary_follows_vendor_changes():
+    """Adding, updating, removing and clearing vendors keeps the summary current."""
+    player = Player(name="TestPlayer")
+    assert player.get_buy_order_summary("Bread") == (0, "(none)")
+
+    player.add_vendor_to_buy_order("Bread", 100, "Vendor A")
+    player.add_vendor_to_buy_order("Bread", 50, "Vendor B")
+    assert player.get_buy_order_summary("Bread") == (150, "Vendor A (100), Vendor B (50)")
+
+    player.add_vendor_to_buy_order("Bread", 20, "Vendor B")
+    assert player.get_total_buy_order_quantity("Bread") == 120
+
+    player.remove_vendor_from_buy_order("Bread", "Vendor A")
+    assert player.get_buy_order_summary("Bread") == (20, "Vendor B (20)")
+
+    player.clear_buy_order("Bread")
+    assert player.get_buy_order_summary("Bread") == (0, "(none)")
+
+    player.set_buy_order("Milk", 30, "Vendor C")
+    assert player.get_buy_order_summary("Milk") == (30, "Vendor C (30)")
+    player.set_buy_order("Milk", 0, "Vendor C")
+    assert player.get_buy_order_summary("Milk") == (0, "(none)")
+
+    print("✓ Buy order summary follows vendor changes")
+
+
+def test_buy_order_summaries_restored_from_saved_orders():
+    """Players constructed from saved buy orders rebuild their summaries."""
+    player = Player(name="TestPlayer", buy_orders={"Eggs": [(40, "Vendor A"), (10, "Vendor B")]})
+
+    assert player.get_buy_order_summary("Eggs") == (50, "Vendor A (40), Vendor B (10)")
+    assert player.get_total_buy_order_quantity("Eggs") == 50
+
+    print("✓ Buy order summaries restored from saved orders")
+
+
+def test_replace_vendor_keeps_slot_and_merges_duplicates():
+    """Replacing a vendor keeps its position and merges with an existing entry for the new vendor."""
+    player = Player(name="TestPlayer")
+    player.add_vendor_to_buy_order("Bread", 100, "Vendor A")
+    player.add_vendor_to_buy_order("Bread", 50, "Vendor B")
+    player.add_vendor_to_buy_order("Bread", 25, "Vendor C")
+
+    assert player.replace_vendor_in_buy_order("Bread", "Vendor A", "Vendor D", 80)
+    assert player.get_buy_order("Bread") == [(80, "Vendor D"), (50, "Vendor B"), (25, "Vendor C")]
+    assert player.get_buy_order_summary("Bread") == (155, "Vendor D (80), Vendor B (50), Vendor C (25)")
+
+    assert player.replace_vendor_in_buy_order("Bread", "Vendor B", "Vendor C", 40)
+    assert player.get_buy_order("Bread") == [(80, "Vendor D"), (40, "Vendor C")]
+    assert player.get_total_buy_order_quantity("Bread") == 120
+
+    print("✓ Replacing a vendor keeps its slot and merges duplicates")
+
+
+if __name__ == "__main__":
+    test_buy_order_summary_follows_vendor_changes()
+    test_buy_order_summaries_restored_from_saved_orders()
+    test_replace_vendor_keeps_slot_and_merges_duplicates()
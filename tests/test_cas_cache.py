@@ -0,0 +1,82 @@
+"""Test per-day caching of the CAS breakdown shown on the status screen."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    Player, Vendor, Item, GameState,
+    build_item_market_info, calculate_all_store_cas, calculate_competitor_cas_scores,
+    create_competitors, create_default_items, create_vendors, display_cas_breakdown,
+    initialize_market_prices,
+)
+
+
+def make_game_state():
+    bread = Item("Bread", 2.0, 5.0, "Food & Groceries", 1.0)
+    vendor = Vendor(name="Test Vendor", items={"Bread": 2.0})
+    game_state = GameState(day=3, items=[bread], vendors=[vendor], market_prices={"Bread": 5.0})
+    player = Player(name="TestPlayer", cash=1000.0)
+    game_state.player = player
+    return game_state, player, vendor
+
+
+def test_cas_breakdown_reused_within_day():
+    """Displaying the breakdown twice without changes computes it once."""
+    game_state, player, _ = make_game_state()
+
+    display_cas_breakdown(player, game_state)
+    assert len(game_state.cas_breakdown_cache) == 1
+    cached = next(iter(game_state.cas_breakdown_cache.values()))
+
+    display_cas_breakdown(player, game_state)
+    assert len(game_state.cas_breakdown_cache) == 1
+    assert next(iter(game_state.cas_breakdown_cache.values())) is cached
+
+    print("✓ CAS breakdown reused within a day")
+
+
+def test_cas_breakdown_invalidated_by_player_changes():
+    """Buying stock or repricing produces a fresh breakdown."""
+    game_state, player, vendor = make_game_state()
+
+    display_cas_breakdown(player, game_state)
+    version_before = player.state_version
+
+    assert player.purchase_from_vendor(vendor, "Bread", 10, 5.0, game_state)
+    assert player.state_version > version_before
+    display_cas_breakdown(player, game_state)
+
+    key = (player.name, game_state.day, player.state_version)
+    assert game_state.cas_breakdown_cache[key]["items_counted"] == 0  # No price set yet
+
+    player.set_category_pricing("Food & Groceries", 10.0, game_state.market_prices, game_state.items_by_name)
+    display_cas_breakdown(player, game_state)
+
+    key = (player.name, game_state.day, player.state_version)
+    assert game_state.cas_breakdown_cache[key]["items_counted"] == 1
+
+    print("✓ CAS breakdown recomputed after player changes")
+
+
+def test_competitor_scores_match_full_batch():
+    """Scoring only the competitors from a shared market info map matches the full batch."""
+    items = create_default_items()
+    game_state = GameState(day=5, player=Player(name="TestPlayer"), items=items, vendors=create_vendors(),
+                           market_prices=initialize_market_prices(items))
+    game_state.competitors = create_competitors(items, game_state.market_prices)
+    item_info = build_item_market_info(game_state.market_prices, game_state.items_by_name)
+
+    _, expected = calculate_all_store_cas(game_state, item_info)
+    assert calculate_competitor_cas_scores(game_state, item_info) == expected
+    assert [name for name, _ in expected] == [competitor.name for competitor in game_state.competitors]
+
+    print("✓ Competitor-only CAS scores match the full batch")
+
+
+if __name__ == "__main__":
+    test_cas_breakdown_reused_within_day()
+    test_cas_breakdown_invalidated_by_player_changes()
+    test_competitor_scores_match_full_batch()
@@ -0,0 +1,81 @@
+"""Test fulfillment averaging from running [sum, count] pairs."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    Player,
+    get_fulfillment_multiplier,
+    record_store_visit_metrics,
+    update_player_fulfillment_averages,
+)
+
+
+def test_update_player_fulfillment_averages_from_sums():
+    """Averages are computed from per-visit-type sums and counts."""
+    player = Player(name="TestPlayer")
+    fulfillment_data = {"allocated": [150.0, 2], "overflow": [30.0, 1]}
+
+    update_player_fulfillment_averages(player, fulfillment_data)
+
+    assert player.allocated_average_fulfillment_pct == 75.0
+    assert player.overflow_average_fulfillment_pct == 30.0
+    assert player.average_fulfillment_pct == 60.0
+
+    print("✓ Fulfillment averages computed from running sums")
+
+
+def test_update_player_fulfillment_averages_keeps_previous_without_visits():
+    """Visit types with no visits today keep yesterday's average."""
+    player = Player(name="TestPlayer", overflow_average_fulfillment_pct=42.0)
+
+    update_player_fulfillment_averages(player, {"allocated": [80.0, 1], "overflow": [0.0, 0]})
+
+    assert player.allocated_average_fulfillment_pct == 80.0
+    assert player.overflow_average_fulfillment_pct == 42.0
+    assert player.average_fulfillment_pct == 80.0
+
+    print("✓ Empty visit types keep previous averages")
+
+
+def test_record_store_visit_metrics_accumulates_sums():
+    """Recorded visits add to the running sum and count for their visit type."""
+    fulfillment = {"Store": {"allocated": [0.0, 0], "overflow": [0.0, 0]}}
+    counts = {"Store": {"allocated": 0, "overflow": 0}}
+    reputation = {"Store": 0}
+
+    visits = [
+        {"store_name": "Store", "visit_type": "allocated", "starting_needs": 4, "fulfilled": 2},
+        {"store_name": "Store", "visit_type": "overflow", "starting_needs": 2, "fulfilled": 2},
+    ]
+    record_store_visit_metrics(visits, fulfillment, counts, reputation)
+
+    assert fulfillment["Store"]["allocated"] == [50.0, 1]
+    assert fulfillment["Store"]["overflow"] == [100.0, 1]
+    assert counts["Store"] == {"allocated": 1, "overflow": 1}
+
+    print("✓ Store visits accumulate running sums")
+
+
+def test_fulfillment_multiplier_tiers():
+    """Tier boundaries are inclusive except 70%, which must be exceeded."""
+    assert get_fulfillment_multiplier(0.0) == 0.1
+    assert get_fulfillment_multiplier(10.0) == 0.5
+    assert get_fulfillment_multiplier(20.0) == 0.9
+    assert get_fulfillment_multiplier(50.0) == 1.0
+    assert get_fulfillment_multiplier(70.0) == 1.0
+    assert get_fulfillment_multiplier(70.5) == 1.1
+    assert get_fulfillment_multiplier(90.0) == 1.4
+    assert get_fulfillment_multiplier(100.0) == 2.0
+
+    print("✓ Fulfillment multiplier tiers match their thresholds")
+
+
+if __name__ == "__main__":
+    test_update_player_fulfillment_averages_from_sums()
+    test_update_player_fulfillment_averages_keeps_previous_without_visits()
+    test_record_store_visit_metrics_accumulates_sums()
+    test_fulfillment_multiplier_tiers()
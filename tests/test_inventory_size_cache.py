@@ -0,0 +1,34 @@
+"""Test that the cached inventory size follows inventory changes."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import Player, Vendor, Item, GameState
+
+
+def test_inventory_size_refreshes_after_changes():
+    """Buying and selling change the reported size; repeated calls reuse it."""
+    bread = Item("Bread", 2.0, 5.0, "Food & Groceries", 0.5)
+    vendor = Vendor(name="Test Vendor", items={"Bread": 2.0})
+    game_state = GameState(day=1, items=[bread], vendors=[vendor], market_prices={"Bread": 5.0})
+    player = Player(name="TestPlayer", cash=1000.0, inventory={"Bread": 4})
+    game_state.player = player
+    items_by_name = game_state.items_by_name
+
+    assert player.get_inventory_size_used(items_by_name) == 2.0
+    assert player.inventory_size_cache == (player.state_version, 2.0)
+
+    assert player.purchase_from_vendor(vendor, "Bread", 10, 5.0, game_state)
+    assert player.get_inventory_size_used(items_by_name) == 7.0
+
+    player.sell_to_customer("Bread", 6, 5.0, 1, "Food & Groceries", 1.0)
+    assert player.get_inventory_size_used(items_by_name) == 4.0
+
+    print("✓ Inventory size refreshes after changes")
+
+
+if __name__ == "__main__":
+    test_inventory_size_refreshes_after_changes()
@@ -0,0 +1,46 @@
+"""Test the cached category index on GameState."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    GameState, Player,
+    create_default_items, create_vendors, initialize_market_prices, unlock_new_product,
+)
+
+
+def make_game_state():
+    items = create_default_items()
+    return GameState(day=1, player=Player(name="TestPlayer"), items=items, vendors=create_vendors(),
+                     market_prices=initialize_market_prices(items))
+
+
+def test_items_by_category_groups_items_in_order():
+    """Every item appears under its category, in the order of game_state.items."""
+    game_state = make_game_state()
+
+    for category, items in game_state.items_by_category.items():
+        assert items == [item for item in game_state.items if item.category == category]
+    assert sum(len(items) for items in game_state.items_by_category.values()) == len(game_state.items)
+
+    print("✓ Items grouped by category in order")
+
+
+def test_items_by_category_includes_unlocked_products():
+    """Unlocking a product adds it to its category's list."""
+    game_state = make_game_state()
+    game_state.items_by_category  # Build the cache before unlocking
+
+    new_item = unlock_new_product(game_state)
+    assert new_item is not None
+    assert game_state.items_by_category[new_item.category][-1] is new_item
+
+    print("✓ Unlocked products appear in the category index")
+
+
+if __name__ == "__main__":
+    test_items_by_category_groups_items_in_order()
+    test_items_by_category_includes_unlocked_products()
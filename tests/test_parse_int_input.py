@@ -0,0 +1,53 @@
+"""Test that parse_int_input accepts exactly the whole numbers int() accepts."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import parse_int_input
+
+
+def _int_or_none(text):
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def test_parse_int_input_accepted_forms():
+    """Signs, padding, leading zeros, underscores and non-ASCII digits parse like int()."""
+    assert parse_int_input("42") == 42
+    assert parse_int_input("  7 \n") == 7
+    assert parse_int_input("+5") == 5
+    assert parse_int_input("-3") == -3
+    assert parse_int_input("007") == 7
+    assert parse_int_input("1_000") == 1000
+    assert parse_int_input("-1_0_0") == -100
+    assert parse_int_input("١٢") == 12
+
+    print("✓ parse_int_input accepts int()'s whole number forms")
+
+
+def test_parse_int_input_rejected_forms():
+    """Anything int() rejects comes back as None instead of raising."""
+    for text in ["", "  ", "x", "1.5", "2 100", "+", "-", "+-1", "_1", "1_", "1__0", "+_1", "²", "1e3", "0x10"]:
+        assert parse_int_input(text) is None, text
+
+    print("✓ parse_int_input rejects non-integers")
+
+
+def test_parse_int_input_matches_int():
+    """parse_int_input agrees with int() across a mix of valid and invalid entries."""
+    samples = ["0", "-0", " 12 ", "1_2", "1__2", "_", "+ 1", "3-", "٣", "½", "9" * 30, "1 2", "\t-8\t"]
+    for text in samples:
+        assert parse_int_input(text) == _int_or_none(text), text
+
+    print("✓ parse_int_input matches int()")
+
+
+if __name__ == "__main__":
+    test_parse_int_input_accepted_forms()
+    test_parse_int_input_rejected_forms()
+    test_parse_int_input_matches_int()
@@ -0,0 +1,44 @@
+"""Test production line ownership lookups."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import Player, Upgrade
+
+
+def make_production_line(item_name):
+    return Upgrade(f"Production Line: {item_name}", 100, "production_line", 0, item_name)
+
+
+def test_purchased_production_line_sets_price():
+    """Buying a production line makes the item available at half market price."""
+    player = Player(name="TestPlayer", cash=1000.0)
+    assert player.get_production_line_price("Bread", 4.0) is None
+
+    assert player.purchase_upgrade(make_production_line("Bread"), 1)
+    assert player.has_production_line("Bread")
+    assert player.get_production_line_price("Bread", 4.0) == 2.0
+    assert not player.has_production_line("Milk")
+
+    # A second line for the same item is rejected
+    assert not player.purchase_upgrade(make_production_line("Bread"), 1)
+
+    print("✓ Purchased production line sets price")
+
+
+def test_production_lines_restored_from_saved_upgrades():
+    """Players constructed from saved upgrades know which production lines they own."""
+    player = Player(name="TestPlayer", purchased_upgrades=[make_production_line("Milk")])
+
+    assert player.has_production_line("Milk")
+    assert not player.has_production_line("Bread")
+
+    print("✓ Production lines restored from saved upgrades")
+
+
+if __name__ == "__main__":
+    test_purchased_production_line_sets_price()
+    test_production_lines_restored_from_saved_upgrades()
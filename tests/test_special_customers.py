@@ -0,0 +1,49 @@
+"""Test special customer type selection in the single-player simulation."""
+
+import random
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    SPECIAL_CUSTOMER_TYPE_WEIGHTS,
+    get_weighted_special_customer_type,
+)
+
+
+def test_weighted_special_customer_type_returns_known_type():
+    """Without exclusions, every draw is one of the weighted types."""
+    random.seed(0)
+    for _ in range(200):
+        assert get_weighted_special_customer_type() in SPECIAL_CUSTOMER_TYPE_WEIGHTS
+
+    print("✓ Special customer draws return known types")
+
+
+def test_weighted_special_customer_type_respects_exclude():
+    """Excluded types are never drawn."""
+    random.seed(1)
+    exclude = {"hoarder", "party_prep_mom", "lottery_winner", "youtuber"}
+    for _ in range(200):
+        assert get_weighted_special_customer_type(exclude) not in exclude
+
+    # Only one type left: it is always drawn
+    only_gamer = set(SPECIAL_CUSTOMER_TYPE_WEIGHTS) - {"gamer"}
+    assert get_weighted_special_customer_type(only_gamer) == "gamer"
+
+    print("✓ Excluded special customer types are never drawn")
+
+
+def test_weighted_special_customer_type_all_excluded():
+    """Excluding every type yields None instead of retrying."""
+    assert get_weighted_special_customer_type(set(SPECIAL_CUSTOMER_TYPE_WEIGHTS)) is None
+
+    print("✓ No special customer type when all are excluded")
+
+
+if __name__ == "__main__":
+    test_weighted_special_customer_type_returns_known_type()
+    test_weighted_special_customer_type_respects_exclude()
+    test_weighted_special_customer_type_all_excluded()
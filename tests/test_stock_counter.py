@@ -0,0 +1,64 @@
+"""Test that Player.total_stock stays in sync with the inventory dict."""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    Player, Vendor, Item, GameState,
+)
+
+
+def test_total_stock_initialized_from_inventory():
+    """Constructing a player with inventory derives the running total."""
+    player = Player(name="TestPlayer", cash=100.0, inventory={"Bread": 5, "Milk": 7})
+    assert player.total_stock == 12
+
+    print("✓ total_stock derived from starting inventory")
+
+
+def test_total_stock_tracks_purchases_and_sales():
+    """Buying, producing and selling keep total_stock equal to the inventory sum."""
+    bread = Item("Bread", 2.0, 5.0, "Food & Groceries", 1.0)
+    vendor = Vendor(name="Test Vendor", items={"Bread": 2.0})
+    game_state = GameState(day=1, items=[bread], vendors=[vendor], market_prices={"Bread": 5.0})
+
+    player = Player(name="TestPlayer", cash=1000.0)
+    game_state.player = player
+
+    assert player.purchase_from_vendor(vendor, "Bread", 10, 5.0, game_state)
+    assert player.total_stock == 10
+
+    player.produce_item(bread, 4)
+    assert player.total_stock == 14
+
+    revenue, profit, units_sold = player.sell_to_customer("Bread", 6, 5.0, 1, "Food & Groceries", 1.0)
+    assert units_sold == 6
+    assert player.total_stock == 8
+    assert player.total_stock == sum(player.inventory.values())
+
+    print("✓ total_stock follows purchases, production and sales")
+
+
+def test_total_stock_tracks_delayed_delivery():
+    """Lead-time deliveries only count toward total_stock once they arrive."""
+    bread = Item("Bread", 2.0, 5.0, "Food & Groceries", 1.0)
+    vendor = Vendor(name="Slow Vendor", items={"Bread": 2.0}, lead_time=2)
+    game_state = GameState(day=1, items=[bread], vendors=[vendor], market_prices={"Bread": 5.0})
+
+    player = Player(name="TestPlayer", cash=1000.0)
+    game_state.player = player
+
+    assert player.purchase_from_vendor(vendor, "Bread", 10, 5.0, game_state)
+    assert player.total_stock == 0
+    assert len(player.pending_deliveries) == 1
+
+    print("✓ total_stock ignores pending deliveries")
+
+
+if __name__ == "__main__":
+    test_total_stock_initialized_from_inventory()
+    test_total_stock_tracks_purchases_and_sales()
+    test_total_stock_tracks_delayed_delivery()
@@ -0,0 +1,115 @@
+"""Test expiration of temporary upgrades via the player's expiration heap."""
+
+import contextlib
+import io
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from economy_sim_solo import (
+    Player, Upgrade, GameState,
+    create_default_items, create_vendors, initialize_market_prices, run_day,
+)
+
+
+def make_game_state(player):
+    items = create_default_items()[:5]
+    vendors = create_vendors()
+    return GameState(day=1, player=player, items=items, vendors=vendors, market_prices=initialize_market_prices(items))
+
+
+def make_partnership(duration_days):
+    return Upgrade("Partnership with Test Vendor", 100, "vendor_discount", 5, "Test Vendor", duration_days=duration_days)
+
+
+def test_temporary_upgrade_expires_on_schedule():
+    """A temporary upgrade is removed on its expiration day, not before."""
+    player = Player(name="TestPlayer", cash=100000.0)
+    game_state = make_game_state(player)
+    partnership = make_partnership(2)
+
+    assert player.purchase_upgrade(partnership, game_state.day)
+    assert player.expiration_heap == [(3, partnership.name)]
+    assert player.get_upgrade_effect_total("vendor_discount") == 5
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_day(game_state)  # Advances to day 2
+        assert partnership in player.purchased_upgrades
+        run_day(game_state)  # Advances to day 3: expires
+
+    assert game_state.day == 3
+    assert partnership not in player.purchased_upgrades
+    assert partnership.name not in player.vendor_partnership_expiration
+    assert player.expiration_heap == []
+    assert player.get_upgrade_effect_total("vendor_discount") == 0
+
+    print("✓ Temporary upgrade expires on schedule")
+
+
+def test_renewed_upgrade_skips_stale_heap_entry():
+    """Renewing a partnership leaves the old heap entry, which must not expire it early."""
+    player = Player(name="TestPlayer", cash=100000.0)
+    game_state = make_game_state(player)
+    partnership = make_partnership(2)
+
+    assert player.purchase_upgrade(partnership, 1)
+    assert player.purchase_upgrade(partnership, 2)  # Renewed: now expires on day 4
+    assert player.vendor_partnership_expiration[partnership.name] == 4
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_day(game_state)  # Advances to day 2
+        run_day(game_state)  # Advances to day 3: original expiration, now stale
+
+    assert partnership in player.purchased_upgrades
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_day(game_state)  # Advances to day 4
+
+    assert partnership not in player.purchased_upgrades
+
+    print("✓ Stale heap entries are skipped")
+
+
+def test_expiration_heap_rebuilt_from_saved_state():
+    """Players constructed from saved data rebuild their expiration heap."""
+    partnership = make_partnership(30)
+    permanent = Upgrade("Business Course", 100, "xp_gain", 10)
+    player = Player(
+        name="TestPlayer",
+        purchased_upgrades=[permanent, partnership],
+        vendor_partnership_expiration={partnership.name: 12},
+    )
+
+    assert player.expiration_heap == [(12, partnership.name)]
+    assert player.get_upgrade_effect_total("xp_gain") == 10
+    assert player.get_upgrade_effect_total("wage_reduction") == 0
+
+    print("✓ Expiration heap rebuilt from saved state")
+
+
+def test_vendor_discounts_match_single_vendor_lookup():
+    """The all-vendor discount map agrees with get_vendor_discount, skipping expired partnerships."""
+    active = Upgrade("Partnership with Vendor A", 100, "vendor_discount", 5, "Vendor A", duration_days=30)
+    expired = Upgrade("Partnership with Vendor B", 100, "vendor_discount", 10, "Vendor B", duration_days=30)
+    permanent = Upgrade("Vendor A Contract", 100, "vendor_discount", 3, "Vendor A")
+    player = Player(
+        name="TestPlayer",
+        purchased_upgrades=[active, expired, permanent],
+        vendor_partnership_expiration={active.name: 40, expired.name: 20},
+    )
+
+    discounts = player.get_vendor_discounts(25)
+    assert discounts == {"Vendor A": player.get_vendor_discount("Vendor A", 25)}
+    assert discounts["Vendor A"] == 0.08
+    assert player.get_vendor_discount("Vendor B", 25) == 0.0
+
+    print("✓ Vendor discount map matches single-vendor lookups")
+
+
+if __name__ == "__main__":
+    test_temporary_upgrade_expires_on_schedule()
+    test_renewed_upgrade_skips_stale_heap_entry()
+    test_expiration_heap_rebuilt_from_saved_state()
+    test_vendor_discounts_match_single_vendor_lookup()